@@ -10,5 +10,17 @@ sys.path.append(parent_dir)
 sys.path.append(parent2_dir)
 
 from vector import Vector
-from segment import Segment
-from plotter import VectorPlotter, SegmentPlotter
\ No newline at end of file
+from segment import Segment, IntersectionKind
+from plotter import VectorPlotter, SegmentPlotter
+from point import Point, use_scalar_points, scalar_points_enabled, make_point
+from point_set import PointSet
+from predicates import orient2d, orient2d_batch, incircle
+from intersection_kernel import line_intersection, line_intersection_batch
+from segment_array import SegmentArray
+from uniform_grid import UniformGrid
+from run_stats import RunStats
+
+#the algorithms read the flag of the tracing module, so there must be only one
+#of it, whether it's imported as tracing or as base.tracing
+import tracing
+sys.modules.setdefault("base.tracing", tracing)
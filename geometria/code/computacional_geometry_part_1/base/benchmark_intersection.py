@@ -0,0 +1,58 @@
+import timeit
+import numpy as np
+from vector import Vector
+from segment import Segment
+
+# Per call time of Segment.find_intersection before (numpy solve over
+# temporary Vectors) and after (closed form kernel on plain floats), and of
+# the batch kernel the sweep engines use to update their status tree.
+
+def legacy_find_intersection(self: Segment, other_segment: Segment) -> Vector:
+    """
+        Segment.find_intersection as it was before the closed form kernel.
+    """
+    difference1 = (self.start - self.end).vector
+    difference2 = (other_segment.start - other_segment.end).vector
+    result = (other_segment.start - self.end).vector
+
+    matrix = np.column_stack([difference1, difference2])
+
+    try:
+        alpha_beta = np.linalg.solve(matrix, result).reshape(2,)
+
+    except np.linalg.LinAlgError as e:
+        if 'Singular matrix' in str(e):
+            return self.find_intersection_on_endpoints(other_segment)
+        else:
+            raise e
+
+    return self.start.times_scalar(alpha_beta[0]) + self.end.times_scalar(float(1 - alpha_beta[0]))
+
+
+np.random.seed(69)
+npairs = 20000
+coordinates = np.random.uniform(-100, 100, (npairs, 8))
+pairs = [(Segment(*Vector.cast_to_vector(row[0:2], row[2:4])), Segment(*Vector.cast_to_vector(row[4:6], row[6:8])))
+         for row in coordinates]
+
+#both versions give the same points
+for segment1, segment2 in pairs[:1000]:
+    assert np.allclose(legacy_find_intersection(segment1, segment2).vector, segment1.find_intersection(segment2).vector)
+
+def bench_legacy():
+    for segment1, segment2 in pairs:
+        legacy_find_intersection(segment1, segment2)
+
+def bench_kernel():
+    for segment1, segment2 in pairs:
+        segment1.find_intersection(segment2)
+
+def bench_batch():
+    Segment.batch_intersection(coordinates[:, 0:2], coordinates[:, 2:4], coordinates[:, 4:6], coordinates[:, 6:8])
+
+benchmarks = [("legacy (solve)", bench_legacy), ("scalar kernel", bench_kernel), ("batch kernel", bench_batch)]
+
+print(f"{'implementation':<16} {'per call (us)':>14}")
+for name, function in benchmarks:
+    seconds = min(timeit.repeat(function, number=1, repeat=3))
+    print(f"{name:<16} {1e6*seconds/npairs:>14.3f}")
@@ -0,0 +1,41 @@
+import timeit
+import operator
+import numpy as np
+from vector import Vector
+from point import Point
+
+# Microbenchmark of the order relations, hashing and sorting of Vector
+# (numpy backed) against Point (two plain floats with __slots__).
+
+np.random.seed(69)
+npoints = 20000
+coordinates = np.random.randint(-1000, 1000, (npoints, 2)).astype(np.float64)
+
+#every point is repeated once, like the duplicated intersections the sweep line finds
+coordinates = np.vstack([coordinates, coordinates[::-1]])
+
+vectors = [Vector(row.reshape((2, 1))) for row in coordinates]
+points = [Point(x, y) for x, y in coordinates.tolist()]
+
+def bench_sort(items):
+    #same sort the sweeps use for their event points
+    endpoints = [(item, None, "vertex") for item in items]
+    endpoints.sort(key=lambda w: w[0])
+
+def bench_hash(items):
+    #dropping duplicates hashes every point, and compares the repeated ones
+    set(items)
+
+def bench_compare(items):
+    others = items[1:]
+    list(map(operator.lt, items, others))
+    list(map(operator.eq, items, others))
+    list(map(operator.gt, items, others))
+
+benchmarks = [("sort", bench_sort), ("hash", bench_hash), ("compare", bench_compare)]
+
+print(f"{'benchmark':<10} {'Vector (s)':>12} {'Point (s)':>12} {'speedup':>9}")
+for name, function in benchmarks:
+    vector_time = min(timeit.repeat(lambda: function(vectors), number=1, repeat=5))
+    point_time = min(timeit.repeat(lambda: function(points), number=1, repeat=5))
+    print(f"{name:<10} {vector_time:>12.4f} {point_time:>12.4f} {vector_time/point_time:>8.1f}x")
@@ -0,0 +1,55 @@
+import timeit
+import numpy as np
+from predicates import orient2d, orient2d_filtered, orient2d_exact, orient2d_batch
+
+# Shows how often the float filter of orient2d is enough (so the exact
+# fractions are not needed), and what the predicate costs compared with
+# the numpy determinant that Segment.direction used before.
+
+np.random.seed(69)
+ncalls = 100000
+
+datasets = {
+    #random points, the usual input of the sweep line and the hulls
+    "random floats": np.random.uniform(-1000, 1000, (ncalls, 6)),
+    "random integers": np.random.randint(-1000, 1000, (ncalls, 6)).astype(np.float64),
+}
+
+#almost collinear points: c is on the line ab plus a tiny bit of noise
+a = np.random.uniform(-1, 1, (ncalls, 2))
+b = np.random.uniform(-1, 1, (ncalls, 2))
+t = np.random.uniform(-2, 2, (ncalls, 1))
+c = a + t*(b - a) + np.random.uniform(-1e-15, 1e-15, (ncalls, 2))
+datasets["almost collinear"] = np.hstack([a, b, c])
+
+print(f"{'dataset':<18} {'fast path':>10} {'exact path':>11}")
+for name, rows in datasets.items():
+    rows = rows.tolist()
+    undecided = sum(orient2d_filtered(*row) is None for row in rows)
+    print(f"{name:<18} {100*(1 - undecided/ncalls):>9.2f}% {undecided:>11}")
+
+#timing on the random floats
+rows = datasets["random floats"]
+sample = rows[:20000].tolist()
+
+def bench_numpy_det():
+    for ax, ay, bx, by, cx, cy in sample:
+        np.sign(np.linalg.det(np.array([[cx - ax, bx - ax], [cy - ay, by - ay]])))
+
+def bench_orient2d():
+    for row in sample:
+        orient2d(*row)
+
+def bench_exact():
+    for row in sample:
+        orient2d_exact(*row)
+
+def bench_batch():
+    orient2d_batch(rows[:20000, 0:2], rows[:20000, 2:4], rows[:20000, 4:6])
+
+benchmarks = [("numpy det", bench_numpy_det), ("orient2d", bench_orient2d),
+              ("exact only", bench_exact), ("orient2d_batch", bench_batch)]
+
+print(f"\n{'20000 calls':<18} {'time (s)':>10}")
+for name, function in benchmarks:
+    print(f"{name:<18} {min(timeit.repeat(function, number=1, repeat=3)):>10.4f}")
@@ -0,0 +1,41 @@
+import time
+import timeit
+import numpy as np
+from segment_array import SegmentArray
+
+# Time of SegmentArray.pairwise_intersections for medium inputs, against
+# the pure python all pairs loop over Segment.intersect (only for the
+# smallest input, the loop is quadratic and slow).
+
+np.random.seed(69)
+
+def build_short_segments(nsegments: int, length: float = 0.02) -> SegmentArray:
+    #segments with random starts in the unit square and a short random direction
+    starts = np.random.uniform(0, 1, (nsegments, 2))
+    ends = starts + np.random.uniform(-length, length, (nsegments, 2))
+    return SegmentArray(np.hstack([starts, ends]), copy=False)
+
+def python_all_pairs(segments):
+    intersections = 0
+    for i in range(len(segments)):
+        for j in range(i+1, len(segments)):
+            kind, _ = segments[i].intersect(segments[j])
+            intersections += (kind != 0)
+    return intersections
+
+small = build_short_segments(1000)
+small_segments = small.to_segments()
+python_time = min(timeit.repeat(lambda: python_all_pairs(small_segments), number=1, repeat=1))
+numpy_time = min(timeit.repeat(lambda: small.pairwise_intersections(), number=1, repeat=3))
+print(f"1000 segments: python loop {python_time:.3f}s, blockwise numpy {numpy_time:.3f}s ({python_time/numpy_time:.0f}x)\n")
+
+print(f"{'segments':>9} {'block':>6} {'memory cap':>11} {'pairs':>8} {'time (s)':>9}")
+for nsegments in (5000, 20000, 50000):
+    segments = build_short_segments(nsegments)
+
+    for block_size, max_memory in ((1024, None), (4096, 256 * 2**20)):
+        start = time.perf_counter()
+        pairs, _, _ = segments.pairwise_intersections(block_size=block_size, max_memory=max_memory)
+        seconds = time.perf_counter() - start
+        cap = "-" if max_memory is None else f"{max_memory // 2**20}MB"
+        print(f"{nsegments:>9} {block_size:>6} {cap:>11} {len(pairs):>8} {seconds:>9.3f}")
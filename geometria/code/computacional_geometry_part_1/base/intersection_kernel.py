@@ -0,0 +1,60 @@
+import numpy as np
+from typing import Tuple, Union
+
+# Closed form intersection of two lines, with Cramer's rule on plain floats.
+#
+# The first line goes through s and e, the second one through o and f, and
+# we solve the same 2x2 system that Segment.find_intersection solved with numpy:
+#
+#       alpha*(s - e) + beta*(o - f) = o - e
+#
+# so the intersection is e + alpha*(s - e) = o + beta*(f - o), which means
+# alpha is 1 at s and 0 at e, and beta is 0 at o and 1 at f.
+
+def line_intersection(sx: float, sy: float, ex: float, ey: float,
+                      ox: float, oy: float, fx: float, fy: float) -> Union[Tuple[float, float], None]:
+    """
+        Intersection point of the line through s and e with the line through o and f.
+
+        Returns:
+        -----------
+            (x, y), or None if the lines are parallel.
+    """
+    d1x, d1y = sx - ex, sy - ey
+    d2x, d2y = ox - fx, oy - fy
+
+    det = d1x * d2y - d1y * d2x
+    if det == 0:
+        return None
+
+    alpha = ((ox - ex) * d2y - (oy - ey) * d2x) / det
+    return sx * alpha + ex * (1 - alpha), sy * alpha + ey * (1 - alpha)
+
+def line_intersection_batch(starts1: np.ndarray, ends1: np.ndarray,
+                            starts2: np.ndarray, ends2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+        Vectorized line_intersection over N pairs of lines, given as arrays with shape (N, 2).
+        Any of the arrays can have a single row, which is used for all the pairs
+        (like the sweepline against every segment in the status tree).
+
+        Returns:
+        -----------
+            points: (N, 2) array with the intersections, the rows of parallel pairs are nan.
+            parallel: boolean array, True where the lines are parallel.
+    """
+    s, e, o, f = np.broadcast_arrays(np.asarray(starts1, dtype=np.float64), np.asarray(ends1, dtype=np.float64),
+                                     np.asarray(starts2, dtype=np.float64), np.asarray(ends2, dtype=np.float64))
+
+    d1 = s - e
+    d2 = o - f
+    r = o - e
+
+    det = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+    parallel = det == 0
+
+    #the parallel rows divide by nan instead of zero, so there are no warnings
+    det = np.where(parallel, np.nan, det)
+    alpha = ((r[:, 0] * d2[:, 1] - r[:, 1] * d2[:, 0]) / det)[:, None]
+
+    points = s * alpha + e * (1 - alpha)
+    return points, parallel
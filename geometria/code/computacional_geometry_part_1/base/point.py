@@ -0,0 +1,219 @@
+import math
+import numpy as np
+from typing import List, Tuple
+
+from vector import Vector
+from predicates import orient2d
+
+#this module holds the switch that tells the library which point class to build,
+#it has to be imported as 'point' (flat, like base/__init__.py does), so there is
+#only one copy of the switch.
+_use_scalar_points = False
+
+def use_scalar_points(flag: bool = True) -> None:
+    """
+        Makes the library build Point objects (two plain floats) instead of
+        Vector objects (a (2, 1) numpy array) every time it creates a new point.
+    """
+    global _use_scalar_points
+    _use_scalar_points = bool(flag)
+
+def scalar_points_enabled() -> bool:
+    return _use_scalar_points
+
+def make_point(x: float, y: float) -> 'Point':
+    """
+        Builds a point with the class selected by use_scalar_points.
+    """
+    if _use_scalar_points:
+        return Point(x, y)
+    return Vector(np.array([[x], [y]], dtype=np.float64))
+
+
+class Point:
+    """
+        2D point stored as two plain floats, with the same interface as Vector.
+        It avoids the numpy scalar boxing that Vector pays on every index,
+        which makes sorting, hashing and comparing points much cheaper.
+    """
+
+    __slots__ = ("x", "y", "_hash")
+
+    TURN_LEFT = 1
+    TURN_RIGHT = -1
+    TURN_NONE = 0
+
+    CLOCKWISE_TURN = TURN_RIGHT
+    ANTICLOCKWISE_TURN = TURN_LEFT
+
+    def __init__(self, x: float, y: float):
+        self.x = float(x)
+        self.y = float(y)
+
+    @staticmethod
+    def from_array(vector: np.ndarray) -> 'Point':
+        """
+            Builds a point from an array with two elements (row, column or flat).
+        """
+        vector = np.asarray(vector).reshape(-1)
+        return Point(vector[0], vector[1])
+
+    #================================================
+    #         Vector compatible attributes
+    #================================================
+
+    @property
+    def vector(self) -> np.ndarray:
+        return np.array([[self.x], [self.y]])
+
+    @property
+    def T(self) -> np.ndarray:
+        return np.array([[self.x, self.y]])
+
+    @property
+    def ndimensions(self) -> int:
+        return 2
+
+    #================================================
+    #            Some important operations
+    #================================================
+
+    def calculate_slope(self, vector2: 'Point') -> float:
+        """
+            Calculates the slope between self and vector2.
+        """
+        if self.x == vector2[0]:
+            return np.inf
+        return (self.y - vector2[1]) / (self.x - vector2[0])
+
+    def calculate_distance(self, vector2: 'Point') -> float:
+        """
+            Calculates the distance between self and vector2.
+        """
+        return math.hypot(self.x - vector2[0], self.y - vector2[1])
+
+    def get_furthest_point(self, points: List['Point']) -> 'Point':
+        """
+            Finds the furthest point from self (the first one if there are ties).
+        """
+        distances = [self.calculate_distance(point) for point in points]
+        return points[distances.index(max(distances))]
+
+    @staticmethod
+    def calculate_angle(A: 'Point', B: 'Point', C: 'Point') -> Tuple[float, float]:
+        """
+            Calculates the angle between the vectors AB and BC, see Vector.calculate_angle.
+        """
+        return Vector.calculate_angle(A, B, C)
+
+    @staticmethod
+    def calculate_turn(vector1: 'Point', vector2: 'Point', vector3: 'Point') -> int:
+        """
+            Calculates if the walk from vector1 to vector2 to vector3 is a left turn (1),
+            a right turn (-1) or if the points are collinear (0).
+        """
+        return orient2d(vector1[0], vector1[1], vector2[0], vector2[1], vector3[0], vector3[1])
+
+    #================================================
+    #               Static methods
+    #================================================
+
+    @staticmethod
+    def get_leftmost_point(points: List['Point']) -> 'Point':
+        return Vector.get_leftmost_point(points)
+
+    @staticmethod
+    def get_rightmost_point(points: List['Point']) -> 'Point':
+        return Vector.get_rightmost_point(points)
+
+    @staticmethod
+    def build_random_vectors(nvectors: int, minval = -10, maxval = 10) -> List['Point']:
+        coordinates = np.random.randint(minval, maxval, (nvectors, 2))
+        return [Point(x, y) for x, y in coordinates.tolist()]
+
+    @staticmethod
+    def cast_to_vector(*vectors: np.ndarray) -> List['Point']:
+        """
+            Casts a list of numpy arrays to a list of points.
+        """
+        return [Point.from_array(vector) for vector in vectors]
+
+    #================================================
+    #               Operator overloading
+    #================================================
+
+    def times_scalar(self, scalar: float) -> 'Point':
+        return Point(self.x * scalar, self.y * scalar)
+
+    def __add__(self, vector2: 'Point') -> 'Point':
+        return Point(self.x + vector2[0], self.y + vector2[1])
+
+    def __sub__(self, vector2: 'Point') -> 'Point':
+        return Point(self.x - vector2[0], self.y - vector2[1])
+
+    def __mul__(self, other: 'Point') -> 'Point':
+        if isinstance(other, (int, float, np.number)):
+            return NotImplemented
+        return Point(self.x * other[0], self.y * other[1])
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, number: float) -> 'Point':
+        return Point(self.x / number, self.y / number)
+
+    def __getitem__(self, index: int) -> float:
+        if index == 0 or index == -2:
+            return self.x
+        elif index == 1 or index == -1:
+            return self.y
+        raise IndexError(f"Point index out of range: {index}")
+
+    def __repr__(self):
+        return f"Vec({self.x}, {self.y})"
+
+    def __str__(self):
+        return f"Vec({self.x}, {self.y})"
+
+    #================================================
+    #              Order relations overloading
+    #================================================
+    # same order as Vector: the highest point first, and from left to right
+    # if they are at the same height. When the other point is also a Point
+    # the attributes are read directly, otherwise (a Vector) we go through __getitem__.
+
+    def __eq__(self, vector: 'Point') -> bool:
+        try:
+            return self.x == vector.x and self.y == vector.y
+        except AttributeError:
+            return (self.x == vector[0]) and (self.y == vector[1])
+
+    def __ne__(self, vector: 'Point') -> bool:
+        return not self.__eq__(vector)
+
+    def __lt__(self, vector2: 'Point') -> bool:
+        try:
+            return (self.y > vector2.y) or (self.y == vector2.y and self.x < vector2.x)
+        except AttributeError:
+            return (self.y > vector2[1]) or (self.y == vector2[1] and self.x < vector2[0])
+
+    def __gt__(self, vector2: 'Point') -> bool:
+        try:
+            return (self.y < vector2.y) or (self.y == vector2.y and self.x > vector2.x)
+        except AttributeError:
+            return (self.y < vector2[1]) or (self.y == vector2[1] and self.x > vector2[0])
+
+    def __ge__(self, vector2: 'Point') -> bool:
+        return not self.__lt__(vector2)
+
+    def __le__(self, vector2: 'Point') -> bool:
+        return not self.__gt__(vector2)
+
+    def __hash__(self):
+        #same hash as a Vector with the same coordinates, computed only once
+        #(the coordinates of a point are not expected to change)
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.x, self.y))
+            return self._hash
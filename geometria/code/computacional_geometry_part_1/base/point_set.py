@@ -0,0 +1,178 @@
+#standard dependencies
+import numpy as np
+import pandas as pd
+from typing import Union, List, Iterator, Sequence
+
+#custom dependencies
+from vector import Vector
+from point import Point, scalar_points_enabled
+
+class PointSet():
+
+    def __init__(self, points: np.ndarray, copy: bool = True) -> None:
+        """
+            This class is used to represent a set of points in 2D space,
+            all of them stored in a single contiguous (N, 2) float64 array,
+            instead of one Vector (with its own (2, 1) array) per point.
+
+            Each row of the array is a point, the first column is the x coordinate
+            and the second column is the y coordinate.
+
+            Args:
+            -----------
+                points: array like with N*2 elements, it's reshaped to (N, 2).
+                copy: if False and the input is already a float64 array,
+                      the PointSet shares its memory instead of copying it.
+        """
+
+        #we only copy once, and only if it's needed, otherwise
+        #the PointSet is a view over the given array
+        if copy:
+            points = np.array(points, dtype=np.float64, order="C")
+        else:
+            points = np.asarray(points, dtype=np.float64)
+
+        if (points.size % 2) != 0:
+            raise TypeError(f"Should have an even number of coordinates, yet has shape: {points.shape}")
+
+        self.points = points.reshape((-1, 2))
+
+    #================================================
+    #               Constructors
+    #================================================
+
+    @staticmethod
+    def from_array(array: np.ndarray, copy: bool = True) -> 'PointSet':
+        """
+            Builds a PointSet from an array of shape (N, 2) (or anything with N*2 elements).
+        """
+        return PointSet(array, copy=copy)
+
+    @staticmethod
+    def from_vectors(vectors: List[Vector]) -> 'PointSet':
+        """
+            Builds a PointSet from a list of Vectors.
+        """
+        array = np.empty((len(vectors), 2), dtype=np.float64)
+
+        for i, vector in enumerate(vectors):
+            array[i, 0] = vector[0]
+            array[i, 1] = vector[1]
+
+        return PointSet(array, copy=False)
+
+    @staticmethod
+    def from_csv(file: str, columns: Sequence[str] = ("x", "y")) -> 'PointSet':
+        """
+            Builds a PointSet from a csv file.
+
+            Args:
+            -----------
+                file: path to the csv file.
+                columns: names of the columns with the coordinates. If 4 columns are given
+                         (like x0, y0, x1, y1) each row becomes two consecutive points, which is
+                         the layout used by PointSet.to_segments.
+        """
+        df = pd.read_csv(file, usecols=list(columns))
+
+        #to_numpy makes the only copy, the reshape to (-1, 2) is just a view
+        array = df[list(columns)].to_numpy(dtype=np.float64)
+        return PointSet(array, copy=False)
+
+    @staticmethod
+    def build_random_points(npoints: int, minval = -10, maxval = 10) -> 'PointSet':
+        """
+            Builds npoints random points, with integer coordinates in [minval, maxval).
+        """
+        return PointSet(np.random.randint(minval, maxval, (npoints, 2)), copy=False)
+
+    @staticmethod
+    def as_array(points: Union['PointSet', np.ndarray, List[Vector]]) -> np.ndarray:
+        """
+            Returns the (N, 2) float64 array behind a PointSet, an array, or a list of Vectors.
+            Used by the algorithms that accept any of those inputs.
+        """
+        #duck typing, because this module may be imported as 'point_set' or 'base.point_set'
+        if isinstance(getattr(points, "points", None), np.ndarray):
+            return points.points
+
+        if isinstance(points, np.ndarray):
+            return np.asarray(points, dtype=np.float64).reshape((-1, 2))
+
+        return PointSet.from_vectors(points).points
+
+    #================================================
+    #               Conversions
+    #================================================
+
+    def vector(self, index: int) -> Vector:
+        """
+            Returns the index-th point as a Vector, which is a view over the
+            PointSet memory (no copy is made). If the scalar points are enabled
+            (see point.use_scalar_points) a Point with the coordinates is returned instead.
+        """
+        if scalar_points_enabled():
+            x, y = self.points[index].tolist()
+            return Point(x, y)
+
+        #a row of a C contiguous array reshaped to a column is still a view
+        return Vector(self.points[index].reshape((2, 1)))
+
+    def to_vectors(self) -> List[Vector]:
+        """
+            Returns the points as a list of Vectors, every Vector is a view.
+        """
+        return [self.vector(i) for i in range(len(self))]
+
+    def to_segments(self, sort_ends: bool = True) -> List['Segment']:
+        """
+            Returns the points as a list of segments, taking every two consecutive
+            points as the start and end of a segment.
+        """
+        from segment import Segment
+
+        if (len(self) % 2) != 0:
+            raise ValueError("The number of points should be even to build segments.")
+
+        return [Segment(self.vector(i), self.vector(i+1), sort_ends=sort_ends) for i in range(0, len(self), 2)]
+
+    #================================================
+    #               Useful properties
+    #================================================
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.points[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.points[:, 1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.points.nbytes
+
+    #================================================
+    #               Operator overloading
+    #================================================
+
+    def __len__(self) -> int:
+        return self.points.shape[0]
+
+    def __iter__(self) -> Iterator[Vector]:
+        for i in range(len(self)):
+            yield self.vector(i)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray, List[int]]) -> Union[Vector, 'PointSet']:
+        """
+            An integer index returns a Vector view of the point.
+            A slice returns a PointSet that shares memory (zero-copy).
+            An array of indexes or a boolean mask returns a new PointSet (fancy indexing copies).
+        """
+        if isinstance(index, (int, np.integer)):
+            return self.vector(index)
+
+        return PointSet(self.points[index], copy=False)
+
+    def __repr__(self) -> str:
+        return f"PointSet({len(self)} points)"
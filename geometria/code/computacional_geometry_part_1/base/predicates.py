@@ -0,0 +1,177 @@
+import numpy as np
+from fractions import Fraction
+from typing import Union
+
+# Adaptive precision geometric predicates.
+#
+# Every predicate first computes its determinant with plain floats, and compares
+# it with a static error bound (the bounds are the ones from Shewchuk's "Adaptive
+# Precision Floating-Point Arithmetic and Fast Robust Geometric Predicates").
+# If the determinant is bigger than the bound its sign is the right one, otherwise
+# (which is rare, it happens on almost degenerate inputs) the determinant is
+# computed again with exact rational arithmetic.
+
+# half of the machine epsilon of a float64, it bounds the relative error of one operation
+EPSILON = 2.0 ** -53
+
+CCW_ERRBOUND_A = (3.0 + 16.0 * EPSILON) * EPSILON
+ICC_ERRBOUND_A = (10.0 + 96.0 * EPSILON) * EPSILON
+
+
+def _sign(value: Union[float, Fraction]) -> int:
+    return (value > 0) - (value < 0)
+
+#================================================
+#               Orientation test
+#================================================
+
+def orient2d_filtered(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> Union[int, None]:
+    """
+        Fast path of orient2d, it only uses floats.
+
+        Returns:
+        -----------
+            1 if a, b, c are in anticlockwise order (c is to the left of the line a->b),
+            -1 if they are in clockwise order, 0 if they are collinear, or None if
+            the float error is too big to be sure about the sign.
+    """
+    detleft = (ax - cx) * (by - cy)
+    detright = (ay - cy) * (bx - cx)
+    det = detleft - detright
+
+    #if the two products have different signs there is no cancellation,
+    #so the sign of the float determinant is the right one
+    if detleft > 0:
+        if detright <= 0:
+            return _sign(det)
+        detsum = detleft + detright
+    elif detleft < 0:
+        if detright >= 0:
+            return _sign(det)
+        detsum = -detleft - detright
+    else:
+        return _sign(det)
+
+    errbound = CCW_ERRBOUND_A * detsum
+    if (det >= errbound) or (-det >= errbound):
+        return _sign(det)
+
+    return None
+
+def orient2d_exact(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """
+        Slow path of orient2d, every float is converted to a fraction without any
+        rounding, so the determinant is computed exactly.
+    """
+    ax, ay, bx, by, cx, cy = [Fraction(float(v)) for v in (ax, ay, bx, by, cx, cy)]
+    return _sign((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+def orient2d(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """
+        Orientation of the points a, b, c.
+
+        Returns:
+        -----------
+            1 if a, b, c are in anticlockwise order (a left turn),
+            -1 if they are in clockwise order (a right turn),
+            0 if they are collinear.
+    """
+    turn = orient2d_filtered(ax, ay, bx, by, cx, cy)
+
+    if turn is None:
+        return orient2d_exact(ax, ay, bx, by, cx, cy)
+    return turn
+
+def orient2d_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+        Vectorized orient2d over arrays of points with shape (N, 2) (an array with a
+        single row is used for all the N rows). The float filter is applied to the
+        whole array and only the inconclusive rows are recomputed exactly.
+
+        Returns:
+        -----------
+            int8 array with the orientation of every row.
+    """
+    a, b, c = np.broadcast_arrays(np.asarray(a, dtype=np.float64),
+                                  np.asarray(b, dtype=np.float64),
+                                  np.asarray(c, dtype=np.float64))
+
+    detleft = (a[:, 0] - c[:, 0]) * (b[:, 1] - c[:, 1])
+    detright = (a[:, 1] - c[:, 1]) * (b[:, 0] - c[:, 0])
+    det = detleft - detright
+
+    turns = np.sign(det).astype(np.int8)
+
+    #rows where the error bound does not guarantee the sign
+    errbound = CCW_ERRBOUND_A * (np.abs(detleft) + np.abs(detright))
+    uncertain = np.flatnonzero(np.abs(det) < errbound)
+
+    for i in uncertain:
+        turns[i] = orient2d_exact(a[i, 0], a[i, 1], b[i, 0], b[i, 1], c[i, 0], c[i, 1])
+
+    return turns
+
+#================================================
+#               In circle test
+#================================================
+
+def _incircle_terms(ax, ay, bx, by, cx, cy, dx, dy):
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    return (adx * bdy, bdx * ady, bdx * cdy, cdx * bdy, cdx * ady, adx * cdy, alift, blift, clift)
+
+def incircle_filtered(ax: float, ay: float, bx: float, by: float,
+                      cx: float, cy: float, dx: float, dy: float) -> Union[int, None]:
+    """
+        Fast path of incircle, it only uses floats. Returns None if the float error
+        is too big to be sure about the sign.
+    """
+    adxbdy, bdxady, bdxcdy, cdxbdy, cdxady, adxcdy, alift, blift, clift = _incircle_terms(ax, ay, bx, by, cx, cy, dx, dy)
+
+    det = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+
+    permanent = ((abs(bdxcdy) + abs(cdxbdy)) * alift
+               + (abs(cdxady) + abs(adxcdy)) * blift
+               + (abs(adxbdy) + abs(bdxady)) * clift)
+
+    errbound = ICC_ERRBOUND_A * permanent
+    if (det > errbound) or (-det > errbound):
+        return _sign(det)
+
+    #an exact zero with a zero permanent is also a sure answer
+    if permanent == 0:
+        return 0
+
+    return None
+
+def incircle_exact(ax: float, ay: float, bx: float, by: float,
+                   cx: float, cy: float, dx: float, dy: float) -> int:
+    """
+        Slow path of incircle, computed with exact fractions.
+    """
+    values = [Fraction(float(v)) for v in (ax, ay, bx, by, cx, cy, dx, dy)]
+    adxbdy, bdxady, bdxcdy, cdxbdy, cdxady, adxcdy, alift, blift, clift = _incircle_terms(*values)
+
+    return _sign(alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady))
+
+def incircle(ax: float, ay: float, bx: float, by: float,
+             cx: float, cy: float, dx: float, dy: float) -> int:
+    """
+        Checks if the point d is inside the circle that goes through a, b and c.
+
+        Returns:
+        -----------
+            1 if d is inside the circle, -1 if it's outside, 0 if it's on the circle.
+            (assuming a, b, c are in anticlockwise order, otherwise the sign is reversed)
+    """
+    inside = incircle_filtered(ax, ay, bx, by, cx, cy, dx, dy)
+
+    if inside is None:
+        return incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+    return inside
@@ -0,0 +1,181 @@
+#standard dependencies
+import io
+import json
+import time
+import pstats
+import cProfile
+import numpy as np
+from contextlib import contextmanager
+from typing import Union, Dict, List, Iterator, Tuple
+
+class RunStats():
+
+    TIMING_MODES = (None, "perf_counter", "cprofile")
+
+    def __init__(self, name: str, timing: Union[str, None] = None) -> None:
+        """
+            Counters, histograms and timings of one run of an algorithm, returned
+            with its result when it's run with return_stats=True. The algorithm
+            counts its events (count), samples the size of its structures
+            (observe) and, in the "perf_counter" timing mode, adds the time spent
+            in every handler (add_time).
+
+            Args:
+            -----------
+                name: name of the algorithm.
+                timing: None (only the wall time of the run), "perf_counter" (the
+                        time of every handler too) or "cprofile" (the whole run is
+                        profiled, the report is kept in self.profile).
+        """
+        if timing not in RunStats.TIMING_MODES:
+            raise ValueError(f"timing should be one of {RunStats.TIMING_MODES}, yet is: {timing}")
+
+        self.name = name
+        self.timing = timing
+
+        self.counters : Dict[str, int] = {}
+        self.series : Dict[str, List[float]] = {}
+        self.timers : Dict[str, float] = {}
+        self.calls : Dict[str, int] = {}
+
+        self.wall_time : float = 0.0
+        self.profile : List[dict] = None
+
+    @property
+    def timed(self) -> bool:
+        """
+            If the handlers should be timed, the algorithms check it once before their loop.
+        """
+        return self.timing == "perf_counter"
+
+    #================================================
+    #               Collection
+    #================================================
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, value: float) -> None:
+        """
+            Adds a sample of a value that changes over the run (like the size of the status).
+        """
+        self.series.setdefault(name, []).append(value)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.timers[name] = self.timers.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+            Times a block with add_time, only in the "perf_counter" mode.
+        """
+        if not self.timed:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    @contextmanager
+    def measure(self) -> Iterator['RunStats']:
+        """
+            Wraps the whole run: its wall time, and the profile in the "cprofile" mode.
+        """
+        profiler = cProfile.Profile() if self.timing == "cprofile" else None
+        start = time.perf_counter()
+
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield self
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self.profile = RunStats.profile_report(profiler)
+            self.wall_time += time.perf_counter() - start
+
+    @staticmethod
+    def profile_report(profiler: cProfile.Profile, top: int = 25) -> List[dict]:
+        """
+            The functions with the largest cumulative time of a profile.
+        """
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        rows = []
+        for (file, line, function), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append({"function": f"{function} ({file.split('/')[-1]}:{line})", "calls": ncalls,
+                         "tottime": tottime, "cumtime": cumtime})
+
+        rows.sort(key=lambda row: row["cumtime"], reverse=True)
+        return rows[:top]
+
+    def merge(self, other: 'RunStats', prefix: str) -> None:
+        """
+            Adds the stats of a nested run (like the monotone sweep of the triangulation),
+            with their names prefixed.
+        """
+        for name, value in other.counters.items():
+            self.count(f"{prefix}.{name}", value)
+        for name, values in other.series.items():
+            self.series.setdefault(f"{prefix}.{name}", []).extend(values)
+        for name, seconds in other.timers.items():
+            self.timers[f"{prefix}.{name}"] = self.timers.get(f"{prefix}.{name}", 0.0) + seconds
+            self.calls[f"{prefix}.{name}"] = self.calls.get(f"{prefix}.{name}", 0) + other.calls[name]
+        self.add_time(f"{prefix}.wall_time", other.wall_time)
+
+    #================================================
+    #               Reports
+    #================================================
+
+    def histogram(self, name: str, bins: int = 10) -> Dict[str, Union[float, List]]:
+        """
+            Summary and histogram of a series.
+        """
+        values = np.asarray(self.series.get(name, []), dtype=np.float64)
+        if len(values) == 0:
+            return {"samples": 0}
+
+        counts, edges = np.histogram(values, bins=min(bins, max(1, len(np.unique(values)))))
+        return {"samples": int(len(values)), "min": float(values.min()), "max": float(values.max()),
+                "mean": float(values.mean()), "edges": edges.tolist(), "counts": counts.tolist()}
+
+    def to_dict(self, include_series: bool = False) -> dict:
+        result = {"name": self.name,
+                  "timing": self.timing,
+                  "wall_time": self.wall_time,
+                  "counters": dict(sorted(self.counters.items())),
+                  "timers": {name: {"seconds": seconds, "calls": self.calls[name]}
+                             for name, seconds in sorted(self.timers.items())},
+                  "histograms": {name: self.histogram(name) for name in sorted(self.series)}}
+
+        if include_series:
+            result["series"] = self.series
+        if self.profile is not None:
+            result["profile"] = self.profile
+        return result
+
+    def to_json(self, path: Union[str, None] = None, include_series: bool = False, indent: int = 2) -> str:
+        """
+            Exports the stats as JSON (written to path if given), so runs can be compared.
+        """
+        text = json.dumps(self.to_dict(include_series=include_series), indent=indent)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(text)
+        return text
+
+    def compare(self, other: 'RunStats') -> Dict[str, Tuple[float, float]]:
+        """
+            The counters and timers that differ between this run and other, as (this, other).
+        """
+        mine = {**self.counters, **{f"time.{k}": v for k, v in self.timers.items()}, "wall_time": self.wall_time}
+        theirs = {**other.counters, **{f"time.{k}": v for k, v in other.timers.items()}, "wall_time": other.wall_time}
+        return {name: (mine.get(name, 0), theirs.get(name, 0)) for name in sorted(set(mine) | set(theirs))
+                if mine.get(name, 0) != theirs.get(name, 0)}
+
+    def __repr__(self) -> str:
+        counters = ", ".join(f"{name}={value}" for name, value in sorted(self.counters.items()))
+        return f"RunStats({self.name}, {self.wall_time:.4f} s, {counters})"
@@ -1,19 +1,41 @@
 #strandard dependencies
 import numpy as np
-from typing import Union, List
+from enum import IntEnum
+from typing import Union, List, Tuple
 
 #custom dependencies
 from vector import Vector
+from point import make_point
+from predicates import orient2d, orient2d_batch
+from intersection_kernel import line_intersection, line_intersection_batch
+
+class IntersectionKind(IntEnum):
+    """
+        How two segments intersect, returned by Segment.intersect.
+
+        NONE: the segments don't intersect.
+        POINT: they cross at a single point, inside both segments.
+        ENDPOINT: they touch at a single point, which is an endpoint of at least one of them.
+        OVERLAP: they are collinear and share a piece of segment.
+    """
+    NONE = 0
+    POINT = 1
+    ENDPOINT = 2
+    OVERLAP = 3
+
 
 class Segment():
 
-    def __init__(self, start: Vector, end: Vector, sort_ends = False) -> None:
+    def __init__(self, start: Vector, end: Vector, sort_ends = False, layer = None) -> None:
         """
             This class is used to represent a segment in 2D space.
             start and end are the vertices of the segment. Starting from start, and ending in end.
+            layer is an optional tag of the set the segment belongs to (for example, the
+            subdivision of an overlay), used by the colored mode of the sweep line.
         """
         self.start = start
         self.end = end
+        self.layer = layer
 
         #make sure that the start is the lowest leftmost point, 
         #refer to our order operator overload in vector.py
@@ -67,8 +89,42 @@ class Segment():
                 -1: if the walk is a right turn
                 0: if the points are collinear
         """
-        det = np.linalg.det(np.column_stack([(vector3 - self.start).vector, (self.end - self.start).vector]))
-        return np.sign(det)
+        #sign of the determinant of the columns (vector3 - start) and (end - start),
+        #which is the orientation of (start, end, vector3) with the sign reversed
+        return -orient2d(self.start[0], self.start[1], self.end[0], self.end[1], vector3[0], vector3[1])
+
+    def directions(self, points: Union[np.ndarray, List[Vector]]) -> np.ndarray:
+        """
+            Batch version of direction, for N query points at once.
+
+            Input:
+                points: array of shape (N, 2), PointSet or list of Vectors.
+            Output:
+                int8 array with the direction of every point, same values as direction.
+        """
+        start = np.array([[self.start[0], self.start[1]]])
+        end = np.array([[self.end[0], self.end[1]]])
+        return Segment.batch_direction(start, end, points)
+
+    @staticmethod
+    def batch_direction(starts: np.ndarray, ends: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """
+            Direction of points[i] with respect to the segment from starts[i] to ends[i],
+            computed for every i in a single vectorized pass. starts and ends can also
+            have a single row, in which case the same segment is used for all the points.
+
+            Output:
+                int8 array with the same values as direction.
+        """
+        from point_set import PointSet
+
+        starts = PointSet.as_array(starts)
+        ends = PointSet.as_array(ends)
+        points = PointSet.as_array(points)
+
+        #determinant of the columns (point - start) and (end - start),
+        #same sign convention as direction
+        return -orient2d_batch(starts, ends, points)
 
     def segments_intersect(self, other_segment: 'Segment') -> bool:
 
@@ -106,34 +162,71 @@ class Segment():
         else:
             return False
     
+    def intersect(self, other_segment: 'Segment') -> Tuple[IntersectionKind, Union[Vector, 'Segment', None]]:
+        """
+            Classifies the intersection of the segments, and computes only the geometry
+            that the case needs. The cheap tests go first: a bounding box check,
+            then the four orientations, and the intersection point is computed
+            only when the segments really cross.
+
+            Returns:
+            -----------
+                (kind, geometry) where geometry is None for NONE, the intersection
+                point for POINT and ENDPOINT, and the shared segment for OVERLAP.
+        """
+        sx, sy, ex, ey = self.start[0], self.start[1], self.end[0], self.end[1]
+        ox, oy, fx, fy = other_segment.start[0], other_segment.start[1], other_segment.end[0], other_segment.end[1]
+
+        #bounding box check
+        if (max(sx, ex) < min(ox, fx) or max(ox, fx) < min(sx, ex) or
+            max(sy, ey) < min(oy, fy) or max(oy, fy) < min(sy, ey)):
+            return IntersectionKind.NONE, None
+
+        #orientations of each segment endpoints with respect to the other segment
+        dir1 = orient2d(ox, oy, fx, fy, sx, sy)
+        dir2 = orient2d(ox, oy, fx, fy, ex, ey)
+        dir3 = orient2d(sx, sy, ex, ey, ox, oy)
+        dir4 = orient2d(sx, sy, ex, ey, fx, fy)
+
+        #well behaved case, they cross in the interior of both segments
+        if (dir1*dir2 < 0) and (dir3*dir4 < 0):
+            return IntersectionKind.POINT, make_point(*line_intersection(sx, sy, ex, ey, ox, oy, fx, fy))
+
+        #collinear case, as the bounding boxes intersect they share at least one point
+        if dir1 == dir2 == dir3 == dir4 == 0:
+            first = max(min(self.start, self.end), min(other_segment.start, other_segment.end))
+            last = min(max(self.start, self.end), max(other_segment.start, other_segment.end))
+
+            if first == last:
+                return IntersectionKind.ENDPOINT, first
+            return IntersectionKind.OVERLAP, Segment(first, last)
+
+        #an endpoint of one segment lies on the other one
+        if dir1 == 0 and other_segment.on_segment(self.start):
+            return IntersectionKind.ENDPOINT, self.start
+        if dir2 == 0 and other_segment.on_segment(self.end):
+            return IntersectionKind.ENDPOINT, self.end
+        if dir3 == 0 and self.on_segment(other_segment.start):
+            return IntersectionKind.ENDPOINT, other_segment.start
+        if dir4 == 0 and self.on_segment(other_segment.end):
+            return IntersectionKind.ENDPOINT, other_segment.end
+
+        return IntersectionKind.NONE, None
+
     def get_intersection_of_segments_general(self, other_segment: 'Segment') -> Union['Segment', Vector]:
 
         """
-            This method uses the find_intersection_on_endpoints, 
-            the find_intersection, and the find_interval_intersection methods,
-            which respectively get the intersect on endpoints (if any),
-            the intersection between segments (if any), 
-            and the intersection on an interval (if any).
+            Gets the intersection of the segments, which can be a segment (if they overlap),
+            or a point. If the segments don't intersect, returns the intersection
+            of their lines (if any). See intersect, which does the classification.
         """
-    
-        # Find the intersection point (if any)
-        intersection = self.find_intersection(other_segment)
-
-        # Find the intersection on endpoints (if any)
-        intersection_on_endpoints = self.find_intersection_on_endpoints(other_segment)
 
-        # Find the intersection on segments (if any)
-        intersection_on_segments = self.find_interval_intersection(other_segment)
+        kind, intersection = self.intersect(other_segment)
 
-        if intersection_on_segments is not None:
-            return intersection_on_segments
-        elif intersection_on_endpoints is not None:
-            return intersection_on_endpoints
-        else:
+        if kind != IntersectionKind.NONE:
             return intersection
+        return self.find_intersection(other_segment)
 
-
-    
     def find_intersection_on_endpoints(self, other_segment: 'Segment') -> Union['Segment', None]:
         """
             Finds the intersection of the segments on the endpoints.
@@ -150,27 +243,36 @@ class Segment():
             Finds the intersection of the lines formed by the segments endv2 and v3v4.
         """
 
-        difference1 = (self.start - self.end).vector
-        difference2 = (other_segment.start - other_segment.end).vector
-        result = (other_segment.start - self.end).vector
+        #closed form solution of the 2x2 system (Cramer's rule), with plain floats
+        intersect = line_intersection(self.start[0], self.start[1], self.end[0], self.end[1],
+                                      other_segment.start[0], other_segment.start[1],
+                                      other_segment.end[0], other_segment.end[1])
 
-        matrix = np.column_stack([difference1, difference2])
-        
-        #if the matrix is singular, then the lines are parallel, 
+        #if the system is singular, then the lines are parallel,
         # but they might intersect on the endpoints
-        try:
-            alpha_beta = np.linalg.solve(matrix, result).reshape(2,)
-
-        except np.linalg.LinAlgError as e:
-            if 'Singular matrix' in str(e):
-                return self.find_intersection_on_endpoints(other_segment)
-            else: 
-                raise e
-            
-        intersect = self.start.times_scalar(alpha_beta[0]) + self.end.times_scalar(float(1 - alpha_beta[0]))
-
-        return intersect
-    
+        if intersect is None:
+            return self.find_intersection_on_endpoints(other_segment)
+
+        return make_point(*intersect)
+
+    @staticmethod
+    def batch_intersection(starts1: np.ndarray, ends1: np.ndarray,
+                           starts2: np.ndarray, ends2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            Batch version of find_intersection, intersects the line of the i-th segment
+            of the first group with the line of the i-th segment of the second group.
+            Any of the arrays can have a single row, which is used for every pair.
+
+            Output:
+                points: (N, 2) array with the intersections (nan rows for parallel lines).
+                parallel: boolean array, the pairs that find_intersection has to
+                          solve on the endpoints.
+        """
+        from point_set import PointSet
+
+        return line_intersection_batch(PointSet.as_array(starts1), PointSet.as_array(ends1),
+                                       PointSet.as_array(starts2), PointSet.as_array(ends2))
+
     def find_interval_intersection(self, other_segment: 'Segment') -> Union['Segment', None]:
         """
             Finds the interval intersection of the segments.
@@ -232,6 +334,10 @@ class Segment():
         if (self is not None and other_segment is None) or (self is None and other_segment is not None):
             return False
 
+        #the same segment in two layers are two different segments
+        if self.layer != getattr(other_segment, "layer", None):
+            return False
+
         self_set = set([self.start, self.end])
         other_set = set([other_segment.start, other_segment.end])
         return self_set == other_set
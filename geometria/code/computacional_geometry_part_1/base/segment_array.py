@@ -0,0 +1,293 @@
+#standard dependencies
+import numpy as np
+import pandas as pd
+from typing import Union, List, Iterator, Sequence, Tuple
+
+#custom dependencies
+from vector import Vector
+from segment import Segment, IntersectionKind
+from point_set import PointSet
+from predicates import orient2d_batch
+from intersection_kernel import line_intersection_batch
+
+class SegmentArray():
+
+    # rough number of bytes used per compared pair of segments inside a block
+    # (the bounding box masks plus the temporaries of the candidate pairs)
+    BYTES_PER_PAIR = 64
+
+    def __init__(self, segments: np.ndarray, copy: bool = True, sort_ends: bool = False) -> None:
+        """
+            This class is used to represent N segments in 2D space, stored in a single
+            (N, 4) float64 array where every row is (x0, y0, x1, y1), together with
+            their bounding boxes, stored as (xmin, ymin, xmax, ymax) rows.
+
+            Args:
+            -----------
+                segments: array like with N*4 elements, it's reshaped to (N, 4).
+                copy: if False and the input is already a float64 array,
+                      the SegmentArray shares its memory instead of copying it.
+                sort_ends: if True, the start of every segment is its first point in
+                           the Vector order (like Segment(..., sort_ends=True)).
+        """
+        if copy:
+            segments = np.array(segments, dtype=np.float64, order="C")
+        else:
+            segments = np.asarray(segments, dtype=np.float64)
+
+        if (segments.size % 4) != 0:
+            raise TypeError(f"Should have a multiple of 4 coordinates, yet has shape: {segments.shape}")
+
+        self.segments = segments.reshape((-1, 4))
+
+        if sort_ends:
+            #swap the rows whose end comes before their start
+            swap = SegmentArray._precedes(self.segments[:, 2:4], self.segments[:, 0:2])
+            if copy is False and swap.any():
+                self.segments = self.segments.copy()
+            self.segments[swap] = self.segments[swap][:, [2, 3, 0, 1]]
+
+        self.bboxes = np.column_stack([np.minimum(self.segments[:, 0], self.segments[:, 2]),
+                                       np.minimum(self.segments[:, 1], self.segments[:, 3]),
+                                       np.maximum(self.segments[:, 0], self.segments[:, 2]),
+                                       np.maximum(self.segments[:, 1], self.segments[:, 3])])
+
+    #================================================
+    #               Constructors
+    #================================================
+
+    @staticmethod
+    def from_segments(segments: List[Segment], sort_ends: bool = False) -> 'SegmentArray':
+        """
+            Builds a SegmentArray from a list of Segments.
+        """
+        array = np.empty((len(segments), 4), dtype=np.float64)
+
+        for i, segment in enumerate(segments):
+            array[i] = (segment.start[0], segment.start[1], segment.end[0], segment.end[1])
+
+        return SegmentArray(array, copy=False, sort_ends=sort_ends)
+
+    @staticmethod
+    def from_point_set(points: PointSet, sort_ends: bool = False) -> 'SegmentArray':
+        """
+            Builds a SegmentArray from a PointSet, taking every two consecutive
+            points as the start and end of a segment (same layout as PointSet.to_segments).
+        """
+        if (len(points) % 2) != 0:
+            raise ValueError("The number of points should be even to build segments.")
+
+        return SegmentArray(PointSet.as_array(points), copy=sort_ends, sort_ends=sort_ends)
+
+    @staticmethod
+    def from_csv(file: str, columns: Sequence[str] = ("x0", "y0", "x1", "y1"), sort_ends: bool = False) -> 'SegmentArray':
+        """
+            Builds a SegmentArray from a csv file, with one segment per row.
+        """
+        df = pd.read_csv(file, usecols=list(columns))
+        return SegmentArray(df[list(columns)].to_numpy(dtype=np.float64), copy=False, sort_ends=sort_ends)
+
+    @staticmethod
+    def build_random_segments(nsegments: int, minval = -10, maxval = 10) -> 'SegmentArray':
+        """
+            Builds nsegments random segments, with integer coordinates in [minval, maxval).
+        """
+        return SegmentArray(np.random.randint(minval, maxval, (nsegments, 4)), copy=False)
+
+    #================================================
+    #               Conversions
+    #================================================
+
+    def segment(self, index: int) -> Segment:
+        """
+            Returns the index-th segment as a Segment, its vectors are views.
+        """
+        row = self.segments[index]
+        return Segment(Vector(row[0:2].reshape((2, 1))), Vector(row[2:4].reshape((2, 1))))
+
+    def to_segments(self) -> List[Segment]:
+        return [self.segment(i) for i in range(len(self))]
+
+    #================================================
+    #               Useful properties
+    #================================================
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self.segments[:, 0:2]
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self.segments[:, 2:4]
+
+    @property
+    def nbytes(self) -> int:
+        return self.segments.nbytes + self.bboxes.nbytes
+
+    #================================================
+    #           All pairs intersection
+    #================================================
+
+    @staticmethod
+    def _precedes(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+            Vectorized version of the Vector order (a < b), the highest point
+            first, and from left to right if they are at the same height.
+        """
+        return (a[:, 1] > b[:, 1]) | ((a[:, 1] == b[:, 1]) & (a[:, 0] < b[:, 0]))
+
+    def block_size_for_memory(self, max_memory: int) -> int:
+        """
+            Largest block size whose block x block comparison fits in max_memory bytes.
+        """
+        return max(1, int(np.sqrt(max_memory / SegmentArray.BYTES_PER_PAIR)))
+
+    def _classify_pairs(self, ii: np.ndarray, jj: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            Classifies the candidate pairs (ii[k], jj[k]), whose bounding boxes intersect,
+            with the same cases as Segment.intersect.
+
+            Returns:
+            -----------
+                kinds: int8 array with the IntersectionKind of every pair.
+                points: (K, 2) array with the intersection point of every pair
+                        (for OVERLAP, the first point of the shared piece).
+        """
+        s, e = self.segments[ii, 0:2], self.segments[ii, 2:4]
+        o, f = self.segments[jj, 0:2], self.segments[jj, 2:4]
+
+        #orientations of each segment endpoints with respect to the other segment
+        dir1 = orient2d_batch(o, f, s)
+        dir2 = orient2d_batch(o, f, e)
+        dir3 = orient2d_batch(s, e, o)
+        dir4 = orient2d_batch(s, e, f)
+
+        kinds = np.full(len(ii), IntersectionKind.NONE, dtype=np.int8)
+        points = np.full((len(ii), 2), np.nan)
+
+        #well behaved case, they cross in the interior of both segments
+        crossing = ((dir1 * dir2) < 0) & ((dir3 * dir4) < 0)
+        if crossing.any():
+            points[crossing], _ = line_intersection_batch(s[crossing], e[crossing], o[crossing], f[crossing])
+            kinds[crossing] = IntersectionKind.POINT
+
+        #collinear case, the shared piece goes from the max of the starts to the min of the ends
+        collinear = (dir1 == 0) & (dir2 == 0) & (dir3 == 0) & (dir4 == 0)
+        if collinear.any():
+            s_, e_, o_, f_ = s[collinear], e[collinear], o[collinear], f[collinear]
+            first_self = np.where(SegmentArray._precedes(s_, e_)[:, None], s_, e_)
+            last_self = np.where(SegmentArray._precedes(s_, e_)[:, None], e_, s_)
+            first_other = np.where(SegmentArray._precedes(o_, f_)[:, None], o_, f_)
+            last_other = np.where(SegmentArray._precedes(o_, f_)[:, None], f_, o_)
+
+            first = np.where(SegmentArray._precedes(first_self, first_other)[:, None], first_other, first_self)
+            last = np.where(SegmentArray._precedes(last_self, last_other)[:, None], last_self, last_other)
+
+            points[collinear] = first
+            kinds[collinear] = np.where((first == last).all(axis=1), IntersectionKind.ENDPOINT, IntersectionKind.OVERLAP)
+
+        #an endpoint of one segment lies on the other one (inside its bounding box)
+        pending = ~(crossing | collinear)
+        bbox_i, bbox_j = self.bboxes[ii], self.bboxes[jj]
+
+        for direction, point, bbox in ((dir1, s, bbox_j), (dir2, e, bbox_j), (dir3, o, bbox_i), (dir4, f, bbox_i)):
+            inside = ((bbox[:, 0] <= point[:, 0]) & (point[:, 0] <= bbox[:, 2]) &
+                      (bbox[:, 1] <= point[:, 1]) & (point[:, 1] <= bbox[:, 3]))
+            touching = pending & (direction == 0) & inside
+
+            points[touching] = point[touching]
+            kinds[touching] = IntersectionKind.ENDPOINT
+            pending &= ~touching
+
+        return kinds, points
+
+    def pairwise_intersections(self, block_size: int = 1024,
+                               max_memory: Union[int, None] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+            Finds every pair of intersecting segments, comparing all the pairs with numpy.
+            The N x N comparison is split in blocks of block_size x block_size segments,
+            so the memory used doesn't grow with N. Inside a block the pairs are first
+            filtered by their bounding boxes, and only the remaining ones go through
+            the orientation tests.
+
+            Args:
+            -----------
+                block_size: number of segments per side of every block.
+                max_memory: if given, the block size is reduced so a block uses at most
+                            about max_memory bytes.
+
+            Returns:
+            -----------
+                pairs: (M, 2) int64 array with the indexes (i, j) of the intersecting
+                       segments, i < j, sorted.
+                points: (M, 2) array with the intersection points (for overlapping
+                        segments, the first point of the shared piece, in the Vector order).
+                kinds: int8 array with the IntersectionKind of every pair.
+        """
+        if max_memory is not None:
+            block_size = min(block_size, self.block_size_for_memory(max_memory))
+
+        nsegments = len(self)
+        all_pairs, all_points, all_kinds = [], [], []
+
+        for i0 in range(0, nsegments, block_size):
+            i1 = min(i0 + block_size, nsegments)
+            bbox_i = self.bboxes[i0:i1]
+
+            for j0 in range(i0, nsegments, block_size):
+                j1 = min(j0 + block_size, nsegments)
+                bbox_j = self.bboxes[j0:j1]
+
+                #bounding box rejection for the whole block
+                mask = ((bbox_i[:, None, 0] <= bbox_j[None, :, 2]) & (bbox_j[None, :, 0] <= bbox_i[:, None, 2]) &
+                        (bbox_i[:, None, 1] <= bbox_j[None, :, 3]) & (bbox_j[None, :, 1] <= bbox_i[:, None, 3]))
+
+                #in the blocks of the diagonal we only keep the pairs with i < j
+                if i0 == j0:
+                    mask &= np.triu(np.ones(mask.shape, dtype=bool), k=1)
+
+                ii, jj = np.nonzero(mask)
+                if len(ii) == 0:
+                    continue
+
+                ii += i0
+                jj += j0
+                kinds, points = self._classify_pairs(ii, jj)
+
+                hit = kinds != IntersectionKind.NONE
+                all_pairs.append(np.column_stack([ii[hit], jj[hit]]))
+                all_points.append(points[hit])
+                all_kinds.append(kinds[hit])
+
+        if len(all_pairs) == 0:
+            return np.empty((0, 2), dtype=np.int64), np.empty((0, 2)), np.empty(0, dtype=np.int8)
+
+        pairs = np.concatenate(all_pairs).astype(np.int64)
+        points = np.concatenate(all_points)
+        kinds = np.concatenate(all_kinds)
+
+        order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+        return pairs[order], points[order], kinds[order]
+
+    #================================================
+    #               Operator overloading
+    #================================================
+
+    def __len__(self) -> int:
+        return self.segments.shape[0]
+
+    def __iter__(self) -> Iterator[Segment]:
+        for i in range(len(self)):
+            yield self.segment(i)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray, List[int]]) -> Union[Segment, 'SegmentArray']:
+        """
+            An integer index returns a Segment, anything else a SegmentArray.
+        """
+        if isinstance(index, (int, np.integer)):
+            return self.segment(index)
+
+        return SegmentArray(self.segments[index], copy=False)
+
+    def __repr__(self) -> str:
+        return f"SegmentArray({len(self)} segments)"
@@ -1,7 +1,16 @@
 import unittest
 import numpy as np
-from segment import Segment
+from segment import Segment, IntersectionKind
 from vector import Vector
+from point_set import PointSet
+from segment_array import SegmentArray
+from uniform_grid import UniformGrid
+from point import Point
+from predicates import orient2d, orient2d_filtered, orient2d_batch, incircle
+from intersection_kernel import line_intersection
+import tracing
+import json
+from run_stats import RunStats
 
 class TestSegment(unittest.TestCase):
 
@@ -89,6 +98,213 @@ class TestSegment(unittest.TestCase):
         segment2 = Segment(pair_point2[0], pair_point2[1])
         self.assertIsNone(segment1.find_interval_intersection(segment2))
 
+    def test_layers(self):
+        pair_point1 = (Vector(np.array([[0],[0]])), Vector(np.array([[1],[1]])))
+
+        segment1 = Segment(pair_point1[0], pair_point1[1], layer=0)
+        segment2 = Segment(pair_point1[1], pair_point1[0], layer=0)
+        segment3 = Segment(pair_point1[0], pair_point1[1], layer=1)
+
+        # the same segment in another layer is a different segment
+        self.assertEqual(segment1, segment2)
+        self.assertNotEqual(segment1, segment3)
+        self.assertEqual(len({segment1, segment3}), 2)
+
+
+class TestIntersectionKind(unittest.TestCase):
+
+    def test_intersect_classification(self):
+        v = lambda x, y: Vector(np.array([[x], [y]]))
+
+        diagonal = Segment(v(0, 0), v(2, 2))
+        self.assertEqual(diagonal.intersect(Segment(v(0, 2), v(2, 0))), (IntersectionKind.POINT, v(1, 1)))
+        self.assertEqual(diagonal.intersect(Segment(v(1, 1), v(3, 0))), (IntersectionKind.ENDPOINT, v(1, 1)))
+        self.assertEqual(diagonal.intersect(Segment(v(2, 2), v(3, 3))), (IntersectionKind.ENDPOINT, v(2, 2)))
+        self.assertEqual(diagonal.intersect(Segment(v(3, 0), v(4, 1))), (IntersectionKind.NONE, None))
+
+        kind, overlap = diagonal.intersect(Segment(v(1, 1), v(3, 3)))
+        self.assertEqual(kind, IntersectionKind.OVERLAP)
+        self.assertEqual(overlap, Segment(v(1, 1), v(2, 2)))
+
+
+class TestSegmentArray(unittest.TestCase):
+
+    def test_pairwise_matches_intersect(self):
+        np.random.seed(7)
+        array = SegmentArray.build_random_segments(60, 0, 6)
+        segments = array.to_segments()
+
+        pairs, points, kinds = array.pairwise_intersections(block_size=16, max_memory=2**20)
+
+        expected = []
+        for i in range(len(segments)):
+            for j in range(i+1, len(segments)):
+                kind, geometry = segments[i].intersect(segments[j])
+                if kind == IntersectionKind.OVERLAP:
+                    geometry = geometry.start
+                if kind != IntersectionKind.NONE:
+                    expected.append((i, j, int(kind), geometry[0], geometry[1]))
+
+        found = [(i, j, int(kind), x, y) for (i, j), (x, y), kind in zip(pairs.tolist(), points.tolist(), kinds)]
+        self.assertEqual(len(found), len(expected))
+        for row, expected_row in zip(found, expected):
+            self.assertEqual(row[:3], expected_row[:3])
+            self.assertTrue(np.allclose(row[3:], expected_row[3:]))
+
+
+class TestUniformGrid(unittest.TestCase):
+
+    def test_long_segments_are_not_in_the_cells(self):
+        rng = np.random.default_rng(16)
+        short = rng.random((2000, 2)) * 100
+        short = np.hstack([short, short + rng.normal(size=(2000, 2))])
+        #across the square, from one corner to the other one
+        corners = np.array([[0, 0, 90, 90], [0, 90, 90, 0]] * 20)
+        long = corners + rng.random((40, 4)) * 10
+        array = SegmentArray(np.vstack([short, long]))
+
+        grid = UniformGrid(array)
+        self.assertEqual(set(grid.oversize.tolist()), set(range(2000, 2040)))
+        cells, indices = grid.cell_entries()
+        self.assertFalse(np.isin(indices, grid.oversize).any())
+        self.assertLessEqual(len(cells), UniformGrid.MAX_CELLS_PER_SEGMENT * len(array))
+
+        #the same pairs as the all pairs comparison, also the ones of two long segments
+        found, expected = grid.pairwise_intersections(), array.pairwise_intersections()
+        self.assertEqual(found[0].tolist(), expected[0].tolist())
+        self.assertEqual(found[2].tolist(), expected[2].tolist())
+        self.assertTrue(np.allclose(found[1], expected[1]))
+        self.assertTrue(((found[0][:, 0] >= 2000) & (found[0][:, 1] >= 2000)).any())
+
+class TestPointSet(unittest.TestCase):
+
+    def test_views_share_memory(self):
+        array = np.arange(10, dtype=np.float64).reshape((5, 2))
+        points = PointSet(array, copy=False)
+
+        #slices and vectors are views over the same array
+        self.assertTrue(np.shares_memory(points[1:3].points, array))
+        self.assertTrue(np.shares_memory(points[2].vector, array))
+        self.assertEqual(points[2], Vector(np.array([[4], [5]])))
+
+        #fancy indexing returns a new PointSet
+        self.assertEqual(len(points[[0, 4]]), 2)
+        self.assertEqual(points[np.array([False, True, False, False, True])][1], Vector(np.array([[8], [9]])))
+
+    def test_to_segments(self):
+        points = PointSet(np.array([[0, 1, 1, 0], [0, 0, 1, 1]]))
+        segments = points.to_segments()
+
+        self.assertEqual(points.nbytes, 4*16)
+        self.assertEqual(len(segments), 2)
+        self.assertTrue(segments[0].segments_intersect(segments[1]))
+
+
+class TestPoint(unittest.TestCase):
+
+    def test_same_behaviour_as_vector(self):
+        coordinates = [(0, 0), (1, 2), (1, -1), (-3, 2), (1, 2)]
+        vectors = [Vector(np.array([[x], [y]])) for x, y in coordinates]
+        points = [Point(x, y) for x, y in coordinates]
+
+        #same order, same hashes and equal to each other
+        self.assertEqual(sorted(points), sorted(vectors))
+        self.assertEqual([hash(p) for p in points], [hash(v) for v in vectors])
+        self.assertEqual(len(set(points)), 4)
+
+        #same operations
+        self.assertEqual(points[1] - points[2], vectors[1] - vectors[2])
+        self.assertEqual((points[1] + points[3])/2, (vectors[1] + vectors[3])/2)
+        self.assertEqual(Point.calculate_turn(*points[:3]), Vector.calculate_turn(*vectors[:3]))
+
+
+class TestBatchOrientation(unittest.TestCase):
+
+    def test_batch_matches_single_calls(self):
+        np.random.seed(3)
+        a, b, c = [np.random.randint(-5, 5, (200, 2)) for _ in range(3)]
+        vectors = [Vector.cast_to_vector(*array) for array in (a, b, c)]
+
+        turns = Vector.calculate_turns(a, b, c)
+        self.assertEqual(turns.dtype, np.int8)
+        self.assertEqual(turns.tolist(), [Vector.calculate_turn(*triple) for triple in zip(*vectors)])
+
+        segment = Segment(vectors[0][0], vectors[1][0])
+        directions = segment.directions(c)
+        self.assertEqual(directions.tolist(), [int(segment.direction(v)) for v in vectors[2]])
+
+
+class TestPredicates(unittest.TestCase):
+
+    def test_near_degenerate_orientation(self):
+        #a is a couple of ulps above the line y = x, the naive float determinant says collinear
+        a, b, c = (0.5, 0.5 + 2.0**-52), (12.0, 12.0), (24.0, 24.0)
+        naive = (a[0] - c[0])*(b[1] - c[1]) - (a[1] - c[1])*(b[0] - c[0])
+        self.assertEqual(naive, 0)
+
+        self.assertIsNone(orient2d_filtered(*a, *b, *c))
+        self.assertEqual(orient2d(*a, *b, *c), 1)
+        self.assertEqual(orient2d(0.5, 0.5, *b, *c), 0)
+        self.assertEqual(orient2d_batch(np.array([a, (0.5, 0.5)]), np.array([b]), np.array([c])).tolist(), [1, 0])
+
+        #Vector.calculate_turn and Segment.direction use the same predicate
+        vectors = Vector.cast_to_vector(np.array(a), np.array(b), np.array(c))
+        self.assertEqual(Vector.calculate_turn(*vectors), 1)
+        self.assertEqual(Segment(vectors[1], vectors[2]).direction(vectors[0]), -1)
+
+    def test_intersection_kernel(self):
+        self.assertEqual(line_intersection(0, 0, 2, 2, 0, 2, 2, 0), (1.0, 1.0))
+        self.assertIsNone(line_intersection(0, 0, 1, 1, 0, 1, 1, 2))
+
+        points, parallel = Segment.batch_intersection(np.array([[0, 0]]), np.array([[2, 2]]),
+                                                      np.array([[0, 2], [0, 1]]), np.array([[2, 0], [1, 2]]))
+        self.assertEqual(points[0].tolist(), [1.0, 1.0])
+        self.assertEqual(parallel.tolist(), [False, True])
+
+    def test_incircle(self):
+        self.assertEqual(incircle(0, 0, 1, 0, 0, 1, 0.25, 0.25), 1)
+        self.assertEqual(incircle(0, 0, 1, 0, 0, 1, 1, 1), 0)
+        self.assertEqual(incircle(0, 0, 1, 0, 0, 1, 2, 2), -1)
+
+class TestTracing(unittest.TestCase):
+
+    def test_records_only_when_enabled(self):
+
+        records = []
+        tracing.emit("Test", "ignored", value=1)
+
+        with tracing.traced(callback=records.append):
+            self.assertTrue(tracing.enabled)
+            tracing.emit("Test", "event", point=Vector(np.array([[1],[2]])), size=3)
+
+        self.assertFalse(tracing.enabled)
+        tracing.emit("Test", "ignored", value=1)
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["size"], 3)
+        self.assertIn('"event": "event"', records[0].to_json())
+
+class TestRunStats(unittest.TestCase):
+
+    def test_counters_histograms_and_json(self):
+
+        stats = RunStats("Test", timing="perf_counter")
+        with stats.measure():
+            for size in [1, 2, 2, 3]:
+                stats.count("events")
+                stats.observe("status_size", size)
+                with stats.timer("handler"):
+                    pass
+
+        data = json.loads(stats.to_json())
+        self.assertEqual(data["counters"]["events"], 4)
+        self.assertEqual(data["timers"]["handler"]["calls"], 4)
+        self.assertEqual(data["histograms"]["status_size"]["max"], 3)
+        self.assertEqual(sum(data["histograms"]["status_size"]["counts"]), 4)
+        self.assertGreater(stats.wall_time, 0)
+
+        self.assertRaises(ValueError, RunStats, "Test", timing="other")
+
     
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,105 @@
+#standard dependencies
+import json
+import logging
+from contextlib import contextmanager
+from typing import Union, Callable, List, TextIO, Iterator
+
+# The algorithms check this flag before building a record, so a disabled trace
+# only costs a module attribute lookup per event (nothing is formatted).
+# It's changed by enable and disable, always read it as tracing.enabled.
+enabled = False
+
+logger = logging.getLogger("geometria.trace")
+
+_sinks : List[Callable[['TraceRecord'], None]] = []
+_cleanup : List[Callable[[], None]] = []
+
+class TraceRecord(dict):
+    """
+        One structured record of an algorithm: the source (the class that emits it),
+        the event and its fields. The fields are kept as they are (vectors, segments,
+        the status...), they are only formatted when a sink writes the record.
+    """
+
+    def to_json(self) -> str:
+        return json.dumps(self, default=str)
+
+    def __str__(self) -> str:
+        fields = " ".join(f"{key}={value}" for key, value in self.items() if key not in ("source", "event"))
+        return f"[{self['source']}] {self['event']} {fields}".rstrip()
+
+def emit(source: str, event: str, **fields) -> None:
+    """
+        Sends a record to every sink, if the tracing is enabled. In the hot loops
+        check tracing.enabled before calling it, so the fields aren't even computed.
+    """
+    if not enabled:
+        return
+
+    record = TraceRecord(source=source, event=event, **fields)
+    for sink in _sinks:
+        sink(record)
+
+def enable(handler: Union[logging.Handler, None] = None, path: Union[str, None] = None,
+           stream: Union[TextIO, None] = None, callback: Union[Callable[[TraceRecord], None], None] = None,
+           level: int = logging.DEBUG) -> None:
+    """
+        Enables the tracing, every record goes to all the given sinks. If none is
+        given, the records go to the "geometria.trace" logger, with the handlers
+        the application configured.
+
+        Args:
+        -----------
+            handler: logging handler added to the "geometria.trace" logger, the
+                     records are formatted (with str) only if the handler writes them.
+            path: JSONL file, one JSON object per record (appended).
+            stream: text stream (like sys.stdout) where every record is written as a line.
+            callback: function called with every TraceRecord.
+            level: logging level of the records sent to the logger.
+    """
+    global enabled
+
+    if handler is not None:
+        logger.addHandler(handler)
+        _cleanup.append(lambda: logger.removeHandler(handler))
+
+    if (handler is not None) or ((path is None) and (stream is None) and (callback is None)):
+        if logger.getEffectiveLevel() > level:
+            logger.setLevel(level)
+        #the record is passed as an argument, so logging only formats it if it's handled
+        _sinks.append(lambda record: logger.log(level, "%s", record))
+
+    if path is not None:
+        file = open(path, "a")
+        _sinks.append(lambda record: file.write(record.to_json() + "\n"))
+        _cleanup.append(file.close)
+
+    if stream is not None:
+        _sinks.append(lambda record: stream.write(str(record) + "\n"))
+
+    if callback is not None:
+        _sinks.append(callback)
+
+    enabled = True
+
+def disable() -> None:
+    """
+        Disables the tracing, removes all the sinks and closes their files.
+    """
+    global enabled
+
+    enabled = False
+    _sinks.clear()
+    while _cleanup:
+        _cleanup.pop()()
+
+@contextmanager
+def traced(**kwargs) -> Iterator[None]:
+    """
+        Enables the tracing (with the arguments of enable) inside a with block.
+    """
+    enable(**kwargs)
+    try:
+        yield
+    finally:
+        disable()
@@ -0,0 +1,197 @@
+#standard dependencies
+import numpy as np
+from typing import Union, Tuple
+
+#custom dependencies
+from segment import IntersectionKind
+from segment_array import SegmentArray
+
+class UniformGrid():
+
+    # the grid never has more than this many cells per segment, so a too small
+    # cell size can't make it use more memory than the segments themselves
+    CELLS_PER_SEGMENT = 4
+
+    # the segments whose bounding box covers more cells than this are not put in
+    # the grid, they are compared with every segment (by their bounding boxes)
+    MAX_CELLS_PER_SEGMENT = 64
+
+    def __init__(self, segments: SegmentArray, cell_size: Union[float, None] = None) -> None:
+        """
+            Uniform grid (spatial hash) over a SegmentArray, used as a broad phase for
+            the intersections: every segment is put in the cells its bounding box covers,
+            and only the segments that share a cell are compared (with the same cases
+            as Segment.intersect). It is much faster than a sweep for many short segments,
+            but a long segment covers many cells, so it's not meant for long ones: the
+            segments that cover more than MAX_CELLS_PER_SEGMENT cells are kept apart (in
+            oversize), and compared with all the others.
+
+            Args:
+            -----------
+                segments: the segments.
+                cell_size: side of the square cells, by default the mean size of the
+                           bounding boxes of the segments (see default_cell_size).
+        """
+        self.segments = segments
+
+        bboxes = segments.bboxes
+        if len(segments) > 0:
+            self.origin = (float(bboxes[:, 0].min()), float(bboxes[:, 1].min()))
+            self.extent = (float(bboxes[:, 2].max()) - self.origin[0], float(bboxes[:, 3].max()) - self.origin[1])
+        else:
+            self.origin, self.extent = (0.0, 0.0), (0.0, 0.0)
+
+        if cell_size is None:
+            cell_size = UniformGrid.default_cell_size(segments)
+
+        #the number of cells is bounded, so the cells can't be too small
+        area = max(self.extent[0], 1e-12) * max(self.extent[1], 1e-12)
+        minimum = np.sqrt(area / (UniformGrid.CELLS_PER_SEGMENT * max(len(segments), 1)))
+        self.cell_size = float(max(cell_size, minimum, 1e-12))
+
+        self.shape = (int(self.extent[0] // self.cell_size) + 1, int(self.extent[1] // self.cell_size) + 1)
+
+        #the number of cells is computed with floats, so a huge one doesn't overflow
+        ix0, iy0, ix1, iy1 = self.cell_ranges(bboxes)
+        counts = (ix1 - ix0 + 1).astype(np.float64) * (iy1 - iy0 + 1)
+        self.oversize = np.flatnonzero(counts > UniformGrid.MAX_CELLS_PER_SEGMENT)
+
+    @staticmethod
+    def default_cell_size(segments: SegmentArray) -> float:
+        """
+            Mean of the largest side of the bounding boxes, so most segments
+            only cover a few cells.
+        """
+        if len(segments) == 0:
+            return 1.0
+
+        bboxes = segments.bboxes
+        sides = np.maximum(bboxes[:, 2] - bboxes[:, 0], bboxes[:, 3] - bboxes[:, 1])
+        return float(sides.mean())
+
+    def cell_ranges(self, bboxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+            The cells covered by every bounding box, as the ranges of cell
+            columns [ix0, ix1] and rows [iy0, iy1] (both included).
+        """
+        ix0 = np.floor((bboxes[:, 0] - self.origin[0]) / self.cell_size).astype(np.int64)
+        iy0 = np.floor((bboxes[:, 1] - self.origin[1]) / self.cell_size).astype(np.int64)
+        ix1 = np.floor((bboxes[:, 2] - self.origin[0]) / self.cell_size).astype(np.int64)
+        iy1 = np.floor((bboxes[:, 3] - self.origin[1]) / self.cell_size).astype(np.int64)
+        return ix0, iy0, ix1, iy1
+
+    def cell_entries(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            Every (cell, segment) pair of the grid, sorted by cell, without the oversize
+            segments. The cells are numbered column by column (cell = ix * rows + iy).
+
+            Returns:
+            -----------
+                cells: int64 array with the cell of every entry.
+                indices: int64 array with the segment of every entry.
+        """
+        ix0, iy0, ix1, iy1 = self.cell_ranges(self.segments.bboxes)
+        rows = iy1 - iy0 + 1
+        counts = (ix1 - ix0 + 1) * rows
+        counts[self.oversize] = 0
+
+        #every segment is repeated once per cell it covers
+        indices = np.repeat(np.arange(len(self.segments), dtype=np.int64), counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        offsets = np.arange(len(indices), dtype=np.int64) - first
+
+        ix = ix0[indices] + offsets // rows[indices]
+        iy = iy0[indices] + offsets % rows[indices]
+        cells = ix * self.shape[1] + iy
+
+        order = np.argsort(cells, kind="stable")
+        return cells[order], indices[order]
+
+    def oversize_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            The pairs of every oversize segment with the other segments whose bounding
+            boxes intersect its own (the pairs of two oversize segments only once).
+        """
+        bboxes = self.segments.bboxes
+        all_ii, all_jj = [], []
+        for i in self.oversize.tolist():
+            box = bboxes[i]
+            hit = ((bboxes[:, 0] <= box[2]) & (box[0] <= bboxes[:, 2]) &
+                   (bboxes[:, 1] <= box[3]) & (box[1] <= bboxes[:, 3]))
+            #the other oversize segment of a pair takes it (the one with the larger index)
+            hit[self.oversize[self.oversize <= i]] = False
+
+            jj = np.flatnonzero(hit)
+            all_ii.append(np.full(len(jj), i, dtype=np.int64))
+            all_jj.append(jj)
+
+        if len(all_ii) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(all_ii), np.concatenate(all_jj)
+
+    def candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            The pairs of segments (i < j) that share at least one cell, or where one
+            of them is oversize, and whose bounding boxes intersect (every pair only once).
+        """
+        cells, indices = self.cell_entries()
+
+        #start and size of the group of entries of every cell
+        starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+        sizes = np.diff(np.r_[starts, len(cells)])
+
+        all_ii, all_jj = [], []
+        #the cells with the same number of segments are paired all at once
+        for size in np.unique(sizes[sizes > 1]).tolist():
+            group = starts[sizes == size]
+            a, b = np.triu_indices(size, k=1)
+
+            all_ii.append(indices[group[:, None] + a[None, :]].ravel())
+            all_jj.append(indices[group[:, None] + b[None, :]].ravel())
+
+        #the oversize segments are not in the cells, they are paired by their bounding boxes
+        ii, jj = self.oversize_pairs()
+        all_ii.append(ii)
+        all_jj.append(jj)
+
+        if sum(len(ii) for ii in all_ii) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        ii, jj = np.concatenate(all_ii), np.concatenate(all_jj)
+        ii, jj = np.minimum(ii, jj), np.maximum(ii, jj)
+
+        #the segments that share many cells are paired many times
+        keys = np.unique(ii * len(self.segments) + jj)
+        ii, jj = keys // len(self.segments), keys % len(self.segments)
+
+        bbox_i, bbox_j = self.segments.bboxes[ii], self.segments.bboxes[jj]
+        overlap = ((bbox_i[:, 0] <= bbox_j[:, 2]) & (bbox_j[:, 0] <= bbox_i[:, 2]) &
+                   (bbox_i[:, 1] <= bbox_j[:, 3]) & (bbox_j[:, 1] <= bbox_i[:, 3]))
+        return ii[overlap], jj[overlap]
+
+    def pairwise_intersections(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+            Finds every pair of intersecting segments, with the same output
+            as SegmentArray.pairwise_intersections.
+
+            Returns:
+            -----------
+                pairs: (M, 2) int64 array with the indexes (i, j) of the intersecting
+                       segments, i < j, sorted.
+                points: (M, 2) array with the intersection points (for overlapping
+                        segments, the first point of the shared piece, in the Vector order).
+                kinds: int8 array with the IntersectionKind of every pair.
+        """
+        ii, jj = self.candidate_pairs()
+        if len(ii) == 0:
+            return np.empty((0, 2), dtype=np.int64), np.empty((0, 2)), np.empty(0, dtype=np.int8)
+
+        kinds, points = self.segments._classify_pairs(ii, jj)
+
+        #the candidates are already sorted by (i, j)
+        hit = kinds != IntersectionKind.NONE
+        return np.column_stack([ii[hit], jj[hit]]), points[hit], kinds[hit]
+
+    def __repr__(self) -> str:
+        return (f"UniformGrid({len(self.segments)} segments, {self.shape[0]}x{self.shape[1]} cells of {self.cell_size:.3g}, "
+                f"{len(self.oversize)} oversize)")
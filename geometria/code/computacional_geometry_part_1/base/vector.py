@@ -1,6 +1,8 @@
 import numpy as np 
 from typing import Union, List, Tuple
 
+from predicates import orient2d, orient2d_batch
+
 #we are using some new concepts to me, like:
 # - forward annotations, to use the class Vector before it's defined
 # - unpacking operator (*), to pass a variable number of arguments to a function
@@ -148,14 +150,30 @@ class Vector:
                 0: if the points are collinear
         """
 
-        # calculate the cross product between A and B (which are column vectors)
-        cross_product = np.cross((vector2 - vector1).vector.T, (vector3 - vector2).vector.T)
+        # the sign of the cross product between (vector2 - vector1) and (vector3 - vector2),
+        # computed with the filtered predicate, so it's exact even on almost collinear points
+        return orient2d(vector1[0], vector1[1], vector2[0], vector2[1], vector3[0], vector3[1])
 
-        # get direction, which is the sign of the cross product and determine if 
-        # the angle is convex or concave
-        direction = np.sign(cross_product)
+    @staticmethod
+    def calculate_turns(vectors1: np.ndarray, vectors2: np.ndarray, vectors3: np.ndarray) -> np.ndarray:
+
+        """
+            Batch version of calculate_turn, it classifies N walks in a single vectorized pass.
+            The i-th walk goes from vectors1[i] to vectors2[i] to vectors3[i].
 
-        return int(direction)
+            Input:
+                vectors1, vectors2, vectors3: arrays of shape (N, 2), PointSets or lists of Vectors
+            Output:
+                int8 array of N elements with 1 (left turn), -1 (right turn) or 0 (collinear)
+        """
+        from point_set import PointSet
+
+        a = PointSet.as_array(vectors1)
+        b = PointSet.as_array(vectors2)
+        c = PointSet.as_array(vectors3)
+
+        # sign of the cross product between (b - a) and (c - b), for every row
+        return orient2d_batch(a, b, c)
 
     #================================================
     #               Static methods
@@ -196,6 +214,12 @@ class Vector:
 
     @staticmethod
     def build_random_vectors(nvectors:int, minval = -10, maxval = 10) -> List['Vector']:
+
+        #if the scalar points are enabled, build them instead
+        from point import Point, scalar_points_enabled
+        if scalar_points_enabled():
+            return Point.build_random_vectors(nvectors, minval, maxval)
+
         vectors = []
         for i in range(nvectors):
             vectors.append(Vector(np.random.randint(minval, maxval, (2, 1))))
@@ -207,6 +231,11 @@ class Vector:
         """
             Casts a list of numpy arrays to a list of column vectors.
         """
+        #if the scalar points are enabled, build them instead
+        from point import Point, scalar_points_enabled
+        if scalar_points_enabled():
+            return Point.cast_to_vector(*vectors)
+
         #reshape the vectors to be column vectors
         vectors = [vector.reshape((2, 1)) for vector in vectors]
         return [Vector(vector) for vector in vectors]
@@ -5,10 +5,13 @@ import sys
 parent_dir = "/".join(__file__.split("/")[:-1])
 parent2_dir = "/".join(__file__.split("/")[:-2])
 #add the parent directory to the path
-sys.path.append(parent_dir)
 sys.path.append(parent2_dir)
+#base goes first, its modules (like plotter) have the same names as some of these
+import base
+sys.path.append(parent_dir)
 
 
 from .node import Node, Node1D, Node2D
 from .tree import Tree
+from .avl_tree import AVLTree
 from .plotter import TreePlotter
\ No newline at end of file
@@ -0,0 +1,317 @@
+from typing import Union, List
+from node import Node, Node1D, Node2D
+from tree import Tree
+
+class AVLTree(Tree):
+
+    def __init__(self,
+                 values: List[Union[float, Node1D, Node2D]] = None,
+                 sorted: bool = False,
+                 dimension: int = 1,
+                 need_cast: bool = False):
+
+        """
+            Self balancing (AVL) version of Tree. Every node knows its parent
+            and the height of its subtree, so the tree can insert and delete nodes,
+            and move to the predecessor or successor of a node, in O(log n),
+            without recursion.
+
+            The nodes are compared with the same operators as in Tree, and as in
+            Tree.normal_insert a node equal to another one goes to its left.
+
+            Args:
+            --------------
+                values: list of values to be inserted in the tree (it can be empty).
+                sorted: if the values are already sorted, then the tree is built in O(n).
+                dimension: dimension of the values. It can be 1 or 2.
+                need_cast: if the values are not nodes, cast them to nodes.
+        """
+        #number of rotations and of builds from the whole list (see RunStats)
+        self.rotations = 0
+        self.rebuilds = 0
+
+        super().__init__([] if values is None else values, sorted=True, dimension=dimension, need_cast=need_cast)
+
+        self.root = None
+        self.size = 0
+        self.sorted = sorted
+
+        if sorted:
+            self.root = AVLTree.build_balanced(self.list_of_nodes, 0, len(self.list_of_nodes), None)
+            self.size = len(self.list_of_nodes)
+        else:
+            for node in self.list_of_nodes:
+                self.insert(node)
+
+    def build(self) -> None:
+        """
+            Builds the tree from the list of nodes.
+        """
+        self.root = None
+        self.size = 0
+        self.rebuilds += 1
+
+        for node in self.list_of_nodes:
+            self.insert(node)
+
+    def build_from_sorted_list(self, sorted_list: List[Union[Node1D, Node2D]]) -> 'AVLTree':
+        """
+            Builds a new balanced tree from an ordered list, in O(n).
+        """
+        return AVLTree(sorted_list, sorted=True, dimension=self.dimension)
+
+    @staticmethod
+    def build_balanced(sorted_list: list, start: int, end: int, parent: Node) -> Union[Node1D, Node2D]:
+        """
+            Builds a perfectly balanced subtree with the nodes sorted_list[start:end].
+        """
+        if start >= end:
+            return None
+
+        middle = (start + end) // 2
+        root = sorted_list[middle]
+        root.parent = parent
+
+        root.left = AVLTree.build_balanced(sorted_list, start, middle, root)
+        root.right = AVLTree.build_balanced(sorted_list, middle + 1, end, root)
+        AVLTree.update_height(root)
+
+        return root
+
+    #================================================
+    #               Balance helpers
+    #================================================
+
+    @staticmethod
+    def height(node: Node) -> int:
+        return 0 if node is None else node.height
+
+    @staticmethod
+    def update_height(node: Node) -> None:
+        node.height = 1 + max(AVLTree.height(node.left), AVLTree.height(node.right))
+
+    @staticmethod
+    def balance_factor(node: Node) -> int:
+        return AVLTree.height(node.left) - AVLTree.height(node.right)
+
+    def replace_child(self, parent: Node, old: Node, new: Node) -> None:
+        """
+            Puts new where old was, as a child of parent (or as the root).
+        """
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+        if new is not None:
+            new.parent = parent
+
+    def rotate_left(self, node: Node) -> Node:
+        self.rotations += 1
+        pivot = node.right
+
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+
+        self.replace_child(node.parent, node, pivot)
+        pivot.left = node
+        node.parent = pivot
+
+        AVLTree.update_height(node)
+        AVLTree.update_height(pivot)
+        return pivot
+
+    def rotate_right(self, node: Node) -> Node:
+        self.rotations += 1
+        pivot = node.left
+
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+
+        self.replace_child(node.parent, node, pivot)
+        pivot.right = node
+        node.parent = pivot
+
+        AVLTree.update_height(node)
+        AVLTree.update_height(pivot)
+        return pivot
+
+    def rebalance(self, node: Node) -> None:
+        """
+            Walks from node up to the root, updating the heights and
+            rotating the unbalanced nodes.
+        """
+        while node is not None:
+            AVLTree.update_height(node)
+            balance = AVLTree.balance_factor(node)
+
+            if balance > 1:
+                if AVLTree.balance_factor(node.left) < 0:
+                    self.rotate_left(node.left)
+                node = self.rotate_right(node)
+
+            elif balance < -1:
+                if AVLTree.balance_factor(node.right) > 0:
+                    self.rotate_right(node.right)
+                node = self.rotate_left(node)
+
+            node = node.parent
+
+    #================================================
+    #               Insert and delete
+    #================================================
+
+    def insert(self, node: Union[Node1D, Node2D]) -> Union[Node1D, Node2D]:
+        """
+            Inserts a node in the tree, and returns it (so it can be used as a handle).
+        """
+        node.left = None
+        node.right = None
+        node.parent = None
+        node.height = 1
+        self.size += 1
+
+        if self.root is None:
+            self.root = node
+            return node
+
+        current = self.root
+        while True:
+            #if the node is greater than the current one, it goes to the right
+            if current < node:
+                if current.right is None:
+                    current.right = node
+                    break
+                current = current.right
+
+            #if it's less than or equal, it goes to the left
+            else:
+                if current.left is None:
+                    current.left = node
+                    break
+                current = current.left
+
+        node.parent = current
+        self.rebalance(current)
+        return node
+
+    def delete(self, node: Union[Node1D, Node2D]) -> None:
+        """
+            Removes the given node from the tree (the node itself, not a node
+            equal to it, so it works even if there are repeated values).
+        """
+        if node.left is None:
+            start = node.parent
+            self.replace_child(node.parent, node, node.right)
+
+        elif node.right is None:
+            start = node.parent
+            self.replace_child(node.parent, node, node.left)
+
+        else:
+            #the successor takes the place of the node
+            successor = AVLTree.subtree_minimum(node.right)
+
+            if successor.parent is not node:
+                start = successor.parent
+                self.replace_child(successor.parent, successor, successor.right)
+                successor.right = node.right
+                successor.right.parent = successor
+            else:
+                start = successor
+
+            self.replace_child(node.parent, node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+
+        node.left = None
+        node.right = None
+        node.parent = None
+        node.height = 1
+        self.size -= 1
+
+        self.rebalance(start)
+
+    #================================================
+    #               Navigation
+    #================================================
+
+    @staticmethod
+    def subtree_minimum(node: Node) -> Node:
+        while node.left is not None:
+            node = node.left
+        return node
+
+    @staticmethod
+    def subtree_maximum(node: Node) -> Node:
+        while node.right is not None:
+            node = node.right
+        return node
+
+    def minimum(self) -> Union[Node1D, Node2D, None]:
+        return None if self.root is None else AVLTree.subtree_minimum(self.root)
+
+    def maximum(self) -> Union[Node1D, Node2D, None]:
+        return None if self.root is None else AVLTree.subtree_maximum(self.root)
+
+    def predecessor(self, node: Union[Node1D, Node2D]) -> Union[Node1D, Node2D, None]:
+        """
+            The node just before node in the inorder, or None if it's the first one.
+        """
+        if node.left is not None:
+            return AVLTree.subtree_maximum(node.left)
+
+        parent = node.parent
+        while parent is not None and node is parent.left:
+            node = parent
+            parent = parent.parent
+        return parent
+
+    def successor(self, node: Union[Node1D, Node2D]) -> Union[Node1D, Node2D, None]:
+        """
+            The node just after node in the inorder, or None if it's the last one.
+        """
+        if node.right is not None:
+            return AVLTree.subtree_minimum(node.right)
+
+        parent = node.parent
+        while parent is not None and node is parent.right:
+            node = parent
+            parent = parent.parent
+        return parent
+
+    def lower(self, probe: Union[Node1D, Node2D]) -> Union[Node1D, Node2D, None]:
+        """
+            The greatest node that is strictly less than probe (which doesn't
+            need to be in the tree), or None if there is no such node.
+        """
+        current, best = self.root, None
+
+        while current is not None:
+            if current < probe:
+                best = current
+                current = current.right
+            else:
+                current = current.left
+        return best
+
+    def higher(self, probe: Union[Node1D, Node2D]) -> Union[Node1D, Node2D, None]:
+        """
+            The least node that is strictly greater than probe, or None if there is no such node.
+        """
+        current, best = self.root, None
+
+        while current is not None:
+            if current > probe:
+                best = current
+                current = current.left
+            else:
+                current = current.right
+        return best
+
+    def __len__(self) -> int:
+        return self.size
@@ -16,6 +16,10 @@ class Node(ABC):
         self.right = None
         self.extra = None
 
+        #used by the self balancing trees
+        self.parent = None
+        self.height = 1
+
     def __repr__(self):
         return f"Node({self.value})"
 
@@ -56,6 +60,10 @@ class Node1D(Node):
         #like a segment, a point, etc.
         self.extra = None
 
+        #used by the self balancing trees
+        self.parent = None
+        self.height = 1
+
     #=====================================
     #       order comparison methods
     #=====================================
@@ -92,6 +100,10 @@ class Node2D(Node):
             self.value = value
             self.left = None
             self.right = None
+
+            #used by the self balancing trees
+            self.parent = None
+            self.height = 1
     
         #=====================================
         #       order comparison methods
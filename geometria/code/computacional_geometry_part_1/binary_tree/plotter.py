@@ -9,17 +9,15 @@ class TreePlotter:
     @staticmethod
     def plot(tree: Tree, filename: str = 'tree'):
         dot = graphviz.Digraph()
-        dot.node(str(tree.root.value))
 
-        def add_nodes_edges(node):
-            if node.left:
-                dot.node(str(node.left.value))
-                dot.edge(str(node.value), str(node.left.value))
-                add_nodes_edges(node.left)
-            if node.right:
-                dot.node(str(node.right.value))
-                dot.edge(str(node.value), str(node.right.value))
-                add_nodes_edges(node.right)
+        #every node adds itself and the edges to its childs,
+        #the traversal is iterative so big trees can be plotted too
+        for node in tree.iter_inorder():
+            dot.node(str(node.value))
 
-        add_nodes_edges(tree.root)
-        dot.render(filename, view=True, format='png')
\ No newline at end of file
+            for child in (node.left, node.right):
+                if child is not None:
+                    dot.node(str(child.value))
+                    dot.edge(str(node.value), str(child.value))
+
+        dot.render(filename, view=True, format='png')
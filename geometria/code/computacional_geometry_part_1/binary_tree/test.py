@@ -0,0 +1,88 @@
+import bisect
+import unittest
+import numpy as np
+from avl_tree import AVLTree
+from node import Node1D
+
+class TestAVLTree(unittest.TestCase):
+
+    def check_invariants(self, tree: AVLTree, values: list):
+        """
+            Heights, balance, parent links and inorder of the whole tree.
+        """
+        stack = [tree.root] if tree.root is not None else []
+        if tree.root is not None:
+            self.assertIsNone(tree.root.parent)
+
+        while stack:
+            node = stack.pop()
+            for child in (node.left, node.right):
+                if child is not None:
+                    self.assertIs(child.parent, node)
+                    stack.append(child)
+
+            self.assertEqual(node.height, 1 + max(AVLTree.height(node.left), AVLTree.height(node.right)))
+            self.assertLessEqual(abs(AVLTree.balance_factor(node)), 1)
+
+        self.assertEqual([node.value for node in tree.inorder()], sorted(values))
+        self.assertEqual(len(tree), len(values))
+
+    def test_random_inserts_and_deletes(self):
+        rng = np.random.default_rng(8)
+        tree, nodes = AVLTree(), []
+
+        for step in range(600):
+            #more inserts than deletes, with repeated values
+            if nodes and rng.random() < 0.4:
+                tree.delete(nodes.pop(int(rng.integers(len(nodes)))))
+            else:
+                nodes.append(tree.insert(Node1D(int(rng.integers(0, 50)))))
+
+            if step % 20 == 0:
+                self.check_invariants(tree, [node.value for node in nodes])
+
+        self.check_invariants(tree, [node.value for node in nodes])
+
+    def test_navigation(self):
+        rng = np.random.default_rng(9)
+        values = sorted(rng.choice(1000, 200, replace=False).tolist())
+        tree = AVLTree(Node1D.cast_to_nodes(values), sorted=True)
+        self.check_invariants(tree, values)
+
+        #walking with successor and predecessor gives the inorder
+        node, forward = tree.minimum(), []
+        while node is not None:
+            forward.append(node.value)
+            node = tree.successor(node)
+        self.assertEqual(forward, values)
+
+        node, backward = tree.maximum(), []
+        while node is not None:
+            backward.append(node.value)
+            node = tree.predecessor(node)
+        self.assertEqual(backward, values[::-1])
+
+        for probe in range(-1, 1001, 7):
+            below = bisect.bisect_left(values, probe)
+            above = bisect.bisect_right(values, probe)
+
+            lower, higher = tree.lower(Node1D(probe)), tree.higher(Node1D(probe))
+            self.assertEqual(None if lower is None else lower.value, values[below - 1] if below > 0 else None)
+            self.assertEqual(None if higher is None else higher.value, values[above] if above < len(values) else None)
+
+    def test_delete_until_empty(self):
+        values = list(range(64))
+        tree = AVLTree(Node1D.cast_to_nodes(values), sorted=True)
+        nodes = tree.inorder()
+
+        #deleting the root every time exercises the case with two children
+        while tree.root is not None:
+            values.remove(tree.root.value)
+            tree.delete(tree.root)
+            self.check_invariants(tree, values)
+
+        self.assertIsNone(tree.minimum())
+        self.assertEqual(len(nodes), 64)
+
+if __name__ == '__main__':
+    unittest.main()
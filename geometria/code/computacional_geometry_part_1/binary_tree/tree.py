@@ -1,4 +1,4 @@
-from typing import Union, List
+from typing import Union, List, Iterator
 from node import Node, Node1D, Node2D 
 
 class Tree():
@@ -65,7 +65,78 @@ class Tree():
             and returns the list of Nodes in ascending order, following 
             the order overloads of the Node class.
         """
-        return Tree.inorder_recursion(self.root)
+        return list(self.iter_inorder())
+
+    def iter_inorder(self) -> Iterator[Union[Node1D, Node2D]]:
+        """
+            Generator that yields the nodes in ascending order, 
+            it uses an explicit stack, so there is no recursion.
+        """
+        return Tree.iter_subtree(self.root)
+
+    def iter_reversed(self) -> Iterator[Union[Node1D, Node2D]]:
+        """
+            Generator that yields the nodes in descending order.
+        """
+        stack = []
+        node = self.root
+
+        while stack or (node is not None):
+            if node is not None:
+                stack.append(node)
+                node = node.right
+            else:
+                node = stack.pop()
+                yield node
+                node = node.left
+
+    def iter_range(self, lo = None, hi = None) -> Iterator[Union[Node1D, Node2D]]:
+        """
+            Generator that yields, in ascending order, the nodes between lo and hi
+            (both included). The subtrees that are out of the range are never visited.
+
+            Args:
+            --------------
+                lo, hi: bounds of the range, they can be nodes or values
+                        (values are cast to nodes), None means there is no bound.
+        """
+        lo = self.as_probe(lo)
+        hi = self.as_probe(hi)
+
+        stack = []
+        node = self.root
+
+        while stack or (node is not None):
+            if node is not None:
+                #the node and its left subtree are below the range
+                if (lo is not None) and (node < lo):
+                    node = node.right
+                    continue
+
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+
+                #every node from here on is above the range
+                if (hi is not None) and (node > hi):
+                    return
+
+                yield node
+                node = node.right
+
+    def as_probe(self, value) -> Union[Node1D, Node2D, None]:
+        """
+            Casts a value to a node of the tree dimension, so it can be compared 
+            with the nodes of the tree. Nodes and None are returned as they are.
+        """
+        #duck typing, the nodes may come from 'node' or 'binary_tree.node'
+        if (value is None) or hasattr(value, "left"):
+            return value
+
+        if self.dimension == 1:
+            return Node1D(value)
+        return Node2D(value)
 
     def insert(self, node: Union[Node1D, Node2D]) -> None:
         """
@@ -108,18 +179,33 @@ class Tree():
     @staticmethod
     def inorder_recursion(root: Node) -> List[Union[Node1D, Node2D]]:
         """
-            Reads the tree in inorder.
+            Reads the subtree of root in inorder.
             and returns the list of Nodes in ascending order, following 
-            the order overloads of the Node class.
+            the order overloads of the Node class. 
+            (it keeps its old name, but it's iterative now, see iter_subtree)
         """
+        return list(Tree.iter_subtree(root))
 
-        if root is None:
-            return []
+    @staticmethod
+    def iter_subtree(root: Node) -> Iterator[Union[Node1D, Node2D]]:
+        """
+            Generator that yields the nodes of the subtree of root in ascending order,
+            with an explicit stack instead of recursion.
+        """
+        stack = []
+        node = root
 
-        if root.left is None and root.right is None:
-            return [root,]
+        while stack or (node is not None):
+            #go as left as possible, remembering the path
+            if node is not None:
+                stack.append(node)
+                node = node.left
 
-        return Tree.inorder_recursion(root.left) + [root,] + Tree.inorder_recursion(root.right)
+            #then visit the node and continue with its right subtree
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
     
 
     @staticmethod
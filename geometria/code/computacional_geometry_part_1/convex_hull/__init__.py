@@ -9,4 +9,10 @@ sys.path.append(parent_dir)
 sys.path.append(parent2_dir)
 
 
-from convex_hull_graham import ConvexHullGraham
\ No newline at end of file
+from convex_hull_graham import ConvexHullGraham
+from monotone_chain import ConvexHullMonotoneChain
+from akl_toussaint import AklToussaintHull, akl_toussaint_filter
+from chan import ConvexHullChan
+from quickhull import ConvexHullQuickhull
+from parallel_hull import ParallelConvexHull
+from dynamic_hull import DynamicConvexHull
@@ -0,0 +1,102 @@
+import os, sys
+import numpy as np
+from typing import Union, List, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base import Vector, PointSet
+from monotone_chain import ConvexHullMonotoneChain, hull_vectors, side_of_line
+
+def octagon_indices(points: np.ndarray) -> np.ndarray:
+    """
+        The extreme points in eight directions (the smallest and largest x, y, x + y
+        and x - y), counter clockwise from the leftmost one, without repetitions.
+    """
+    xs, ys = points[:, 0], points[:, 1]
+    extremes = [np.argmin(xs), np.argmin(xs + ys), np.argmin(ys), np.argmax(xs - ys),
+                np.argmax(xs), np.argmax(xs + ys), np.argmax(ys), np.argmin(xs - ys)]
+
+    octagon = []
+    for index in extremes:
+        #two directions can share their extreme point (or have an equal one)
+        if octagon and (points[index] == points[octagon[-1]]).all():
+            continue
+        octagon.append(int(index))
+    if len(octagon) > 1 and (points[octagon[0]] == points[octagon[-1]]).all():
+        octagon.pop()
+
+    return np.array(octagon, dtype=np.int64)
+
+def akl_toussaint_filter(points: Union[List[Vector], PointSet, np.ndarray]) -> Tuple[np.ndarray, float]:
+    """
+        Akl-Toussaint heuristic: the points strictly inside the polygon of the extreme
+        points in eight directions can't be hull vertices, so they are discarded with
+        one vectorized orientation test per edge. The points whose float orientation
+        isn't certain are kept.
+
+        Returns:
+        -----------
+            The indexes of the points that survive the filter, and the pruning ratio
+            (the fraction of the points that were discarded).
+    """
+    array = PointSet.as_array(points)
+    if len(array) == 0:
+        return np.empty(0, dtype=np.int64), 0.0
+
+    octagon = octagon_indices(array)
+    #the extremes are collinear, nothing is strictly inside
+    if len(octagon) < 3:
+        return np.arange(len(array), dtype=np.int64), 0.0
+
+    inside = np.ones(len(array), dtype=bool)
+    for a, b in zip(octagon, np.roll(octagon, -1)):
+        inside &= side_of_line(array, array[a], array[b]) == 1
+
+    survivors = np.flatnonzero(~inside)
+    return survivors, float(inside.sum()) / len(array)
+
+class AklToussaintHull:
+
+    def __init__(self, engine = None):
+        """
+            Runs a hull algorithm only over the points that survive the Akl-Toussaint
+            filter (see akl_toussaint_filter). On uniform or gaussian clouds most of the
+            points are inside the octagon of the extreme points, so the hull algorithm
+            gets only a few of them.
+
+            Args:
+            -----------
+                engine: the hull algorithm, anything with a convex_hull method like
+                        ConvexHullGraham or ConvexHullJarvis (ConvexHullMonotoneChain
+                        by default).
+        """
+        self.engine = engine if engine is not None else ConvexHullMonotoneChain()
+        self.pruning_ratio : float = None
+
+    def hull_indices(self, points: Union[List[Vector], PointSet, np.ndarray],
+                     return_ratio: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, float]]:
+        """
+            The indexes of the hull vertices in the input, for the engines that
+            have hull_indices (like ConvexHullMonotoneChain).
+        """
+        array = PointSet.as_array(points)
+        survivors, self.pruning_ratio = akl_toussaint_filter(array)
+
+        indices = survivors[self.engine.hull_indices(array[survivors])]
+        return (indices, self.pruning_ratio) if return_ratio else indices
+
+    def convex_hull(self, points: Union[List[Vector], PointSet, np.ndarray],
+                    return_ratio: bool = False) -> Union[List[Vector], Tuple[List[Vector], float]]:
+        """
+            Computes the convex hull with the engine, over the surviving points, with
+            the same output as the engine.
+
+            Returns:
+            -----------
+                The hull vertices (and the pruning ratio if return_ratio is True).
+        """
+        survivors, self.pruning_ratio = akl_toussaint_filter(points)
+
+        #the engines that read lists of Vectors get the surviving ones
+        #(a new list, Jarvis removes the points it wraps)
+        hull = self.engine.convex_hull(hull_vectors(points, survivors))
+        return (hull, self.pruning_ratio) if return_ratio else hull
@@ -0,0 +1,59 @@
+import sys
+import time
+import numpy as np
+from matplotlib import pyplot as plt
+
+from convex_hull_graham import ConvexHullGraham
+from convex_hull_jarvis import ConvexHullJarvis
+from monotone_chain import ConvexHullMonotoneChain
+from chan import ConvexHullChan
+from base import PointSet
+
+# Chan's algorithm against the other engines, on normally distributed points
+# (a hull with a few vertices, h << n) and on points over a circle (every point
+# is a vertex, h = n), from 10^3 to 10^6 points (or 10^k with
+# "python benchmark_chan.py k"). Graham only runs up to 10^4 points, Jarvis
+# while n * h is up to 10^7, and the circle only up to 10^4 points (Chan does
+# a numpy step per vertex there).
+
+np.random.seed(69)
+SLOW_MAX = 10**4
+JARVIS_MAX_WORK = 10**7
+CIRCLE_MAX = 10**4
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+def circle(npoints: int) -> np.ndarray:
+    angles = np.random.uniform(0, 2 * np.pi, npoints)
+    return np.c_[np.cos(angles), np.sin(angles)]
+
+max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+monotone = ConvexHullMonotoneChain()
+chan = ConvexHullChan()
+
+print(f"{'cloud':>8} {'n':>9} {'h':>7} {'guesses':>14} {'chan (s)':>9} {'monotone (s)':>13} {'graham (s)':>11} {'jarvis (s)':>11}")
+for cloud, generate in (("normal", lambda n: np.random.normal(size=(n, 2))), ("circle", circle)):
+    for exponent in range(3, max_exponent + 1):
+        npoints = 10**exponent
+        if cloud == "circle" and npoints > CIRCLE_MAX:
+            break
+        points = generate(npoints)
+
+        chan_time = timed(chan.hull_indices, points)
+        monotone_time = timed(monotone.hull_indices, points)
+        nvertices = len(monotone.hull_indices(points))
+        guesses = ",".join(map(str, chan.guesses))
+
+        graham_time = jarvis_time = float("nan")
+        if npoints <= SLOW_MAX:
+            vectors = PointSet(points).to_vectors()
+            graham_time = timed(ConvexHullGraham().convex_hull, vectors)
+            if npoints * nvertices <= JARVIS_MAX_WORK:
+                jarvis_time = timed(ConvexHullJarvis().convex_hull, list(vectors))
+            plt.close("all")
+
+        print(f"{cloud:>8} {npoints:>9} {nvertices:>7} {guesses:>14} {chan_time:>9.4f} {monotone_time:>13.4f} "
+              f"{graham_time:>11.4f} {jarvis_time:>11.4f}")
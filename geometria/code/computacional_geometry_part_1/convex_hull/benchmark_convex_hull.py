@@ -0,0 +1,56 @@
+import sys
+import time
+import numpy as np
+from matplotlib import pyplot as plt
+
+from convex_hull_graham import ConvexHullGraham
+from convex_hull_jarvis import ConvexHullJarvis
+from monotone_chain import ConvexHullMonotoneChain
+from akl_toussaint import AklToussaintHull
+from quickhull import ConvexHullQuickhull
+from base import PointSet
+
+# Time of the hull of n normally distributed points, from 10^3 to 10^7 points (or
+# 10^k with "python benchmark_convex_hull.py k"). Graham groups the equal slopes
+# with a scan per point and Jarvis wraps with O(n) list removals, so both are
+# quadratic here and only run up to 10^4 points. The monotone chain and Quickhull
+# get the (N, 2) array directly, Graham and Jarvis a list of Vectors (not timed).
+# The akl columns run the Akl-Toussaint filter first, so Graham only gets the points
+# outside the octagon of the extreme points (and runs at every size).
+
+np.random.seed(69)
+SLOW_MAX = 10**4
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+monotone = ConvexHullMonotoneChain()
+quickhull = ConvexHullQuickhull()
+akl_monotone = AklToussaintHull(monotone)
+akl_graham = AklToussaintHull(ConvexHullGraham())
+
+print(f"{'n':>9} {'h':>4} {'monotone (s)':>13} {'quickhull (s)':>14} {'graham (s)':>11} {'jarvis (s)':>11} "
+      f"{'pruned':>8} {'akl+monotone (s)':>17} {'akl+graham (s)':>15}")
+for exponent in range(3, max_exponent + 1):
+    npoints = 10**exponent
+    points = np.random.normal(size=(npoints, 2))
+
+    monotone_time = timed(monotone.hull_indices, points)
+    nvertices = len(monotone.hull_indices(points))
+    quickhull_time = timed(quickhull.hull_indices, points)
+
+    akl_monotone_time = timed(akl_monotone.hull_indices, points)
+    akl_graham_time = timed(akl_graham.convex_hull, points)
+
+    graham_time = jarvis_time = float("nan")
+    if npoints <= SLOW_MAX:
+        vectors = PointSet(points).to_vectors()
+        graham_time = timed(ConvexHullGraham().convex_hull, vectors)
+        jarvis_time = timed(ConvexHullJarvis().convex_hull, list(vectors))
+        plt.close("all")
+
+    print(f"{npoints:>9} {nvertices:>4} {monotone_time:>13.4f} {quickhull_time:>14.4f} {graham_time:>11.4f} {jarvis_time:>11.4f} "
+          f"{akl_monotone.pruning_ratio:>8.4f} {akl_monotone_time:>17.4f} {akl_graham_time:>15.4f}")
@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+import numpy as np
+
+from parallel_hull import ParallelConvexHull
+
+# Stages of the parallel hull of 10^7 normally distributed points read from a
+# .npy file (10^k with "python benchmark_parallel_hull.py k"), with 1, 2, 4, ...
+# workers up to the number of cores, and both merges. The speedup is the one of
+# the chunk hulls against a single worker (loading the file is sequential).
+
+np.random.seed(69)
+
+exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+npoints = 10**exponent
+
+cores = os.cpu_count()
+workers = sorted({min(2**k, cores) for k in range(cores.bit_length() + 1)})
+
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "points.npy")
+    np.save(path, np.random.normal(size=(npoints, 2)))
+
+    print(f"{npoints} points, {cores} cores")
+    print(f"{'merge':>9} {'workers':>8} {'load (s)':>9} {'pool (s)':>9} {'chunks (s)':>11} "
+          f"{'merge (s)':>10} {'total (s)':>10} {'speedup':>8}")
+
+    for merge in ("union", "pairwise"):
+        baseline = None
+        for nworkers in workers:
+            _, stats = ParallelConvexHull(nworkers, merge=merge).hull_indices(path, return_stats=True)
+            timers = stats.timers
+
+            baseline = baseline or timers["chunk_hulls"]
+            print(f"{merge:>9} {nworkers:>8} {timers['load']:>9.4f} {timers['pool']:>9.4f} "
+                  f"{timers['chunk_hulls']:>11.4f} {timers['merge']:>10.4f} {stats.wall_time:>10.4f} "
+                  f"{baseline / timers['chunk_hulls']:>8.2f}")
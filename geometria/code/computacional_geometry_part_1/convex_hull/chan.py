@@ -0,0 +1,316 @@
+import os, sys
+import numpy as np
+from typing import Union, List, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base import Vector, PointSet
+from base.predicates import orient2d, orient2d_batch
+from monotone_chain import ConvexHullMonotoneChain, hull_vectors, side_of_line
+
+#groups up to this size get their chains in lockstep (one numpy step per position
+#for all the groups), the bigger ones are computed group by group with the engine
+LOCKSTEP_MAX = 1024
+
+#candidates whose angle is this close to the smallest one are compared exactly
+ANGLE_TOLERANCE = 1e-9
+
+def lockstep_lower_chains(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+        The lower chains of many groups at once, with the same rule as the monotone
+        chain (pop while the last two vertices and the new point don't make a left
+        turn), but every step is done for all the groups with numpy.
+
+        The lower chain of a group is below the segments from its first point to its
+        lowest point and from there to its last point, so the points strictly above
+        both are dropped before, and the rest are moved to the front of their row.
+
+        Args:
+        -----------
+            points: (G, m, 2) array, the points of every group sorted by x (and y).
+
+        Returns:
+        -----------
+            (G, m) array with the positions of the vertices of every chain (only the
+            first sizes[g] of the row g are used), and the sizes.
+    """
+    ngroups, size, _ = points.shape
+    rows = np.arange(ngroups)
+    flat = points.reshape((-1, 2))
+
+    first, last = points[:, 0], points[:, -1]
+    lowest = points[rows, np.argmin(points[:, :, 1], axis=1)]
+    first, lowest, last = [ends.repeat(size, axis=0) for ends in (first, lowest, last)]
+    keep = (side_of_line(flat, first, lowest) <= 0) | (side_of_line(flat, lowest, last) <= 0)
+    keep = keep.reshape((ngroups, size))
+
+    #the kept points first, still sorted
+    counts = keep.sum(axis=1)
+    positions = np.argsort(~keep, axis=1, kind="stable")[:, :counts.max()]
+    offsets = rows * size
+
+    stack = np.zeros((ngroups, size), dtype=np.int64)
+    sizes = np.zeros(ngroups, dtype=np.int64)
+
+    for k in range(positions.shape[1]):
+        current = rows[counts > k]
+        c = flat[offsets[current] + positions[current, k]]
+
+        #only the groups that popped in the last iteration can pop again
+        popping, candidates = current, c
+        while True:
+            deep = sizes[popping] >= 2
+            popping, candidates = popping[deep], candidates[deep]
+            if len(popping) == 0:
+                break
+
+            a = flat[offsets[popping] + stack[popping, sizes[popping] - 2]]
+            b = flat[offsets[popping] + stack[popping, sizes[popping] - 1]]
+            turns = orient2d_batch(a, b, candidates) <= 0
+            popping, candidates = popping[turns], candidates[turns]
+            sizes[popping] -= 1
+
+        stack[current, sizes[current]] = positions[current, k]
+        sizes[current] += 1
+
+    return stack, sizes
+
+def pad_chains(chains: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+        Stacks chains of different sizes in one (G, L) array, and their sizes.
+    """
+    sizes = np.array([len(chain) for chain in chains], dtype=np.int64)
+    padded = np.zeros((len(chains), sizes.max()), dtype=np.int64)
+    for g, chain in enumerate(chains):
+        padded[g, :len(chain)] = chain
+    return padded, sizes
+
+class ConvexHullChan:
+
+    def __init__(self, engine = None, first_guess: int = 256):
+        """
+            Implements Chan's algorithm, which is O(n log h) for a hull with h vertices.
+            For a guess m of h the points are split in groups of m, the hull of every
+            group is computed, and the hull is wrapped as in Jarvis, but the next vertex
+            of every group hull is found with a binary search (a tangent query), so
+            every step is O(n/m log m). If the hull has more than m vertices the wrap is
+            stopped after m steps and the guess is squared.
+
+            The groups hulls are kept as their lower and upper chains. The wrap goes
+            along the lower hull, from the smallest point (by x, and y) to the biggest
+            one, and then along the upper hull, which is the lower hull of the points
+            rotated 180 degrees, so both halves use the same tangent query.
+
+            The hull has the same contract as ConvexHullGraham.convex_hull: counter
+            clockwise, starting at the point with the smallest x (and smallest y),
+            without collinear or repeated points.
+
+            Args:
+            -----------
+                engine: algorithm for the hulls of the big groups (more than
+                        LOCKSTEP_MAX points), anything with a hull_indices method
+                        (ConvexHullMonotoneChain by default).
+                first_guess: the first guess of h. With 4 the guesses are the ones of
+                        the paper (2^2^t), but every failed round costs O(n) numpy
+                        work, so by default the hulls with up to 256 vertices are
+                        found in the first round.
+        """
+        if first_guess < 2:
+            raise ValueError(f"The first guess should be at least 2, yet is: {first_guess}")
+
+        self.engine = engine if engine is not None else ConvexHullMonotoneChain()
+        self.first_guess = first_guess
+        #the guesses of h tried in the last run
+        self.guesses : List[int] = []
+
+    #========================================
+    #           Small subroutines
+    #========================================
+    def group_chains(self, points: np.ndarray, size: int) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        """
+            Splits the points in groups of size points, and computes their hulls.
+
+            Returns:
+            -----------
+                The lower chains and the upper chains, each one as a (G, L) array
+                of indexes of the points and the sizes of the chains. The upper
+                chains go from the biggest point to the smallest one.
+        """
+        npoints = len(points)
+        ngroups = -(-npoints // size)
+
+        if size <= LOCKSTEP_MAX:
+            #the last group is filled with copies of its last point
+            groups = np.minimum(np.arange(ngroups * size), npoints - 1).reshape((ngroups, size))
+            order = np.lexsort((points[groups, 1], points[groups, 0]), axis=1)
+            groups = np.take_along_axis(groups, order, axis=1)
+
+            lower, lower_sizes = lockstep_lower_chains(points[groups])
+            upper, upper_sizes = lockstep_lower_chains(-points[groups[:, ::-1]])
+
+            lower = np.take_along_axis(groups, lower, axis=1)
+            upper = np.take_along_axis(groups[:, ::-1], upper, axis=1)
+            return (lower, lower_sizes), (upper, upper_sizes)
+
+        lowers, uppers = [], []
+        for start in range(0, npoints, size):
+            hull = start + self.engine.hull_indices(points[start:start + size])
+
+            #the hull is counter clockwise from the smallest point, so it's the
+            #lower chain up to the biggest point, and the upper chain back
+            last = int(np.lexsort((points[hull, 1], points[hull, 0]))[-1])
+            lowers.append(hull[:last + 1])
+            uppers.append(np.r_[hull[last:], hull[:1]])
+
+        return pad_chains(lowers), pad_chains(uppers)
+
+    def tangents(self, points: np.ndarray, chains: np.ndarray, sizes: np.ndarray, p: np.ndarray) -> np.ndarray:
+        """
+            Tangent queries from p to every lower chain: the vertex v, among the ones
+            bigger than p (by x, and y), such that no vertex of the chain is to the
+            right of the line p->v (the farthest one if several are collinear).
+
+            Both searches are binary searches done at once for all the chains. The
+            vertices bigger than p are a suffix of the chain, and in that suffix the
+            next vertex is to the left of p->v from the tangent onwards, because the
+            slopes of the edges of a lower chain increase.
+
+            Returns:
+            -----------
+                The indexes of the tangent points (nothing for the chains
+                without vertices bigger than p).
+        """
+        rows = np.arange(len(chains))
+        last = chains.shape[1] - 1
+
+        #first vertex bigger than p
+        low, high = np.zeros_like(sizes), sizes.copy()
+        active = low < high
+        while active.any():
+            middle = (low + high) // 2
+            vertex = points[chains[rows, np.minimum(middle, last)]]
+            bigger = (vertex[:, 0] > p[0]) | ((vertex[:, 0] == p[0]) & (vertex[:, 1] > p[1]))
+
+            high = np.where(active & bigger, middle, high)
+            low = np.where(active & ~bigger, middle + 1, low)
+            active = low < high
+
+        found = low < sizes
+        chains, low, high = chains[found], low[found], sizes[found] - 1
+        rows = np.arange(len(chains))
+
+        #first vertex whose next one is to the left of p->vertex
+        active = low < high
+        while active.any():
+            middle = (low + high) // 2
+            vertex = points[chains[rows, middle]]
+            following = points[chains[rows, np.minimum(middle + 1, last)]]
+            left = orient2d_batch(p[None, :], vertex, following) > 0
+
+            high = np.where(active & left, middle, high)
+            low = np.where(active & ~left, middle + 1, low)
+            active = low < high
+
+        return chains[rows, low]
+
+    def most_clockwise(self, points: np.ndarray, candidates: np.ndarray, p: np.ndarray) -> int:
+        """
+            The candidate such that no other one is to the right of the line from p to
+            it (the farthest one if several are collinear). All the candidates are
+            bigger than p, so their angles are in (-pi/2, pi/2] and the smallest angle
+            is found with arctan2, only the closest ones are compared exactly.
+        """
+        deltas = points[candidates] - p
+        angles = np.arctan2(deltas[:, 1], deltas[:, 0])
+        closest = candidates[angles <= angles.min() + ANGLE_TOLERANCE].tolist()
+
+        best = closest[0]
+        for candidate in closest[1:]:
+            turn = orient2d(*p.tolist(), *points[best].tolist(), *points[candidate].tolist())
+            farther = np.abs(points[candidate] - p).sum() > np.abs(points[best] - p).sum()
+
+            if turn < 0 or (turn == 0 and farther):
+                best = candidate
+        return best
+
+    #========================================
+    #         Important loops
+    #========================================
+    def wrap_lower(self, points: np.ndarray, chains: np.ndarray, sizes: np.ndarray, limit: int) -> Union[List[int], None]:
+        """
+            Wraps the lower hull from the smallest point to the biggest one with the
+            tangent queries to the lower chains of the groups.
+
+            Returns:
+            -----------
+                The indexes of the vertices (both ends included), or None if there
+                are more than limit of them.
+        """
+        firsts = chains[:, 0]
+        start = int(firsts[np.lexsort((points[firsts, 1], points[firsts, 0]))[0]])
+        hull = [start]
+
+        while True:
+            candidates = self.tangents(points, chains, sizes, points[hull[-1]])
+            #there is no point bigger than the last vertex
+            if len(candidates) == 0:
+                return hull
+
+            hull.append(self.most_clockwise(points, candidates, points[hull[-1]]))
+            if len(hull) > limit:
+                return None
+
+    def wrap(self, points: np.ndarray, guess: int) -> Union[List[int], None]:
+        """
+            One round of the algorithm with groups of guess points.
+
+            Returns:
+            -----------
+                The indexes of the hull vertices, or None if there are more than guess.
+        """
+        (lower, lower_sizes), (upper, upper_sizes) = self.group_chains(points, guess)
+
+        lower_hull = self.wrap_lower(points, lower, lower_sizes, guess + 1)
+        if lower_hull is None:
+            return None
+
+        #the upper hull is the lower hull of the points rotated 180 degrees
+        upper_hull = self.wrap_lower(-points, upper, upper_sizes, guess + 2 - len(lower_hull))
+        if upper_hull is None:
+            return None
+
+        #the last vertex of each half is the first one of the other
+        return (lower_hull[:-1] + upper_hull[:-1]) or lower_hull
+
+    #========================================
+    #          Main algorithm
+    #========================================
+    def hull_indices(self, points: Union[List[Vector], PointSet, np.ndarray]) -> np.ndarray:
+        """
+            Computes the convex hull of the points.
+
+            Returns:
+            -----------
+                int64 array with the indexes of the hull vertices in the input,
+                counter clockwise from the point with the smallest x (and smallest y).
+        """
+        array = PointSet.as_array(points)
+        self.guesses = []
+        if len(array) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        guess = self.first_guess
+        while True:
+            self.guesses.append(min(guess, len(array)))
+
+            #with guess = n the wrap can't fail
+            hull = self.wrap(array, self.guesses[-1])
+            if hull is not None:
+                return np.array(hull, dtype=np.int64)
+            guess = guess ** 2
+
+    def convex_hull(self, points: Union[List[Vector], PointSet, np.ndarray]) -> List[Vector]:
+        """
+            Computes the convex hull of a set of points in the plane.
+            The points can be given as a list of Vectors, a PointSet or an (N, 2) array.
+        """
+        return hull_vectors(points, self.hull_indices(points))
@@ -3,7 +3,7 @@ import numpy as np
 from typing import Union, List, Tuple
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base import Vector, Segment
+from base import Vector, Segment, PointSet
 
 class ConvexHullGraham:
 
@@ -95,13 +95,17 @@ class ConvexHullGraham:
     #           Main algorithm
     #========================================
 
-    def convex_hull(self, points: List[Vector]) -> list:
+    def convex_hull(self, points: Union[List[Vector], PointSet]) -> list:
 
         """
             Computes the convex hull of a set of points in the plane.
-            The points must be given in the form of numpy arrays.
+            The points must be given as a list of Vectors or as a PointSet.
         """
 
+        #a PointSet is read through Vector views of its rows
+        if isinstance(points, PointSet):
+            points = points.to_vectors()
+
         #gets the leftmost lowest point
         v0 = self.get_starting_point(points)
 
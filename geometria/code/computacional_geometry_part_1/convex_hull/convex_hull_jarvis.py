@@ -8,6 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 #internal dependencies
 from vector import Vector
 from segment import Segment
+from point_set import PointSet
 
 class ConvexHullJarvis:
 
@@ -52,10 +53,12 @@ class ConvexHullJarvis:
             is anti-clockwise, for all the i in the range [0, len(points)-1].
         """
 
-        #initialize the segment with the first point
-        segment = Segment(on_hull, points[0])
+        #initialize the segment with the first point that isn't on_hull
+        #(a segment from on_hull to itself has no direction)
+        start = next((i for i, point in enumerate(points) if point != on_hull), 0)
+        segment = Segment(on_hull, points[start])
 
-        for point in points[1:]:
+        for point in points[start+1:]:
             
             if plotting:
                 self.plot_segment(on_hull, segment.end, point)
@@ -71,9 +74,13 @@ class ConvexHullJarvis:
     #          Main algorithm
     #========================================
     def convex_hull(self,
-                    points: List[Vector], 
+                    points: Union[List[Vector], PointSet], 
                     plotting: bool = False) -> List[Vector]:
 
+        #a PointSet is read through Vector views of its rows
+        if isinstance(points, PointSet):
+            points = points.to_vectors()
+
         if len(points) < 3:
             raise ValueError("The convex hull can only be computed for 3 or more points.")
         self.points = points
@@ -82,7 +89,7 @@ class ConvexHullJarvis:
         v0 = self.get_starting_point(points)
 
         # initialize the convex hull
-        self.convex_hull = [v0,]
+        self.hull = [v0,]
 
         # get the point with the highest slope
         v1 = self.look_for_most_anti_clockwise_point(v0, points, plotting)
@@ -90,14 +97,14 @@ class ConvexHullJarvis:
         # while the next point is not the starting point
         while v1 != v0:
             # add the point to the convex hull
-            self.convex_hull.append(v1)
+            self.hull.append(v1)
             # remove the point from the list of points to check
             points.remove(v1)
             
             # get the next point
-            v1 = self.look_for_most_anti_clockwise_point(self.convex_hull[-1], points, plotting)
+            v1 = self.look_for_most_anti_clockwise_point(self.hull[-1], points, plotting)
         
-        return self.convex_hull
+        return self.hull
 
 
     #========================================
@@ -112,9 +119,9 @@ class ConvexHullJarvis:
         plt.plot([on_hull[0], nextv[0]], [on_hull[1], nextv[1]], 'r', linewidth=3)
 
         #plot the lines in the convex hull with red and thick, same as before
-        for i in range(len(self.convex_hull)-1):
-            plt.plot([self.convex_hull[i][0], self.convex_hull[i+1][0]],
-                     [self.convex_hull[i][1], self.convex_hull[i+1][1]], 'r', linewidth=3)
+        for i in range(len(self.hull)-1):
+            plt.plot([self.hull[i][0], self.hull[i+1][0]],
+                     [self.hull[i][1], self.hull[i+1][1]], 'r', linewidth=3)
 
         #the second segment between on_hull and point is black, thin and dashed
         plt.plot([on_hull[0], point[0]], [on_hull[1], point[1]], 'k--', linewidth=1)
@@ -0,0 +1,183 @@
+import os, sys
+import numpy as np
+from typing import Union, List, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base import Vector, PointSet, orient2d
+from binary_tree import AVLTree, Node1D
+from monotone_chain import hull_vectors
+
+class HullChain:
+
+    def __init__(self):
+        """
+            Lower chain of a hull that only grows, as its vertices sorted by x (and y)
+            in an AVLTree, whose nodes have the tuple (x, y) as their value.
+        """
+        self.tree = AVLTree()
+
+    def neighbours(self, point: Tuple[float, float]) -> Tuple[Node1D, Node1D, bool]:
+        """
+            The vertices just before and just after the point, and if the point is
+            already a vertex. O(log n).
+        """
+        probe = Node1D(point)
+        before, after = self.tree.lower(probe), self.tree.higher(probe)
+
+        #a vertex equal to the point is the one after the previous vertex
+        following = self.tree.minimum() if before is None else self.tree.successor(before)
+        return before, after, (following is not None) and (following.value == point)
+
+    def above(self, point: Tuple[float, float]) -> bool:
+        """
+            If the point is on or above the chain (inside its range of x).
+        """
+        before, after, is_vertex = self.neighbours(point)
+        if is_vertex:
+            return True
+        if before is None or after is None:
+            return False
+        return orient2d(*before.value, *after.value, *point) >= 0
+
+    def insert(self, point: Tuple[float, float]) -> bool:
+        """
+            Adds the point to the chain if it's below it, and removes the vertices
+            that are no longer below the chain. Every point is removed at most once,
+            so it's O(log n) amortized.
+
+            Returns:
+            -----------
+                True if the point is now a vertex of the chain.
+        """
+        if self.above(point):
+            return False
+
+        node = self.tree.insert(Node1D(point))
+
+        #the vertices after the point, while they stop being a left turn
+        following = self.tree.successor(node)
+        while following is not None:
+            after = self.tree.successor(following)
+            if after is None or orient2d(*point, *following.value, *after.value) > 0:
+                break
+            self.tree.delete(following)
+            following = after
+
+        #and the vertices before it
+        previous = self.tree.predecessor(node)
+        while previous is not None:
+            before = self.tree.predecessor(previous)
+            if before is None or orient2d(*before.value, *previous.value, *point) > 0:
+                break
+            self.tree.delete(previous)
+            previous = before
+
+        return True
+
+    def vertices(self) -> List[Tuple[float, float]]:
+        return [node.value for node in self.tree.iter_inorder()]
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+class DynamicConvexHull:
+
+    def __init__(self, points: Union[List[Vector], PointSet, np.ndarray, None] = None):
+        """
+            Convex hull of a set of points that grows online. The hull is kept as its
+            lower and upper chains (the upper chain is the lower chain of the points
+            rotated 180 degrees), so a point is inside the hull if it's above the lower
+            chain and below the upper one, which takes O(log n), and adding a point is
+            O(log n) amortized: the points inside are rejected with that test, and
+            every vertex is removed at most once.
+
+            The snapshots have the same contract as ConvexHullGraham.convex_hull:
+            counter clockwise, starting at the point with the smallest x (and
+            smallest y), without collinear or repeated points.
+
+            Args:
+            -----------
+                points: first points of the hull (optional).
+        """
+        self.lower = HullChain()
+        self.upper = HullChain()
+
+        #points added, and the ones rejected because they were inside the hull
+        self.added = 0
+        self.rejected = 0
+
+        if points is not None:
+            self.add(points)
+
+    #========================================
+    #           Small subroutines
+    #========================================
+    @staticmethod
+    def as_tuple(point: Union[Vector, Tuple[float, float], np.ndarray]) -> Tuple[float, float]:
+        return float(point[0]), float(point[1])
+
+    def contains(self, point: Union[Vector, Tuple[float, float], np.ndarray]) -> bool:
+        """
+            If the point is inside the hull or on its boundary.
+        """
+        x, y = DynamicConvexHull.as_tuple(point)
+        return self.lower.above((x, y)) and self.upper.above((-x, -y))
+
+    #========================================
+    #          Main algorithm
+    #========================================
+    def insert(self, point: Union[Vector, Tuple[float, float], np.ndarray]) -> bool:
+        """
+            Adds a point to the hull.
+
+            Returns:
+            -----------
+                True if the hull changed (the point is a new vertex).
+        """
+        x, y = DynamicConvexHull.as_tuple(point)
+        self.added += 1
+
+        if self.contains((x, y)):
+            self.rejected += 1
+            return False
+
+        #a point outside the hull is a vertex of at least one of the chains
+        in_lower = self.lower.insert((x, y))
+        in_upper = self.upper.insert((-x, -y))
+        return in_lower or in_upper
+
+    def add(self, points: Union[List[Vector], PointSet, np.ndarray]) -> int:
+        """
+            Adds a batch of points.
+
+            Returns:
+            -----------
+                How many of them changed the hull when they were added.
+        """
+        return sum(self.insert(point) for point in PointSet.as_array(points).tolist())
+
+    def snapshot(self, as_array: bool = False) -> Union[List[Vector], np.ndarray]:
+        """
+            The current hull, as a list of Vectors (copies, the hull keeps changing)
+            or as an (h, 2) array.
+        """
+        lower = self.lower.vertices()
+        upper = [(-x, -y) for x, y in self.upper.vertices()]
+
+        #the last vertex of each chain is the first one of the other
+        vertices = np.array((lower[:-1] + upper[:-1]) or lower, dtype=np.float64).reshape((-1, 2))
+        if as_array:
+            return vertices
+        return hull_vectors(vertices, np.arange(len(vertices)))
+
+    def __contains__(self, point: Union[Vector, Tuple[float, float], np.ndarray]) -> bool:
+        return self.contains(point)
+
+    def __len__(self) -> int:
+        """
+            The number of vertices of the hull.
+        """
+        return len(self.snapshot(as_array=True))
+
+    def __repr__(self) -> str:
+        return f"DynamicConvexHull({len(self)} vertices, {self.added} points added)"
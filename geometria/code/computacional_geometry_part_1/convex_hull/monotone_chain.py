@@ -0,0 +1,123 @@
+import os, sys
+import numpy as np
+from typing import Union, List
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base import Vector, PointSet
+from base.predicates import orient2d_exact, CCW_ERRBOUND_A
+
+def hull_vectors(points: Union[List[Vector], PointSet, np.ndarray], indices: np.ndarray) -> List[Vector]:
+    """
+        The hull vertices as Vectors: the same objects if the points were given as
+        a list of Vectors, otherwise views of the PointSet (or of the array).
+    """
+    if isinstance(points, list):
+        return [points[i] for i in indices.tolist()]
+
+    if not isinstance(getattr(points, "points", None), np.ndarray):
+        points = PointSet(points, copy=False)
+    return [points.vector(i) for i in indices.tolist()]
+
+def chain(indices: List[int], xs: List[float], ys: List[float]) -> List[int]:
+    """
+        One chain of the monotone chain algorithm: walks the points (already in the
+        order of the chain) and keeps only the left turns. The orientation is computed
+        with floats, and only the almost collinear triplets are computed again exactly.
+
+        Returns:
+        -----------
+            The indices of the vertices of the chain.
+    """
+    hx, hy, hull = [], [], []
+    for k, cx, cy in zip(indices, xs, ys):
+
+        while len(hull) >= 2:
+            ax, ay, bx, by = hx[-2], hy[-2], hx[-1], hy[-1]
+
+            detleft = (ax - cx) * (by - cy)
+            detright = (ay - cy) * (bx - cx)
+            det = detleft - detright
+
+            if abs(det) <= CCW_ERRBOUND_A * (abs(detleft) + abs(detright)):
+                det = orient2d_exact(ax, ay, bx, by, cx, cy)
+
+            #a right turn or collinear points, the middle one is not a vertex
+            if det > 0:
+                break
+            hx.pop(); hy.pop(); hull.pop()
+
+        hx.append(cx); hy.append(cy); hull.append(k)
+    return hull
+
+def side_of_line(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+        Vectorized orientation of the points with respect to the line from a to b, as
+        floats with their error bound: 1 (left), -1 (right), or 0 when the float sign
+        isn't guaranteed (the point may be on the line). a and b can be a single
+        point or one point per row.
+    """
+    detleft = (a[..., 0] - points[:, 0]) * (b[..., 1] - points[:, 1])
+    detright = (a[..., 1] - points[:, 1]) * (b[..., 0] - points[:, 0])
+    det = detleft - detright
+
+    sides = np.sign(det).astype(np.int8)
+    sides[np.abs(det) <= CCW_ERRBOUND_A * (np.abs(detleft) + np.abs(detright))] = 0
+    return sides
+
+class ConvexHullMonotoneChain:
+
+    def __init__(self):
+        """
+            Implements Andrew's monotone chain algorithm over an (N, 2) array: the
+            points are sorted once by x (and y) with np.lexsort, and the lower and upper
+            chains are built with the orientation of raw floats, so no Vector or Segment
+            is built while computing the hull. It's O(n log n).
+
+            The hull has the same contract as ConvexHullGraham.convex_hull: counter
+            clockwise, starting at the point with the smallest x (and smallest y),
+            without collinear or repeated points.
+        """
+        pass
+
+    def hull_indices(self, points: Union[List[Vector], PointSet, np.ndarray]) -> np.ndarray:
+        """
+            Computes the convex hull of the points.
+
+            Returns:
+            -----------
+                int64 array with the indexes of the hull vertices in the input,
+                counter clockwise from the point with the smallest x (and smallest y).
+        """
+        array = PointSet.as_array(points)
+        if len(array) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        #sorted by x, and by y if they have the same x
+        order = np.lexsort((array[:, 1], array[:, 0]))
+        #the repeated points are dropped (they would be collinear anyway)
+        sorted_points = array[order]
+        distinct = np.r_[True, (sorted_points[1:] != sorted_points[:-1]).any(axis=1)]
+        order = order[distinct].astype(np.int64)
+
+        if len(order) < 3:
+            return order
+
+        #the lower chain only needs the points below the line between the first and the
+        #last point, and the upper chain the ones above (the uncertain ones go to both)
+        sides = side_of_line(array[order], array[order[0]], array[order[-1]])
+        lower_order = order[(sides <= 0) | (order == order[0]) | (order == order[-1])]
+        upper_order = order[(sides >= 0) | (order == order[0]) | (order == order[-1])][::-1]
+
+        lower = chain(lower_order.tolist(), array[lower_order, 0].tolist(), array[lower_order, 1].tolist())
+        upper = chain(upper_order.tolist(), array[upper_order, 0].tolist(), array[upper_order, 1].tolist())
+
+        #the last point of each chain is the first one of the other
+        hull = lower[:-1] + upper[:-1]
+        return np.array(hull, dtype=np.int64)
+
+    def convex_hull(self, points: Union[List[Vector], PointSet, np.ndarray]) -> List[Vector]:
+        """
+            Computes the convex hull of a set of points in the plane.
+            The points can be given as a list of Vectors, a PointSet or an (N, 2) array.
+        """
+        return hull_vectors(points, self.hull_indices(points))
@@ -0,0 +1,213 @@
+import os, sys
+import numpy as np
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, List, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base import Vector, PointSet, RunStats
+from quickhull import ConvexHullQuickhull
+from monotone_chain import hull_vectors
+
+MERGE_MODES = ("union", "pairwise")
+
+#rows copied at a time from the file to the shared memory
+LOAD_BLOCK = 2**22
+
+#the points of the process, set by attach (in the workers) or by the parent
+#when it runs with a single worker
+_shared = {}
+
+#================================================
+#         Work done in the pool processes
+#================================================
+
+def attach(name: str, shape: Tuple[int, int]) -> None:
+    """
+        Initializer of the workers, the shared memory is attached once per process.
+    """
+    memory = shared_memory.SharedMemory(name=name)
+    _shared["memory"] = memory
+    _shared["points"] = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+
+def chunk_hull(engine, start: int, stop: int) -> np.ndarray:
+    """
+        The hull of the rows start:stop of the shared points, as indexes of all the points.
+    """
+    return start + engine.hull_indices(_shared["points"][start:stop])
+
+def merge_hulls(engine, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+        The hull of the vertices of two hulls (indexes of the shared points).
+    """
+    candidates = np.concatenate((first, second))
+    return candidates[engine.hull_indices(_shared["points"][candidates])]
+
+class ParallelConvexHull:
+
+    def __init__(self, workers: Union[int, None] = None, engine = None,
+                 chunks_per_worker: int = 4, merge: str = "union"):
+        """
+            Divide and conquer hull for point sets of 10^7 to 10^8 points. The points
+            are loaded once in shared memory, split in chunks whose hulls are computed
+            in a ProcessPoolExecutor (the workers only receive the bounds of their
+            chunk), and the chunk hulls are merged.
+
+            Args:
+            -----------
+                workers: processes of the pool (os.cpu_count() by default), with one
+                         worker everything runs in this process.
+                engine: hull algorithm of the chunks and of the merges, anything with
+                        a hull_indices method that can be pickled
+                        (ConvexHullQuickhull by default).
+                chunks_per_worker: more chunks than workers, so a slow chunk doesn't
+                                   leave the other workers waiting.
+                merge: "union" (one hull over the vertices of all the chunk hulls) or
+                       "pairwise" (the hulls are merged two by two in the pool).
+        """
+        if merge not in MERGE_MODES:
+            raise ValueError(f"merge should be one of {MERGE_MODES}, yet is: {merge}")
+        if chunks_per_worker < 1:
+            raise ValueError(f"chunks_per_worker should be at least 1, yet is: {chunks_per_worker}")
+
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.engine = engine if engine is not None else ConvexHullQuickhull()
+        self.chunks_per_worker = chunks_per_worker
+        self.merge = merge
+
+        #the coordinates of the hull vertices and the stats of the last run
+        self.vertices : np.ndarray = None
+        self.stats : RunStats = None
+
+    #========================================
+    #           Small subroutines
+    #========================================
+    def load(self, source: Union[str, List[Vector], PointSet, np.ndarray]) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+        """
+            Copies the points to a new shared memory block, by blocks of LOAD_BLOCK rows.
+
+            Args:
+            -----------
+                source: path of a .npy file with an (N, 2) array (it's read with a
+                        memory map, so it's never loaded twice), or the points.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            points = np.load(source, mmap_mode="r")
+        else:
+            points = PointSet.as_array(source)
+
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError(f"The points should be an (N, 2) array, yet have shape: {points.shape}")
+
+        memory = shared_memory.SharedMemory(create=True, size=max(1, points.size * 8))
+        shared = np.ndarray(points.shape, dtype=np.float64, buffer=memory.buf)
+        for start in range(0, len(points), LOAD_BLOCK):
+            shared[start:start + LOAD_BLOCK] = points[start:start + LOAD_BLOCK]
+
+        return memory, shared
+
+    def chunks(self, npoints: int) -> List[Tuple[int, int]]:
+        nchunks = max(1, min(self.workers * self.chunks_per_worker, npoints))
+        bounds = np.linspace(0, npoints, nchunks + 1).astype(np.int64).tolist()
+        return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    def merge_pairwise(self, hulls: List[np.ndarray], pool: Union[ProcessPoolExecutor, None]) -> np.ndarray:
+        """
+            Merges the hulls two by two, every level of the merge tree in parallel.
+        """
+        while len(hulls) > 1:
+            pairs = list(zip(hulls[0::2], hulls[1::2]))
+            if pool is None:
+                merged = [merge_hulls(self.engine, first, second) for first, second in pairs]
+            else:
+                futures = [pool.submit(merge_hulls, self.engine, first, second) for first, second in pairs]
+                merged = [future.result() for future in futures]
+
+            #the last hull waits for the next level if there is an odd number of them
+            hulls = merged + hulls[2 * len(pairs):]
+        return hulls[0]
+
+    #========================================
+    #          Main algorithm
+    #========================================
+    def hull_indices(self, source: Union[str, List[Vector], PointSet, np.ndarray],
+                     return_stats: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, RunStats]]:
+        """
+            Computes the convex hull of the points.
+
+            Returns:
+            -----------
+                int64 array with the indexes of the hull vertices in the input,
+                counter clockwise from the point with the smallest x (and smallest y),
+                and the RunStats with the time of every stage (load, pool, chunk_hulls,
+                merge) if return_stats is True.
+        """
+        self.stats = RunStats("ParallelConvexHull", timing="perf_counter")
+        pool = None
+
+        with self.stats.measure():
+            with self.stats.timer("load"):
+                memory, points = self.load(source)
+
+            #the hull of no points is empty, there is nothing to split
+            if len(points) == 0:
+                memory.close()
+                memory.unlink()
+                self.vertices = np.empty((0, 2))
+                self.stats.count("points", 0)
+                self.stats.count("vertices", 0)
+
+                hull = np.empty(0, dtype=np.int64)
+                return (hull, self.stats) if return_stats else hull
+
+            try:
+                with self.stats.timer("pool"):
+                    if self.workers > 1:
+                        pool = ProcessPoolExecutor(self.workers, initializer=attach,
+                                                   initargs=(memory.name, points.shape))
+                    else:
+                        _shared["points"] = points
+
+                with self.stats.timer("chunk_hulls"):
+                    chunks = self.chunks(len(points))
+                    if pool is None:
+                        hulls = [chunk_hull(self.engine, start, stop) for start, stop in chunks]
+                    else:
+                        futures = [pool.submit(chunk_hull, self.engine, start, stop) for start, stop in chunks]
+                        hulls = [future.result() for future in futures]
+
+                with self.stats.timer("merge"):
+                    if self.merge == "pairwise":
+                        hull = self.merge_pairwise(hulls, pool)
+                    else:
+                        candidates = np.concatenate(hulls)
+                        hull = candidates[self.engine.hull_indices(points[candidates])]
+
+                self.vertices = points[hull].copy()
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+                _shared.pop("points", None)
+                memory.close()
+                memory.unlink()
+
+        self.stats.count("points", len(points))
+        self.stats.count("workers", self.workers)
+        self.stats.count("chunks", len(chunks))
+        self.stats.count("chunk_vertices", sum(len(chunk) for chunk in hulls))
+        self.stats.count("vertices", len(hull))
+
+        hull = np.asarray(hull, dtype=np.int64)
+        return (hull, self.stats) if return_stats else hull
+
+    def convex_hull(self, source: Union[str, List[Vector], PointSet, np.ndarray]) -> List[Vector]:
+        """
+            Computes the convex hull of a set of points in the plane, given as a path
+            to a .npy file, a list of Vectors, a PointSet or an (N, 2) array.
+        """
+        hull = self.hull_indices(source)
+
+        #the points of a file are gone, the hull is made of copies of its vertices
+        if isinstance(source, (str, os.PathLike)):
+            return hull_vectors(self.vertices, np.arange(len(hull)))
+        return hull_vectors(source, hull)
@@ -0,0 +1,126 @@
+import os, sys
+import numpy as np
+from fractions import Fraction
+from typing import Union, List, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base import Vector, PointSet
+from base.predicates import orient2d_batch, CCW_ERRBOUND_A
+from monotone_chain import hull_vectors
+
+def lexicographic_extremes(points: np.ndarray) -> Tuple[int, int]:
+    """
+        The indexes of the smallest and the biggest point (by x, and by y if they have
+        the same x), without sorting.
+    """
+    xs, ys = points[:, 0], points[:, 1]
+
+    leftmost = np.flatnonzero(xs == xs.min())
+    rightmost = np.flatnonzero(xs == xs.max())
+    return int(leftmost[np.argmin(ys[leftmost])]), int(rightmost[np.argmax(ys[rightmost])])
+
+class ConvexHullQuickhull:
+
+    def __init__(self):
+        """
+            Implements Quickhull over an (N, 2) array. The line between the smallest
+            and the biggest point splits the points in two halves, and for every
+            edge (p, q) of the hull found so far, the furthest point to its right is a
+            new vertex, and only the points to the right of (p, furthest) or of
+            (furthest, q) are kept. The cross products and the partitions are numpy
+            masks, and the edges wait in an explicit stack instead of recursion, so
+            big inputs don't reach the recursion limit.
+
+            The hull has the same contract as ConvexHullGraham.convex_hull: counter
+            clockwise, starting at the point with the smallest x (and smallest y),
+            without collinear or repeated points.
+        """
+        pass
+
+    #========================================
+    #           Small subroutines
+    #========================================
+    def furthest(self, points: np.ndarray, indices: np.ndarray, p: np.ndarray, q: np.ndarray) -> int:
+        """
+            The point furthest to the right of the line p->q. The distances are
+            compared as the cross products (p - s) x (q - s), and the ones within their
+            float error of the biggest one are compared again exactly. If several are
+            equally far (they are on a line parallel to p->q) the biggest by x and y is
+            returned, so it's a vertex and not a point between two vertices.
+        """
+        detleft = (p[0] - points[indices, 0]) * (q[1] - points[indices, 1])
+        detright = (p[1] - points[indices, 1]) * (q[0] - points[indices, 0])
+        distances = detright - detleft
+        errors = CCW_ERRBOUND_A * (np.abs(detleft) + np.abs(detright))
+
+        closest = indices[distances + errors >= (distances - errors).max()]
+        if len(closest) == 1:
+            return int(closest[0])
+
+        px, py, qx, qy = [Fraction(float(value)) for value in (*p, *q)]
+        def key(index: int) -> Tuple[Fraction, float, float]:
+            sx, sy = [Fraction(float(value)) for value in points[index]]
+            return (py - sy) * (qx - sx) - (px - sx) * (qy - sy), *points[index].tolist()
+
+        return max(closest.tolist(), key=key)
+
+    def right_of(self, points: np.ndarray, indices: np.ndarray, p: np.ndarray, q: np.ndarray) -> np.ndarray:
+        """
+            The indices of the points strictly to the right of the line p->q (with
+            the exact orientation, so no vertex is dropped by a rounding).
+        """
+        return indices[orient2d_batch(p[None, :], q[None, :], points[indices]) < 0]
+
+    #========================================
+    #          Main algorithm
+    #========================================
+    def hull_indices(self, points: Union[List[Vector], PointSet, np.ndarray]) -> np.ndarray:
+        """
+            Computes the convex hull of the points.
+
+            Returns:
+            -----------
+                int64 array with the indexes of the hull vertices in the input,
+                counter clockwise from the point with the smallest x (and smallest y).
+        """
+        array = PointSet.as_array(points)
+        if len(array) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        first, last = lexicographic_extremes(array)
+        if (array[first] == array[last]).all():
+            return np.array([first], dtype=np.int64)
+
+        sides = orient2d_batch(array[None, first], array[None, last], array)
+        hull = [first]
+
+        #the edges (p, q, points to their right) and the vertices are popped in order,
+        #the lower hull goes from first to last, and the upper hull back
+        stack = [("edge", last, first, np.flatnonzero(sides > 0)),
+                 ("vertex", last),
+                 ("edge", first, last, np.flatnonzero(sides < 0))]
+
+        while stack:
+            item = stack.pop()
+            if item[0] == "vertex":
+                hull.append(item[1])
+                continue
+
+            _, p, q, indices = item
+            if len(indices) == 0:
+                continue
+
+            furthest = self.furthest(array, indices, array[p], array[q])
+            #the points inside the triangle (p, furthest, q) are dropped
+            stack.append(("edge", furthest, q, self.right_of(array, indices, array[furthest], array[q])))
+            stack.append(("vertex", furthest))
+            stack.append(("edge", p, furthest, self.right_of(array, indices, array[p], array[furthest])))
+
+        return np.array(hull, dtype=np.int64)
+
+    def convex_hull(self, points: Union[List[Vector], PointSet, np.ndarray]) -> List[Vector]:
+        """
+            Computes the convex hull of a set of points in the plane.
+            The points can be given as a list of Vectors, a PointSet or an (N, 2) array.
+        """
+        return hull_vectors(points, self.hull_indices(points))
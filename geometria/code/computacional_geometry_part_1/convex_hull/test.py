@@ -0,0 +1,341 @@
+import os
+import sys
+import inspect
+import tempfile
+import unittest
+import numpy as np
+from base import make_point
+from base.predicates import orient2d, orient2d_batch
+from convex_hull_graham import ConvexHullGraham
+from convex_hull_jarvis import ConvexHullJarvis
+from monotone_chain import ConvexHullMonotoneChain
+from akl_toussaint import AklToussaintHull, akl_toussaint_filter
+from chan import ConvexHullChan, LOCKSTEP_MAX
+from quickhull import ConvexHullQuickhull
+from parallel_hull import ParallelConvexHull
+from dynamic_hull import DynamicConvexHull
+
+def as_tuples(points) -> list:
+    return [(float(point[0]), float(point[1])) for point in points]
+
+class HullTestCase(unittest.TestCase):
+
+    def check_hull(self, points: np.ndarray, hull: np.ndarray):
+        """
+            The contract of the hulls: counter clockwise from the smallest point (by x
+            and y), without collinear or repeated points, and every point inside.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+        self.assertEqual(hull.dtype, np.int64)
+        if len(points) == 0:
+            self.assertEqual(len(hull), 0)
+            return
+
+        vertices = [tuple(row) for row in points[hull].tolist()]
+        self.assertEqual(len(set(vertices)), len(vertices))
+        self.assertEqual(vertices[0], min(tuple(row) for row in points.tolist()))
+
+        if len(set(map(tuple, points.tolist()))) == 1:
+            self.assertEqual(len(vertices), 1)
+            return
+
+        n = len(vertices)
+        for k in range(n if n > 2 else 0):
+            a, b, c = vertices[k], vertices[(k + 1) % n], vertices[(k + 2) % n]
+            self.assertEqual(orient2d(*a, *b, *c), 1)
+
+        for k in range(n):
+            a, b = vertices[k], vertices[(k + 1) % n]
+            for point in points.tolist():
+                if n > 2:
+                    self.assertGreaterEqual(orient2d(*a, *b, *point), 0)
+                else:
+                    self.assertEqual(orient2d(*a, *b, *point), 0)
+
+    def same_hull(self, points: np.ndarray, first: np.ndarray, second: np.ndarray):
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+        self.assertEqual(points[first].tolist(), points[second].tolist())
+
+def circle(n: int, radius: float = 1.0) -> np.ndarray:
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return radius * np.column_stack([np.cos(angles), np.sin(angles)])
+
+def degenerate_inputs() -> list:
+    """
+        Inputs with repeated and collinear points.
+    """
+    rng = np.random.default_rng(20)
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    sides = [(1, 0), (2, 1), (1, 2), (0, 1), (1, 1)]
+    return [np.empty((0, 2)),
+            np.array([[3.0, 4.0]]),
+            np.array([[3.0, 4.0], [3.0, 4.0]]),
+            np.array([[1.0, 1.0], [0.0, 2.0]]),
+            np.array([[1.0, 1.0], [0.0, 2.0], [1.0, 1.0]]),
+            np.array([[k, 2 * k + 1] for k in range(6)][::-1], dtype=np.float64),
+            np.array([[2.0, k] for k in (3, 1, 2, 0)]),
+            np.array(square + sides + square, dtype=np.float64),
+            rng.integers(0, 4, (60, 2)).astype(np.float64)]
+
+class TestMonotoneChain(HullTestCase):
+
+    def test_degenerate_inputs(self):
+        engine = ConvexHullMonotoneChain()
+        for points in degenerate_inputs():
+            self.check_hull(points, engine.hull_indices(points))
+
+        #all collinear, only the two ends
+        points = np.array([[k, 2 * k + 1] for k in range(6)][::-1], dtype=np.float64)
+        self.assertEqual(points[engine.hull_indices(points)].tolist(), [[0, 1], [5, 11]])
+
+        square = np.array([(0, 0), (1, 0), (2, 0), (2, 2), (2, 2), (0, 2), (1, 1), (0, 0)], dtype=np.float64)
+        self.assertEqual(engine.hull_indices(square).tolist(), [0, 2, 3, 5])
+
+    def test_index_and_vector_output(self):
+        engine = ConvexHullMonotoneChain()
+        points = np.random.default_rng(21).random((200, 2))
+        hull = engine.hull_indices(points)
+        self.check_hull(points, hull)
+
+        #the same points given as vectors, the hull is made of the same objects
+        vectors = [make_point(x, y) for x, y in points.tolist()]
+        self.assertEqual(engine.hull_indices(vectors).tolist(), hull.tolist())
+        self.assertTrue(all(a is b for a, b in zip(engine.convex_hull(vectors), [vectors[i] for i in hull.tolist()])))
+        self.assertEqual(as_tuples(engine.convex_hull(points)), [tuple(row) for row in points[hull].tolist()])
+
+    def test_same_as_graham(self):
+        rng = np.random.default_rng(22)
+        for _ in range(5):
+            points = rng.normal(size=(40, 2))
+            vectors = [make_point(x, y) for x, y in points.tolist()]
+
+            #graham closes the polygon with its first point
+            graham = as_tuples(ConvexHullGraham().convex_hull(vectors))
+            self.assertEqual(graham[0], graham[-1])
+            graham = graham[:-1]
+            self.assertEqual(as_tuples(ConvexHullMonotoneChain().convex_hull(vectors)), graham)
+
+class TestAklToussaint(HullTestCase):
+
+    def test_filter_keeps_the_hull(self):
+        rng = np.random.default_rng(23)
+        clouds = degenerate_inputs() + [rng.random((500, 2)), rng.normal(size=(500, 2)),
+                                        rng.integers(0, 5, (300, 2)).astype(np.float64)]
+
+        for points in clouds:
+            survivors, ratio = akl_toussaint_filter(points)
+            hull = ConvexHullMonotoneChain().hull_indices(points)
+
+            self.assertTrue(set(hull.tolist()) <= set(survivors.tolist()))
+            self.assertAlmostEqual(ratio, (len(points) - len(survivors)) / max(len(points), 1))
+            self.check_hull(points, AklToussaintHull().hull_indices(points))
+
+        #most of a big cloud is inside the octagon
+        survivors, ratio = akl_toussaint_filter(rng.normal(size=(5000, 2)))
+        self.assertGreater(ratio, 0.9)
+        self.assertEqual(akl_toussaint_filter(np.empty((0, 2)))[1], 0.0)
+
+    def test_engines(self):
+        rng = np.random.default_rng(24)
+        points = rng.normal(size=(300, 2))
+        vectors = [make_point(x, y) for x, y in points.tolist()]
+
+        for engine in (ConvexHullMonotoneChain(), ConvexHullGraham(), ConvexHullJarvis()):
+            hull, ratio = AklToussaintHull(engine).convex_hull(vectors, return_ratio=True)
+            self.assertGreater(ratio, 0.5)
+            #the same hull (and the same objects) as without the filter
+            full = engine.convex_hull(list(vectors))
+            self.assertEqual(as_tuples(hull), as_tuples(full))
+            self.assertTrue(all(any(vertex is v for v in vectors) for vertex in hull))
+
+        indices, ratio = AklToussaintHull().hull_indices(points, return_ratio=True)
+        self.assertEqual(indices.tolist(), ConvexHullMonotoneChain().hull_indices(points).tolist())
+
+    def test_jarvis_runs_twice(self):
+        engine = ConvexHullJarvis()
+        square = [make_point(x, y) for x, y in ((0, 0), (2, 0), (1, 1), (2, 2), (0, 2))]
+
+        first = engine.convex_hull(list(square))
+        self.assertEqual(as_tuples(engine.convex_hull(list(square))), as_tuples(first))
+        self.assertEqual(sorted(as_tuples(first)), [(0.0, 0.0), (0.0, 2.0), (2.0, 0.0), (2.0, 2.0)])
+
+class TestChan(HullTestCase):
+
+    def test_several_rounds(self):
+        rng = np.random.default_rng(25)
+        #a polygon with 100 vertices, with repeated points, points on its edges and inside
+        vertices = np.round(circle(100, 1000))
+        edges = (vertices + np.roll(vertices, -1, axis=0)) / 2
+        points = np.vstack([vertices, vertices[::3], rng.integers(-500, 500, (400, 2)), edges])
+        points = points[rng.permutation(len(points))]
+
+        engine = ConvexHullChan(first_guess=4)
+        hull = engine.hull_indices(points)
+        self.assertEqual(engine.guesses, [4, 16, 256])
+        self.check_hull(points, hull)
+        self.same_hull(points, hull, ConvexHullMonotoneChain().hull_indices(points))
+
+        for points in degenerate_inputs():
+            self.check_hull(points, ConvexHullChan(first_guess=4).hull_indices(points))
+
+    def test_big_groups(self):
+        rng = np.random.default_rng(26)
+        #many ties, and collinear points on the sides of the box
+        points = rng.integers(0, 40, (3 * LOCKSTEP_MAX, 2)).astype(np.float64)
+
+        engine = ConvexHullChan(first_guess=2 * LOCKSTEP_MAX)
+        hull = engine.hull_indices(points)
+        self.assertEqual(engine.guesses, [2 * LOCKSTEP_MAX])
+        self.check_hull(points, hull)
+        self.same_hull(points, hull, ConvexHullMonotoneChain().hull_indices(points))
+
+        vectors = [make_point(x, y) for x, y in points.tolist()]
+        self.assertEqual(as_tuples(engine.convex_hull(vectors)), as_tuples(ConvexHullMonotoneChain().convex_hull(vectors)))
+
+    def test_first_guess(self):
+        with self.assertRaises(ValueError):
+            ConvexHullChan(first_guess=1)
+
+class TestQuickhull(HullTestCase):
+
+    def test_contract(self):
+        rng = np.random.default_rng(27)
+        clouds = degenerate_inputs() + [rng.random((300, 2)), rng.integers(0, 6, (200, 2)).astype(np.float64),
+                                        np.round(circle(50, 10)), np.vstack([circle(40), circle(40)])]
+
+        for points in clouds:
+            hull = ConvexHullQuickhull().hull_indices(points)
+            self.check_hull(points, hull)
+            self.same_hull(points, hull, ConvexHullMonotoneChain().hull_indices(points))
+
+    def test_large_circle(self):
+        points = circle(2**14, 2**20)
+        points = points[np.random.default_rng(28).permutation(len(points))]
+
+        #the edges wait in a stack, so a few frames over the ones of the test are enough
+        #(the numpy calls need about 15), a recursion would need one more per level
+        #of the edges, about 14 for this circle
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 20)
+        try:
+            hull = ConvexHullQuickhull().hull_indices(points)
+        finally:
+            sys.setrecursionlimit(limit)
+
+        #every point of the circle is a vertex, counter clockwise from the smallest one
+        self.assertEqual(len(hull), len(points))
+        vertices = points[hull]
+        self.assertEqual(tuple(vertices[0]), min(map(tuple, points.tolist())))
+        self.assertTrue((orient2d_batch(vertices, np.roll(vertices, -1, axis=0), np.roll(vertices, -2, axis=0)) == 1).all())
+        self.same_hull(points, hull, ConvexHullMonotoneChain().hull_indices(points))
+
+class TestParallelConvexHull(HullTestCase):
+
+    def test_against_monotone_chain(self):
+        rng = np.random.default_rng(29)
+        clouds = [np.empty((0, 2)), np.array([[1.0, 2.0]]), np.array([[1.0, 2.0], [1.0, 2.0], [0.0, 0.0]]),
+                  rng.integers(0, 8, (500, 2)).astype(np.float64), rng.normal(size=(3000, 2))]
+
+        for workers in (1, 2):
+            for merge in ("union", "pairwise"):
+                engine = ParallelConvexHull(workers=workers, merge=merge, chunks_per_worker=3)
+                for points in clouds:
+                    hull = engine.hull_indices(points)
+                    self.check_hull(points, hull)
+                    self.same_hull(points, hull, ConvexHullMonotoneChain().hull_indices(points))
+                    self.assertEqual(engine.vertices.tolist(), points[hull].tolist())
+
+    def test_file_source(self):
+        points = np.random.default_rng(30).random((1000, 2))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "points.npy")
+            np.save(path, points)
+
+            hull, stats = ParallelConvexHull(workers=1).hull_indices(path, return_stats=True)
+            self.same_hull(points, hull, ConvexHullMonotoneChain().hull_indices(points))
+            self.assertEqual((stats.counters["points"], stats.counters["vertices"]), (1000, len(hull)))
+            self.assertEqual(as_tuples(ParallelConvexHull(workers=1).convex_hull(path)), as_tuples(points[hull]))
+
+            np.save(path, np.empty((0, 2)))
+            self.assertEqual(ParallelConvexHull(workers=1).convex_hull(path), [])
+            hull, stats = ParallelConvexHull(workers=2).hull_indices(path, return_stats=True)
+            self.assertEqual((hull.dtype, len(hull), stats.counters["points"]), (np.int64, 0, 0))
+
+class TestDynamicConvexHull(HullTestCase):
+
+    @staticmethod
+    def inside(vertices: list, point: list) -> bool:
+        """
+            If the point is inside the hull or on its boundary, with the hull as a point,
+            a segment or a polygon.
+        """
+        if len(vertices) <= 2:
+            a, b = tuple(vertices[0]), tuple(vertices[-1])
+            return (orient2d(*a, *b, *point) == 0) and (min(a, b) <= tuple(point) <= max(a, b))
+        return all(orient2d(*a, *b, *point) >= 0 for a, b in zip(vertices, vertices[1:] + vertices[:1]))
+
+    def test_against_recompute(self):
+        rng = np.random.default_rng(31)
+        hull, seen = DynamicConvexHull(), np.empty((0, 2))
+
+        for step in range(30):
+            #integer batches, with repeated points and points on the edges
+            batch = rng.integers(-step, step + 1, (int(rng.integers(1, 20)), 2)).astype(np.float64)
+            hull.add(batch)
+            seen = np.vstack([seen, batch])
+
+            expected = seen[ConvexHullMonotoneChain().hull_indices(seen)]
+            self.assertEqual(hull.snapshot(as_array=True).tolist(), expected.tolist())
+            self.assertEqual(as_tuples(hull.snapshot()), as_tuples(expected))
+            self.assertEqual(len(hull), len(expected))
+
+            for point in rng.integers(-step - 2, step + 3, (20, 2)).tolist():
+                self.assertEqual(hull.contains(point), self.inside(expected.tolist(), point))
+
+        self.assertEqual(hull.added, len(seen))
+
+    def test_insert(self):
+        hull = DynamicConvexHull()
+        self.assertEqual((len(hull), hull.snapshot()), (0, []))
+        self.assertFalse(hull.contains((0, 0)))
+
+        self.assertTrue(hull.insert((0, 0)))
+        self.assertFalse(hull.insert((0, 0)))
+        self.assertEqual(len(hull), 1)
+        self.assertTrue(hull.insert(make_point(2, 0)))
+        self.assertEqual(len(hull), 2)
+
+        for point in [(2, 2), (0, 2)]:
+            self.assertTrue(hull.insert(point))
+        self.assertEqual(as_tuples(hull.snapshot()), [(0, 0), (2, 0), (2, 2), (0, 2)])
+
+        #the points on the boundary and the repeated ones don't change it
+        for point in [(1, 0), (2, 1), (0, 1), (1, 1), (2, 2), (0, 0)]:
+            self.assertTrue(point in hull)
+            self.assertFalse(hull.insert(point))
+        self.assertEqual(hull.rejected, 7)
+
+        #new extremes with the same x as a vertex
+        self.assertTrue(hull.insert((0, 3)))
+        self.assertEqual(as_tuples(hull.snapshot()), [(0, 0), (2, 0), (2, 2), (0, 3)])
+        self.assertTrue(hull.insert((0, -1)))
+        self.assertEqual(as_tuples(hull.snapshot()), [(0, -1), (2, 0), (2, 2), (0, 3)])
+        self.assertTrue(hull.insert((2, -3)))
+        self.assertEqual(as_tuples(hull.snapshot()), [(0, -1), (2, -3), (2, 2), (0, 3)])
+        self.assertFalse((3, 0) in hull)
+        self.assertTrue((0, 3) in hull)
+
+    def test_collinear(self):
+        hull = DynamicConvexHull(np.array([[1.0, 1.0], [3.0, 3.0], [2.0, 2.0]]))
+        self.assertEqual(as_tuples(hull.snapshot()), [(1, 1), (3, 3)])
+        self.assertTrue(hull.contains((2, 2)))
+        self.assertFalse(hull.contains((2, 2.5)))
+
+        #the line grows at both ends, and then gets an area
+        hull.add([make_point(0, 0), make_point(4, 4)])
+        self.assertEqual(as_tuples(hull.snapshot()), [(0, 0), (4, 4)])
+        hull.insert((4, 0))
+        self.assertEqual(as_tuples(hull.snapshot()), [(0, 0), (4, 0), (4, 4)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ from matplotlib import pyplot as plt
 
 
 #custom imports
+from base import tracing
 from double_connected_list.face import Face
 from double_connected_list.geometric_node import GeometricNode
 from double_connected_list.double_connected_segments import SemiEdge, SemiEdgeList
@@ -28,6 +29,13 @@ class TriangulationColoring:
         self.handling_problematic_node = False
         self.semiedges.resync()
 
+    def trace(self, event: str, **fields) -> None:
+        """
+            Emits a trace record (see base.tracing) if the tracing is enabled.
+        """
+        if tracing.enabled:
+            tracing.emit("TriangulationColoring", event, **fields)
+
 
     def breadth_first_search(self):
 
@@ -61,7 +69,7 @@ class TriangulationColoring:
                 #if there are no available colors, then raise an exception
                 else:
                     #raise Exception("There are no available colors for coloring the node.")
-                    print(f"\nThere are no available colors for coloring the node {node}.")
+                    self.trace("no_available_colors", node=node)
                     self.handle_problematic_node(node)
                     self.update_node(node)
                     
@@ -72,9 +80,7 @@ class TriangulationColoring:
                     for neighboring_node in self.get_neighboring_nodes(node):
                         nodes.append(neighboring_node)
 
-            print(f"Node {node} is colored with color {node.color}. color = {color}")
-            print(f"color_count = {self.color_count}")
-            print()
+            self.trace("colored", node=node, color=node.color, color_count=self.color_count)
 
             #plot the current state
             if self.plotting:
@@ -218,7 +224,6 @@ class TriangulationColoring:
                     The available colors for coloring the input node.
         """
         
-        print(f"\nAnalizing node = {node}")
         #available colors
         colors = set([GeometricNode.COLOR1, GeometricNode.COLOR2, GeometricNode.COLOR3])
 
@@ -229,15 +234,13 @@ class TriangulationColoring:
         used_colors = set()
 
         for incident_edge in incident_edges:
-            print(f"incident_edge = {incident_edge}, next node color = {incident_edge.next_.color}")
             used_colors.add(incident_edge.next_.color)
 
-        print(f"used_colors = {used_colors}")
-
         #available colors
         available_colors = colors - used_colors
 
-        print(f"available_colors = {available_colors}")
+        self.trace("neighbors", node=node, incident_edges=len(incident_edges),
+                   used_colors=used_colors, available_colors=available_colors)
             
         return list(available_colors)
 
@@ -254,7 +257,7 @@ class TriangulationColoring:
 
         #plot the current state
         self.plotting = plotting
-        print(f"\n\nStarting the coloration algorithm...")
+        self.trace("start", nodes=len(self.semiedges.list_of_nodes))
 
         #color the nodes
         self.breadth_first_search()
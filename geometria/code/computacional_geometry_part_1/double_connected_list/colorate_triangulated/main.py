@@ -6,6 +6,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from coloration import TriangulationColoring
 from base.vector import Vector
+from base import tracing
 from plot_double_connected_edge_list import PlotDoubleConnectedEdgeList
 from double_connected_list.triangulation.triangulate import Triangulate
 from double_connected_list.double_connected_segments import SemiEdge, SemiEdgeList
@@ -30,6 +31,9 @@ vectors3 = Vector.cast_to_vector(*points3)
 
 #------------------------------------------------------------
 
+#every step of the algorithms is written to the console
+tracing.enable(stream=sys.stdout)
+
 semiedges = SemiEdgeList(vectors3, name = "S1")
 
 #print(semiedges.show_data_structure())
@@ -7,6 +7,7 @@ from copy import deepcopy
 
 from base.vector import Vector
 from base.segment import Segment
+from base import tracing
 from geometric_node import GeometricNode
 from face import Face
 
@@ -109,6 +110,10 @@ class SemiEdgeList():
             Otherwise, it does nothing.
         """
 
+        #an empty list (like the one of an overlay before merging) has no orientation
+        if len(list_of_points) == 0:
+            return
+
         #get the leftmost point of the polygon which is one of the points of the
         #convex hull, by looking at the prev and next points of the leftmost point
         #and then computing the turn of the three points (prev, leftmost, next)
@@ -325,7 +330,8 @@ class SemiEdgeList():
 
         #check if the semiedge is already in the list of semiedges
         if semiedge in self.semi_edges:
-            print("The semiedge is already in the list of semiedges")
+            if tracing.enabled:
+                tracing.emit("SemiEdgeList", "duplicate_edge", semiedge=semiedge)
             return
 
         twin = SemiEdge(origin = semiedge.next_,
@@ -338,7 +344,6 @@ class SemiEdgeList():
         #identify the semiedges with origin in any of the ends 
         #of the semiedge I want to add
 
-        print(f"I want to add {semiedge}, {semiedge.seg}")
         related_edges_orig = self.get_incident_edges_of_vertex(semiedge.origin)
         related_edges_next = self.get_incident_edges_of_vertex(semiedge.next_)
 
@@ -350,7 +355,9 @@ class SemiEdgeList():
         related_edges = related_edges_orig + related_edges_next
         found = False
         pair: Tuple[SemiEdge, SemiEdge] = ()
-        print(f"RELATED EDGES {related_edges}")
+        if tracing.enabled:
+            tracing.emit("SemiEdgeList", "add_edge", semiedge=semiedge, segment=semiedge.seg,
+                         related_edges=related_edges)
 
         #search the pair that has the same incident face
         for e1 in related_edges:
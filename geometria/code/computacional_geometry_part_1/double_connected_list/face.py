@@ -1,7 +1,8 @@
 import os, sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from base import Vector
+import numpy as np
+from base import Vector, PointSet
 
 from typing import List
 from copy import deepcopy
@@ -34,22 +35,19 @@ class Face():
     
     def set_face_type(self):
         
-        #get the leftmost point among the set of points in the polygon
-        points = [semiedge.origin.point for semiedge in self.semi_edges]
-        left_most_point = Vector.get_leftmost_point(points)
-        
-        #get the index corresponding to the segment that has that point as 
-        #orgin
-        idx = points.index(left_most_point)
-        left_most_semiedge = self.semi_edges[idx]
-
-        #get the origin point, the previous and the next of these
-        origin = left_most_semiedge.start
-        prev = left_most_semiedge.prev_edge.start
-        next_ = left_most_semiedge.end
-
-        #get the way the face is turning 
-        turn = Vector.calculate_turn(prev, origin, next_)
+        #get the points of the polygon, with the previous and next point of each one
+        points = PointSet.from_vectors([semiedge.origin.point for semiedge in self.semi_edges])
+        prev_points = PointSet.from_vectors([semiedge.prev_edge.start for semiedge in self.semi_edges])
+        next_points = PointSet.from_vectors([semiedge.end for semiedge in self.semi_edges])
+
+        #get the way the face is turning on every vertex, in a single call
+        turns = Vector.calculate_turns(prev_points, points, next_points)
+
+        #the leftmost point among the set of points in the polygon is on the 
+        #envelope, so its turn tells the way the whole face is turning
+        #(argmin keeps the first one, like Vector.get_leftmost_point)
+        idx = int(np.argmin(points.x))
+        turn = turns[idx]
 
         if turn == 1:
             self.face_type = Face.EXTERIOR_FACE
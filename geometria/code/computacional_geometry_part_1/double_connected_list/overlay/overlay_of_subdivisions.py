@@ -22,7 +22,7 @@ class OverlayOfSubdivisions():
 
     def __init__(self, 
                  subdivisions: list[SemiEdgeList],
-                 name: str):
+                 name: str = "overlay"):
 
         self.name = name
         self.subdivisions: list[SemiEdgeList] = deepcopy(subdivisions)
@@ -39,7 +39,7 @@ class OverlayOfSubdivisions():
             This method merges the semi edge lists in the list of subdivisions
             into a single semi edge list.
         """
-        self.overlay = SemiEdgeList(list_of_points=[])
+        self.overlay = SemiEdgeList(list_of_points=[], name=self.name)
 
         for subdivision in self.subdivisions:
             self.overlay.faces.extend(subdivision.faces)
@@ -53,15 +53,20 @@ class OverlayOfSubdivisions():
 
         # This is a list of segments that will be used by the sweep line algorithm
         # it's important to sort the ends of the segments, following the lexicographic
-        # ordering we've built in the Segment class.
-        self.list_of_segments = [Segment(semiedge.seg.start, semiedge.seg.end, sort_ends=True) for semiedge in self.overlay.semi_edges]
+        # ordering we've built in the Segment class. Every segment is tagged with the
+        # index of its subdivision, so the sweep only looks for intersections between 
+        # different subdivisions.
+        self.list_of_segments = [Segment(semiedge.seg.start, semiedge.seg.end, sort_ends=True, layer=i) 
+                                 for i, subdivision in enumerate(self.subdivisions)
+                                 for semiedge in subdivision.semi_edges]
     
     def find_subdivisions_intersections(self, plotting: bool = False) -> None:
         """
             This method finds the intersections between the segments of the 
-            subdivisions.
+            subdivisions. The edges of a subdivision only meet at its vertices, so
+            the sweep runs in colored mode, and never compares two edges of the same one.
         """
-        self.overlay_intersections = SweepLine(self.list_of_segments).run(plotting=plotting)
+        self.overlay_intersections = SweepLine(self.list_of_segments, colored=True).run(plotting=plotting)
 
         #notice that every endpoint of subdivision is also an intersection point
         self.overlay_intersections.extend([n.point for n in self.overlay.list_of_nodes])
@@ -5,6 +5,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from base.vector import Vector
+from base import tracing
 from sweep_line_to_monotone_polygon import SweepLineMonotonePoly
 from plot_double_connected_edge_list import PlotDoubleConnectedEdgeList
 from double_connected_list.triangulation.triangulate import Triangulate
@@ -30,6 +31,9 @@ vectors3 = Vector.cast_to_vector(*points3)
 
 #------------------------------------------------------------
 
+#every step of the algorithms is written to the console
+tracing.enable(stream=sys.stdout)
+
 semiedges = SemiEdgeList(vectors3, name = "S1")
 #diagonals = SweepLineMonotonePoly(semiedges).run(plotting=False)
 #semiedges.add_new_semi_edges(diagonals)
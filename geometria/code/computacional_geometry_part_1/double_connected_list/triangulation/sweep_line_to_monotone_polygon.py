@@ -3,16 +3,20 @@ import os, sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # standard imports
+import time
 import bisect
 import numpy as np
 from copy import deepcopy
+from contextlib import nullcontext
 from matplotlib import pyplot as plt
-from typing import Union, List, Tuple
+from typing import Union, List, Tuple, Set
 
 # custom dependencies
 from base.vector  import  Vector
 from base.segment import  Segment
-from binary_tree import Tree, Node1D
+from base import PointSet, RunStats, make_point, tracing
+from binary_tree import Node1D
+from sweep_line.sweep_status import SweepStatus
 
 from double_connected_list.geometric_node import GeometricNode
 from double_connected_list.double_connected_segments import SemiEdge, SemiEdgeList
@@ -22,6 +26,10 @@ from plot_triangulation import PlotMonotonePolygon
 
 class SweepLineMonotonePoly:
 
+    # names of the vertex types, for the trace
+    VERTEX_NAMES = {START_VERTEX: "start", END_VERTEX: "end", SPLIT_VERTEX: "split",
+                    MERGE_VERTEX: "merge", REGULAR_VERTEX: "regular"}
+
     def __init__(self, semiedges: SemiEdgeList, epsilon: float = 1e-5):
 
         """
@@ -33,16 +41,17 @@ class SweepLineMonotonePoly:
 
         self.semiedges = semiedges#deepcopy(semiedges)
         self.epsilon  = epsilon
-        self.status_tree : Tree[Node1D]   = None 
+        self.status : SweepStatus = SweepStatus()
         self.event_points : List[Vector]  = None 
         self.sorted_status : List[Node1D] = None 
         self.diagonals : List[SemiEdge] = [] 
 
         #to keep track of the number of event points processed
         self.count: int = 0
+        self.stats: RunStats = None
         
         #to ensure that we do not add a semiedge that has already been removed
-        self.removed_semiedges: List[SemiEdge] = []
+        self.removed_semiedges: Set[SemiEdge] = set()
 
         #to set the sweepline width in the x axis
         self.leftmost_endpoint : Vector  = None 
@@ -51,6 +60,13 @@ class SweepLineMonotonePoly:
         #to keep track of the event points
         self.sweep_line : Segment = None 
 
+    def trace(self, event: str, **fields) -> None:
+        """
+            Emits a trace record (see base.tracing) if the tracing is enabled.
+        """
+        if tracing.enabled:
+            tracing.emit("SweepLineMonotonePoly", event, **fields)
+
     def update_sweepline(self, y, type_: str) -> None:
 
         """
@@ -75,32 +91,7 @@ class SweepLineMonotonePoly:
         # build the sweepline, from leftmost to rightmost points in the x axis
         # at height y, and tilt a little bit on the right end of the sweepline
         # in order to avoid problematic behavior with horizontal segments.
-        self.sweep_line = Segment(Vector(np.array([[xleft], [y]])), Vector(np.array([[xright], [y + self.epsilon]])))
-
-    def update_status_tree(self) -> None:
-        """
-            And update the nodes positions in the status tree, by the x coordinate of the intersection
-            of the segment with the sweepline.
-        """
-
-        in_order_tree = self.status_tree.inorder()
-        updated_nodes = []
-
-        # update the status tree
-        # for each node in the status tree, we update the intersection with the sweepline
-        for node in in_order_tree:
-            node.value = self.sweep_line.find_intersection(node.extra)[0]
-            
-            #reset the left and right childs
-            node.left = None
-            node.right = None
-            updated_nodes.append(node)
-        
-        # rebuild the status tree
-        if len(updated_nodes) > 0:
-            self.status_tree = Tree(updated_nodes)
-            self.sorted_status = self.status_tree.inorder() 
-
+        self.sweep_line = Segment(make_point(xleft, y), make_point(xright, y + self.epsilon))
 
     def sort_and_classify_endpoints(self) -> List[Tuple[Vector, SemiEdge, str]]:
 
@@ -119,13 +110,20 @@ class SweepLineMonotonePoly:
         """
         endpoints = []
 
-        for i in range(len(self.semiedges)):
+        # get the turn on every vertex of the polygon in a single call
+        nsemiedges = len(self.semiedges)
+        vertices = PointSet.from_vectors([self.semiedges[i].origin.point for i in range(nsemiedges)])
+        prev_points = PointSet.from_vectors([self.semiedges[i - 1].origin.point for i in range(nsemiedges)])
+        next_points = PointSet.from_vectors([self.semiedges[i].next_.point for i in range(nsemiedges)])
+        turns = Vector.calculate_turns(prev_points, vertices, next_points)
+
+        for i in range(nsemiedges):
             semiedge = self.semiedges[i]
             prev_semiedge = self.semiedges[i - 1]
             origin = semiedge.origin
 
             # classify the vertex
-            type_ = self.classify_vertex(origin.point, semiedge, prev_semiedge)
+            type_ = self.classify_vertex(origin.point, semiedge, prev_semiedge, turn=turns[i])
             endpoints.append((origin.point, semiedge, type_))
             
         # sort by using the vector own comparison methods
@@ -134,7 +132,7 @@ class SweepLineMonotonePoly:
 
     
 
-    def classify_vertex(self, vertex: Vector, semiedge: SemiEdge, prev_semiedge: SemiEdge) -> int:
+    def classify_vertex(self, vertex: Vector, semiedge: SemiEdge, prev_semiedge: SemiEdge, turn: int = None) -> int:
             
         """
             Classify a vertex as one of the following:
@@ -148,6 +146,8 @@ class SweepLineMonotonePoly:
                 vertex: vertex to be classified.
                 semiedge: semiedge that contains the vertex, as the origin.
                 prev_semiedge: previous semiedge in the list of semiedges.
+                turn: turn from the previous point to the vertex to the next point, if it was 
+                      already computed (see sort_and_classify_endpoints).
             
             Returns:
                 vertex type: int
@@ -156,7 +156,9 @@ class SweepLineMonotonePoly:
         # get previous and next points of the vertex
         prev_point = prev_semiedge.origin.point
         next_point = semiedge.next_.point
-        turn = Vector.calculate_turn(prev_point, vertex, next_point)
+
+        if turn is None:
+            turn = Vector.calculate_turn(prev_point, vertex, next_point)
 
         # the neighbors of the vertex are below the vertex
         if (vertex < prev_point) and (vertex < next_point):
@@ -190,85 +192,39 @@ class SweepLineMonotonePoly:
     def add_to_status_tree(self, semiedge: SemiEdge) -> Node1D:
 
         """
-            Add a semiedge to the status tree.
-            Wraps a semiedge with a Node1D element and adds it to the tree.
+            Add a semiedge to the status, in its place at the current sweep point.
+            The edges of the polygon never cross, so the status never has to be reordered.
         """
         
-        # update the sorted status before adding the semiedge
-        if self.status_tree is not None:
-            self.sorted_status = self.status_tree.inorder()
-        
         #do not add the semiedge if it has already been removed
         if semiedge in self.removed_semiedges:
             return 
 
-        if (self.status_tree is None) or (len(self.sorted_status) == 0):
-            # we insert the segment in the status tree, by using the intersection with the sweepline
-            # as the value for the node. In this case as there are no other segments in the status 
-            # tree we just insert by the xcoordinate of the start point of the segment.
-            n = Node1D(semiedge.seg.start[0])
-            n.extra = semiedge
-            self.status_tree = Tree([n,])
-            self.sorted_status = [n,]
-        else:
-            # if there is an status tree, we need to find the intersection of the segment with the
-            # sweepline, and insert the segment in the status tree by the xcoordinate of the
-            # intersection.
-            intersectx = semiedge.seg.find_intersection(self.sweep_line)[0]
-            n = Node1D(intersectx)
-            n.extra = semiedge
-            self.status_tree.insert(n)
-            self.sorted_status = self.status_tree.inorder()
-
-        self.update_status_tree()
-        return n
+        return self.status.insert(semiedge)
 
 
     def remove_from_status_tree(self, semiedge: SemiEdge) -> None:
         
         """
-            Remove a node from the status tree. 
-            And keep the status tree good structure even if 
-            this removed node had childs.
+            Remove the node of a semiedge from the status
+            (if it's there), the tree keeps itself balanced.
         """
-        self.sorted_status = self.status_tree.inorder()
-
-        try:
-            idx = [n.extra for n in self.sorted_status].index(semiedge)
-        
-            #pop the current node (which is and endpoint node) from the status
-            self.sorted_status.pop(idx)
-
-            #rebuild the status tree without this endpoint node
-            self.status_tree = self.status_tree.build_from_sorted_list(self.sorted_status)
+        if self.status.remove(semiedge) is None:
+            return
 
-            #add it to the list of removed semiedges
-            self.removed_semiedges.append(semiedge)
-            self.update_status_tree()
-
-        except ValueError as e:
-            if "is not in list" in str(e):
-                return 
-            else:
-                raise e
+        #add it to the list of removed semiedges
+        self.removed_semiedges.add(semiedge)
 
     def get_left_semiedge_of_vertex(self, vertex: Vector) -> SemiEdge:
 
-        self.sorted_status = self.status_tree.inorder()
-
-        #we want to get the semiedge that is just to the left of the segment, 
-        #this is the segment with the smallest magnitude of the horizontal distance and 
-        #which has negative horizontal distance
-        horizontal_distances = [n.value - vertex[0] for n in self.sorted_status]
-        horizontal_distances = [abs(d) if d < 0 else np.inf for d in horizontal_distances]
+        #we want to get the semiedge that is just to the left of the vertex, 
+        #this is the node with the greatest x at the sweepline that is still less than the x of the vertex
+        node_left = self.status.left_of(vertex[0])
 
-        if horizontal_distances:
-            idx = horizontal_distances.index(min(horizontal_distances))
-        else:
+        if node_left is None:
             return None
 
-        semiedge_left = self.sorted_status[idx].extra
-        return semiedge_left
+        return node_left.extra
     
     def get_helper(self, semiedge: SemiEdge) -> Tuple[Vector, int]:
         """
@@ -390,7 +346,7 @@ class SweepLineMonotonePoly:
         #just by thinking of the way the polygon is drawn
         if (prev < origin) and (origin < next_):
             interior_is_to_the_right = True
-            print("Interior is to the right")
+            self.trace("interior_to_the_right", vertex=vertex)
 
         #if the interior of the polygon is to the right of the segment (this means we have an anticlockwise 
         #turn) then
@@ -430,44 +386,72 @@ class SweepLineMonotonePoly:
     def handle_every_event_point(self, endpoint: Vector, segment: SemiEdge, type_: str) -> None:
         
         if type_ == START_VERTEX:
-            print("Processing start vertex")
             self.handle_start_vertex(endpoint, segment)
 
         elif type_ == END_VERTEX:
-            print("Processing end vertex")
             self.handle_end_vertex(endpoint, segment)
 
         elif type_ == SPLIT_VERTEX:
-            print("Processing split vertex")
             self.handle_split_vertex(endpoint, segment)
 
         elif type_ == MERGE_VERTEX:
-            print("Processing merge vertex")
             self.handle_merge_vertex(endpoint, segment)
 
         elif type_ == REGULAR_VERTEX:
-            print("Processing regular vertex")
             self.handle_regular_vertex(endpoint, segment)
 
 
 
-    def run(self, plotting: bool = False) -> List[SemiEdge]:
+    def run(self, plotting: bool = False, return_stats: bool = False,
+            timing: Union[str, None] = None) -> Union[List[SemiEdge], Tuple[List[SemiEdge], RunStats]]:
 
         """
             Run the line sweep algorithm abstraction over the polygon, in 
             order to make it a  y-monotone polygon.
 
+            Args:
+            -----------
+                plotting: if True, the state of the sweep is plotted after every event.
+                return_stats: if True, the counters of the run (events by vertex type,
+                              size of the status, rotations of the status tree and
+                              timings) are collected and returned in a RunStats.
+                timing: timing mode of the stats, None, "perf_counter" or "cprofile".
+
             Returns:
             -----------
-                A list of diagonals that turn the polygon into a y-monotone polygon.
+                A list of diagonals that turn the polygon into a y-monotone polygon
+                (and the RunStats if return_stats is True).
+        """
+        self.stats = RunStats("SweepLineMonotonePoly", timing=timing) if return_stats else None
+
+        with (self.stats.measure() if self.stats is not None else nullcontext()):
+            self.sweep(plotting=plotting)
+
+        if self.stats is None:
+            return self.diagonals
+
+        self.stats.count("diagonals", len(self.diagonals))
+        self.stats.count("status.rotations", self.status.tree.rotations)
+        return self.diagonals, self.stats
+
+    def sweep(self, plotting: bool = False) -> None:
+        """
+            The sweep of run, it finds the diagonals.
         """
 
         # intersection points list
         self.count = 0
+        self.status = SweepStatus()
         #self.intersections = []
 
+        stats = self.stats
+        timed = (stats is not None) and stats.timed
+
         # we sort the endpoints
+        start = time.perf_counter() if timed else 0.0
         self.event_points = self.sort_and_classify_endpoints()
+        if timed:
+            stats.add_time("sort_and_classify_endpoints", time.perf_counter() - start)
         self.event_points_copy = self.event_points#deepcopy(self.event_points)
 
         # used for delimitation of the sweepline width in the x axis
@@ -479,27 +463,34 @@ class SweepLineMonotonePoly:
 
         # we iterate over the endpoints
         while len(self.event_points) > 0:
-            print("count: ", self.count)
 
             endpoint, segment, type_ = self.event_points.pop(0)
             self.update_sweepline(y = endpoint[1], type_= type_)
 
-            # we update the status tree
-            if self.status_tree is not None:
-                self.update_status_tree()
+            # the status is ordered lazily at the sweep point, so moving it is enough
+            self.status.set_sweep_point(endpoint)
 
             # we handle the event point
+            start = time.perf_counter() if timed else 0.0
             self.handle_every_event_point(endpoint, segment, type_)
+            if timed:
+                stats.add_time(f"handle_{self.VERTEX_NAMES[type_]}_vertex", time.perf_counter() - start)
 
-            print(f"Diagonals: {self.diagonals}")
-            print(f"Status tree: {self.sorted_status}")
-            print(f"Segments: {[n.extra for n in self.sorted_status]}\n")
+            if stats is not None:
+                stats.count("events")
+                stats.count(f"events.{self.VERTEX_NAMES[type_]}")
+                stats.observe("status_size", len(self.status))
+
+            #the sorted status is only built for the trace
+            if tracing.enabled:
+                self.sorted_status = self.status.inorder()
+                self.trace("event", count=self.count, point=endpoint, vertex_type=self.VERTEX_NAMES[type_],
+                           status_size=len(self.status), diagonals=len(self.diagonals),
+                           status=self.sorted_status, segments=[n.extra for n in self.sorted_status])
 
             if plotting:
                 self.plot_current_state()
             self.count += 1    
-        
-        return self.diagonals
 
     def plot_current_state(self):
 
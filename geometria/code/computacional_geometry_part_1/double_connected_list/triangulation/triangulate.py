@@ -3,13 +3,15 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 #standard imports
+import time
 from copy import deepcopy
-from typing import List, Tuple
+from contextlib import nullcontext
+from typing import List, Tuple, Union
 from matplotlib import pyplot as plt
 
 
 #custom imports
-from base import Vector, Segment
+from base import Vector, Segment, RunStats, tracing
 from sweep_line_to_monotone_polygon import SweepLineMonotonePoly
 from double_connected_list.face import Face
 from double_connected_list.geometric_node import GeometricNode
@@ -41,13 +43,23 @@ class Triangulate():
         self.curr_iter: int = 0
         self.endpoints: List[Tuple[GeometricNode, SemiEdge]] = []
         self.diagonals: List[SemiEdge] = []
+        self.stats: RunStats = None
 
 
     def convert_to_ymonotone(self, plotting: bool = False):
         """
             Converts the polygon into a y-monotone polygon.
         """
-        diagonals: List[SemiEdge] = SweepLineMonotonePoly(self.semiedges).run(plotting=plotting)
+        sweep = SweepLineMonotonePoly(self.semiedges)
+
+        if self.stats is None:
+            diagonals: List[SemiEdge] = sweep.run(plotting=plotting)
+        else:
+            #the profiler can't be nested, so the monotone sweep is only timed by perf_counter
+            timing = "perf_counter" if self.stats.timing is not None else None
+            diagonals, stats = sweep.run(plotting=plotting, return_stats=True, timing=timing)
+            self.stats.merge(stats, "monotone")
+
         self.semiedges.add_new_semi_edges(diagonals)
 
     def get_vertex_chain(self, endpoint: GeometricNode, semiedge: SemiEdge) -> bool:
@@ -70,6 +82,8 @@ class Triangulate():
         #check the turn we would have to do from the incident edge to the diagonal
         #if we were to add it 
         turn = main_edge.seg.direction(diagonal.end)
+        if self.stats is not None:
+            self.stats.count("interior_tests")
 
         #if the turn is a left turn, then the diagonal is an interior diagonal
         if (turn == 1) or (turn == 0):
@@ -103,10 +117,16 @@ class Triangulate():
         return endpoints
 
 
+    def trace(self, event: str, **fields) -> None:
+        """
+            Emits a trace record (see base.tracing) if the tracing is enabled.
+        """
+        if tracing.enabled:
+            tracing.emit("Triangulate", event, **fields)
+
     def handle_different_chains(self, endpoint: GeometricNode, semiedge: SemiEdge):
-        print("Handling different chains")
-        print(f"Endpoint: {endpoint}, Semiedge: {semiedge}")
-        print(f"Vertex stack: {self.vertex_stack}")
+        self.trace("different_chains", endpoint=endpoint, semiedge=semiedge,
+                   stack_size=len(self.vertex_stack), vertex_stack=self.vertex_stack)
         
         #pop the all the vertices in the stack
         #insert a new diagonal from the ith endpoint to each popped vertex, except the last one,
@@ -136,9 +156,8 @@ class Triangulate():
 
 
     def handle_same_chain(self, endpoint: GeometricNode, semiedge: SemiEdge):
-        print("Handling same chain")
-        print(f"Endpoint: {endpoint}, Semiedge: {semiedge}")
-        print(f"Vertex stack: {self.vertex_stack}")
+        self.trace("same_chain", endpoint=endpoint, semiedge=semiedge,
+                   stack_size=len(self.vertex_stack), vertex_stack=self.vertex_stack)
 
         diagonals = []
         
@@ -160,7 +179,7 @@ class Triangulate():
             #if the diagonal is an interior diagonal and it's not in the diagonals list
             if diagonal not in diagonals:
                 #insert the diagonal into the semiedge list
-                print(f"Diagonal inserted: {diagonal}")
+                self.trace("diagonal", diagonal=diagonal)
                 diagonals.append(diagonal)
                 last_inserted = (vertex, s)
 
@@ -188,19 +207,53 @@ class Triangulate():
         self.vertex_stack.append((endpoint, semiedge))
 
 
-    def run(self, plotting: bool = False, plotting_monotone: bool = False) -> Tuple[SemiEdgeList, List[SemiEdge]]:
+    def run(self, plotting: bool = False, plotting_monotone: bool = False, return_stats: bool = False,
+            timing: Union[str, None] = None) -> Union[Tuple[SemiEdgeList, List[SemiEdge]],
+                                                      Tuple[SemiEdgeList, List[SemiEdge], RunStats]]:
         """
             Apply the triangulation algorithm to the polygon.
+
+            Args:
+            -----------
+                plotting: if True, the state of the triangulation is plotted at every step.
+                plotting_monotone: if True, the monotone sweep is plotted.
+                return_stats: if True, the counters of the run (faces, events by chain,
+                              interior diagonal tests, size of the stack and timings,
+                              with the ones of the monotone sweep prefixed by "monotone.")
+                              are collected and returned in a RunStats.
+                timing: timing mode of the stats, None, "perf_counter" or "cprofile".
+
+            Returns:
+            -----------
+                The semiedges and the diagonals of the triangulation (and the RunStats
+                if return_stats is True).
+        """
+        self.stats = RunStats("Triangulate", timing=timing) if return_stats else None
+
+        with (self.stats.measure() if self.stats is not None else nullcontext()):
+            self.triangulate(plotting=plotting, plotting_monotone=plotting_monotone)
+
+        if self.stats is None:
+            return self.semiedges, self.diagonals
+
+        self.stats.count("diagonals", len(self.diagonals))
+        return self.semiedges, self.diagonals, self.stats
+
+    def triangulate(self, plotting: bool = False, plotting_monotone: bool = False) -> None:
+        """
+            The steps of run, it finds the diagonals.
         """
 
         self.plotting = plotting
+        stats = self.stats
+        timed = (stats is not None) and stats.timed
 
         #convert the polygon into a y-monotone polygon
-        print("Converting to y-monotone...")
+        self.trace("converting_to_ymonotone")
+        start = time.perf_counter() if timed else 0.0
         self.convert_to_ymonotone(plotting=plotting_monotone)
-        print("="*50)
-        print("*"*50)
-        print("="*50)
+        if timed:
+            stats.add_time("convert_to_ymonotone", time.perf_counter() - start)
 
         #triangulate the y-monotone polygon
         #by triangulating each face
@@ -214,15 +267,18 @@ class Triangulate():
             self.curr_iter = 0
 
             #sort the endpoints associated to the segments of the face in the lexigraphical order
+            start = time.perf_counter() if timed else 0.0
             self.endpoints = self.sort_endpoints(face.semi_edges)
+            if timed:
+                stats.add_time("sort_endpoints", time.perf_counter() - start)
+            if stats is not None:
+                stats.count("faces")
 
             #insert the first two vertices into the stack
             self.vertex_stack = [self.endpoints[0], self.endpoints[1]]
 
-            print(f"Computing triangulation for Face: {face}")
-            print("Initial state: ")
-            print(f"Vertex stack: {self.vertex_stack}")
-            print(f"Endpoints: {self.endpoints}\n")
+            self.trace("face", face=face, endpoints=len(self.endpoints),
+                       vertex_stack=self.vertex_stack)
 
 
             #plot the current state
@@ -244,14 +300,25 @@ class Triangulate():
                     self.plot_current_state()
 
                 #if the ith endpoint is in a different chain from the endpoint in top of the stack
+                start = time.perf_counter() if timed else 0.0
                 if chain_endpoint != chain_stack_top:
                     self.handle_different_chains(*self.endpoints[i])
+                    handler = "handle_different_chains"
                 #otherwise
                 else:
                     self.handle_same_chain(*self.endpoints[i])
+                    handler = "handle_same_chain"
+
+                if timed:
+                    stats.add_time(handler, time.perf_counter() - start)
+                if stats is not None:
+                    stats.count("events")
+                    stats.count("events.same_chain" if handler == "handle_same_chain" else "events.different_chains")
+                    stats.observe("stack_size", len(self.vertex_stack))
                 
-                print(f"Vertex stack: {self.vertex_stack}")
-                print()
+                self.trace("event", iteration=i, endpoint=self.endpoints[i][0],
+                           same_chain=chain_endpoint == chain_stack_top, stack_size=len(self.vertex_stack),
+                           diagonals=len(self.diagonals), vertex_stack=self.vertex_stack)
 
                 if plotting:
                     plt.title("After handling the endpoint")
@@ -277,8 +344,6 @@ class Triangulate():
             #self.semiedges.add_new_semi_edges(diagonals)
             self.diagonals.extend(diagonals)
 
-        return self.semiedges, self.diagonals
-
 
     def plot_current_state(self):
         PlotDoubleConnectedEdgeList.plot(self.semiedges)
@@ -9,4 +9,8 @@ sys.path.append(parent_dir)
 sys.path.append(parent2_dir)
 
 
-from .sweep_line import SweepLine
\ No newline at end of file
+from .sweep_line import SweepLine
+from .orthogonal_sweep import OrthogonalSweepLine, FenwickTree
+from .parallel_sweep import ParallelSweepLine
+from .intersection_engines import find_intersections, choose_method
+from .intersection_index import IntersectionIndex
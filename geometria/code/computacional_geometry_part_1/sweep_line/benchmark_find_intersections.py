@@ -0,0 +1,36 @@
+import time
+import numpy as np
+from sweep_line import *
+from base import SegmentArray
+from intersection_engines import find_intersections, choose_method
+
+# Time of every engine of find_intersections, and the one "auto" picks, for three
+# kinds of inputs: few segments, many short segments (the grid should win) and
+# long almost parallel segments, with many intersecting bounding boxes but no
+# intersections (the sweep should win).
+
+np.random.seed(69)
+
+def build_short_segments(nsegments: int, length: float = 0.02) -> SegmentArray:
+    starts = np.random.uniform(0, 1, (nsegments, 2))
+    ends = starts + np.random.uniform(-length, length, (nsegments, 2))
+    return SegmentArray(np.hstack([starts, ends]))
+
+def build_fan(nsegments: int) -> SegmentArray:
+    y = np.random.uniform(0, 1, nsegments)
+    return SegmentArray(np.column_stack([np.zeros(nsegments), y, np.ones(nsegments), 1.001 * y + 0.5]))
+
+inputs = {"few": build_short_segments(200, length=0.2),
+          "short": build_short_segments(5000),
+          "fan": build_fan(3000)}
+
+print(f"{'input':>6} {'brute (s)':>10} {'grid (s)':>9} {'sweep (s)':>10} {'k':>6}  auto")
+for name, segments in inputs.items():
+    times = []
+    for method in ("brute", "grid", "sweep"):
+        start = time.perf_counter()
+        k = len(find_intersections(segments, method=method))
+        times.append(time.perf_counter() - start)
+
+    method, _ = choose_method(segments)
+    print(f"{name:>6} {times[0]:>10.3f} {times[1]:>9.3f} {times[2]:>10.3f} {k:>6}  {method}")
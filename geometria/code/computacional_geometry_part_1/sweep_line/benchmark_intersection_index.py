@@ -0,0 +1,35 @@
+import time
+import numpy as np
+from sweep_line import *
+from base import SegmentArray
+from intersection_index import IntersectionIndex
+
+# Time to keep the intersections up to date while the segments arrive in batches:
+# a full SweepLine over all the segments after every batch, against adding the
+# batch to an IntersectionIndex (which only compares the new segments).
+
+np.random.seed(69)
+
+def build_short_segments(nsegments: int, length: float = 0.02) -> np.ndarray:
+    starts = np.random.uniform(0, 1, (nsegments, 2))
+    ends = starts + np.random.uniform(-length, length, (nsegments, 2))
+    return np.hstack([starts, ends])
+
+batches, batch_size = 10, 1000
+index, accumulated = IntersectionIndex(), []
+
+print(f"{'segments':>9} {'k':>6} {'sweep (s)':>10} {'index add (s)':>14}")
+for _ in range(batches):
+    batch = build_short_segments(batch_size)
+    accumulated.append(batch)
+
+    start = time.perf_counter()
+    k = len(SweepLine(PointSet(np.vstack(accumulated)), verbose=False).run())
+    sweep = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index.add(SegmentArray(batch))
+    added = time.perf_counter() - start
+
+    assert len(index.intersections()) == k
+    print(f"{len(index):>9} {k:>6} {sweep:>10.3f} {added:>14.4f}")
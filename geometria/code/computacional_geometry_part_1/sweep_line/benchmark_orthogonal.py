@@ -0,0 +1,40 @@
+import time
+import numpy as np
+from sweep_line import *
+from orthogonal_sweep import OrthogonalSweepLine
+
+# Counting the crossings of a full grid (n/2 horizontal lines and n/2 vertical
+# lines, so k = n^2 / 4) with OrthogonalSweepLine.count, against reporting them
+# with OrthogonalSweepLine.run and with the general SweepLine. The count only
+# depends on n, while the other two grow with k.
+
+np.random.seed(69)
+
+def build_grid(nsegments: int) -> PointSet:
+    half = nsegments // 2
+    ys = np.random.uniform(0, 1, half)
+    xs = np.random.uniform(0, 1, half)
+    horizontals = np.column_stack([np.full(half, -0.1), ys, np.full(half, 1.1), ys])
+    verticals = np.column_stack([xs, np.full(half, 1.1), xs, np.full(half, -0.1)])
+    return PointSet(np.vstack([horizontals, verticals]))
+
+def seconds_of(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+print(f"{'n':>6} {'k':>9} {'count (s)':>10} {'report (s)':>11} {'SweepLine (s)':>14}")
+for nsegments in (100, 200, 400, 800, 1600, 3200):
+    points = build_grid(nsegments)
+    sweep = OrthogonalSweepLine(points)
+
+    k = sweep.count()
+    count_seconds = seconds_of(sweep.count)
+    report_seconds = seconds_of(sweep.run)
+
+    # the general sweep is too slow for the biggest grids
+    general = "-"
+    if nsegments <= 400:
+        general = f"{seconds_of(lambda: SweepLine(points, verbose=False).run()):.3f}"
+
+    print(f"{nsegments:>6} {k:>9} {count_seconds:>10.4f} {report_seconds:>11.3f} {general:>14}")
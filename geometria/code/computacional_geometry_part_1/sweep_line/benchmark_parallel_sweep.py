@@ -0,0 +1,36 @@
+import os
+import time
+import numpy as np
+from sweep_line import *
+from parallel_sweep import ParallelSweepLine
+
+# Speedup of ParallelSweepLine against the number of workers, with short random
+# segments (the same ones of benchmark_sweep_line.py). The slabs are always the
+# same (8), so only the number of processes that sweep them changes. With one
+# worker the slabs are swept one after the other in this process.
+
+np.random.seed(69)
+
+def build_short_segments(nsegments: int, length: float = 0.02) -> PointSet:
+    starts = np.random.uniform(0, 1, (nsegments, 2))
+    ends = starts + np.random.uniform(-length, length, (nsegments, 2))
+    return PointSet(np.hstack([starts, ends]))
+
+if __name__ == "__main__":
+    nsegments, slabs = 8000, 8
+    points = build_short_segments(nsegments)
+
+    start = time.perf_counter()
+    k = len(SweepLine(points, verbose=False).run())
+    serial = time.perf_counter() - start
+    print(f"n = {nsegments}, k = {k}, cpus = {os.cpu_count()}, SweepLine: {serial:.3f} s")
+
+    print(f"{'workers':>8} {'time (s)':>9} {'k':>6} {'speedup':>8}")
+    for workers in (1, 2, 4, 8):
+        sweep = ParallelSweepLine(points, workers=workers, slabs=slabs)
+
+        start = time.perf_counter()
+        intersections = sweep.run_array()
+        seconds = time.perf_counter() - start
+
+        print(f"{workers:>8} {seconds:>9.3f} {len(intersections):>6} {serial / seconds:>7.2f}x")
@@ -0,0 +1,29 @@
+import time
+import numpy as np
+from sweep_line import *
+
+# Scaling of SweepLine.run, with short random segments (so the number of
+# intersections k grows about linearly with n). With the lazy sweep status
+# the time per (n + k) log n should stay roughly constant as n doubles.
+
+np.random.seed(69)
+
+def build_short_segments(nsegments: int, length: float = 0.02) -> PointSet:
+    starts = np.random.uniform(0, 1, (nsegments, 2))
+    ends = starts + np.random.uniform(-length, length, (nsegments, 2))
+    return PointSet(np.hstack([starts, ends]))
+
+print(f"{'n':>6} {'k':>6} {'time (s)':>9} {'us per (n+k)log n':>18} {'ratio to n/2':>13}")
+previous = None
+for nsegments in (250, 500, 1000, 2000, 4000, 8000):
+    points = build_short_segments(nsegments)
+
+    start = time.perf_counter()
+    intersections = SweepLine(points, verbose=False).run()
+    seconds = time.perf_counter() - start
+
+    k = len(intersections)
+    normalized = 1e6 * seconds / ((nsegments + k) * np.log2(nsegments))
+    ratio = "-" if previous is None else f"{seconds / previous:.2f}x"
+    print(f"{nsegments:>6} {k:>6} {seconds:>9.3f} {normalized:>18.2f} {ratio:>13}")
+    previous = seconds
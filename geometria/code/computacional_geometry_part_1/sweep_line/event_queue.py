@@ -0,0 +1,251 @@
+# add path with sys
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# standard imports
+import math
+import heapq
+from typing import Union, List, Dict, Set, Tuple, Iterable
+
+# custom dependencies
+from base.vector  import  Vector
+from base.segment import  Segment
+
+class Event:
+
+    def __init__(self, point: Vector):
+        """
+            Event point of the sweep, with every segment that has something to do
+            with the point: the ones that start there (upper), the ones that end
+            there (lower), and the ones that were found to cross there (crossing).
+
+            Args:
+            -----------
+                point: the event point.
+        """
+        self.point = point
+        self.upper : Set[Segment] = set()
+        self.lower : Set[Segment] = set()
+        self.crossing : Set[Segment] = set()
+
+    def merge(self, other: 'Event') -> None:
+        """
+            Adds the segments of other to this event.
+        """
+        self.upper |= other.upper
+        self.lower |= other.lower
+        self.crossing |= other.crossing
+
+    def segments(self) -> Set[Segment]:
+        return self.upper | self.lower | self.crossing
+
+    def __repr__(self) -> str:
+        return f"Event({self.point}, upper={list(self.upper)}, lower={list(self.lower)}, crossing={list(self.crossing)})"
+
+
+class EventQueue:
+
+    def __init__(self, tolerance: float = 0.0):
+        """
+            Priority queue of the sweep events. The points are kept in a heap keyed by
+            (-y, x), which is the same order of the Vector comparison (from top to bottom,
+            and from left to right), and a dict from the coordinates of the point to its
+            event, so the events at the same point are merged into one, and asking if a
+            point is already in the queue is O(1).
+
+            The intersections that are the same point up to the tolerance as another
+            intersection of the queue (like the same point computed from two pairs of
+            segments, which may differ in the last bits) are merged when they are pushed,
+            even if other events are between them in the heap order. To find them the
+            keys are also kept in the cells of a grid (see cell). The other events are
+            merged when they are popped, with the following ones in the heap order.
+
+            Args:
+            -----------
+                tolerance: relative tolerance to merge the events.
+        """
+        self.heap : List[Tuple[float, float]] = []
+        self.events : Dict[Tuple[float, float], Event] = {}
+        self.tolerance = tolerance
+        self.cells : Dict[Tuple[int, int, int], List[Tuple[float, float]]] = {}
+
+    @staticmethod
+    def key(point: Vector) -> Tuple[float, float]:
+        return (float(point[0]), float(point[1]))
+
+    def cell(self, key: Tuple[float, float], exponent: Union[int, None] = None) -> Tuple[int, int, int]:
+        """
+            Cell of the grid of the given magnitude (2^exponent, by default the one of
+            the point) where a point is. The cells are twice as big as the tolerance of
+            their magnitude, so the points close to a point are in its cell or in one of
+            the 8 around it, of its magnitude or of the ones next to it.
+        """
+        if exponent is None:
+            exponent = math.frexp(max(1.0, abs(key[0]), abs(key[1])))[1]
+
+        size = 2.0 * self.tolerance * 2.0 ** exponent
+        return (exponent, math.floor(key[0] / size), math.floor(key[1] / size))
+
+    def find_close(self, key: Tuple[float, float]) -> Union[Tuple[float, float], None]:
+        """
+            The key of an event at the same point up to the tolerance, or None.
+        """
+        exponent = self.cell(key)[0]
+        for magnitude in (exponent - 1, exponent, exponent + 1):
+            _, column, row = self.cell(key, magnitude)
+
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for other in self.cells.get((magnitude, column + dx, row + dy), ()):
+                        if self.close(key, other) or self.close(other, key):
+                            return other
+        return None
+
+    @staticmethod
+    def priority(key: Tuple[float, float]) -> Tuple[float, float]:
+        """
+            The key of the heap of a point, smaller is first.
+        """
+        return (-key[1], key[0])
+
+    def merge_target(self, key: Tuple[float, float], close: Tuple[float, float],
+                     crossing: Iterable[Segment], point: Vector) -> Union[Event, None]:
+        """
+            The event where an intersection can be merged with the event at the close
+            key, without handling a segment when it's not in the status:
+
+                1. if the close event is first, the intersection goes there (its
+                   segments are in the status since before the current event).
+                2. otherwise the intersection goes there if none of its segments ends
+                   before it.
+                3. otherwise the close event is moved to the intersection, if it
+                   doesn't end any segment.
+
+            Returns:
+            -----------
+                The event, or None if they have to be different events.
+        """
+        target = self.events[close]
+        if EventQueue.priority(close) < EventQueue.priority(key):
+            return target
+
+        def lower_end(segment: Segment) -> Tuple[float, float]:
+            return max(EventQueue.priority(EventQueue.key(segment.start)),
+                       EventQueue.priority(EventQueue.key(segment.end)))
+
+        if all((segment in target.lower) or (lower_end(segment) >= EventQueue.priority(close))
+               for segment in crossing):
+            return target
+
+        if not target.lower:
+            self.move(close, key, point)
+            return target
+        return None
+
+    def move(self, old: Tuple[float, float], new: Tuple[float, float], point: Vector) -> None:
+        """
+            Moves the event of the key old to the point of the key new. The old entry
+            of the heap is left there, and skipped when it's on top (see discard).
+        """
+        event = self.forget(old)
+        event.point = point
+        self.events[new] = event
+        heapq.heappush(self.heap, EventQueue.priority(new))
+        self.cells.setdefault(self.cell(new), []).append(new)
+
+    def push(self,
+             point: Vector,
+             upper: Iterable[Segment] = (),
+             lower: Iterable[Segment] = (),
+             crossing: Iterable[Segment] = ()) -> Event:
+        """
+            Adds the segments to the event of the point, the event is created
+            (and pushed into the heap, in O(log n)) only if it is a new point.
+
+            Returns:
+            -----------
+                The event of the point.
+        """
+        key = EventQueue.key(point)
+        event = self.events.get(key)
+
+        #only the intersections are merged here, an endpoint merged into an event above
+        #it could end its segment before the segment starts
+        if event is None and self.tolerance > 0 and crossing and not upper and not lower:
+            close = self.find_close(key)
+            if close is not None:
+                event = self.merge_target(key, close, crossing, point)
+
+        if event is None:
+            event = Event(point)
+            self.events[key] = event
+            heapq.heappush(self.heap, EventQueue.priority(key))
+            if self.tolerance > 0:
+                self.cells.setdefault(self.cell(key), []).append(key)
+
+        event.upper.update(upper)
+        event.lower.update(lower)
+        event.crossing.update(crossing)
+        return event
+
+    def close(self, first: Tuple[float, float], second: Tuple[float, float]) -> bool:
+        """
+            Checks if two points (as keys) are the same point up to the tolerance.
+        """
+        tolerance = self.tolerance * max(1.0, abs(first[0]), abs(first[1]))
+        return abs(first[0] - second[0]) <= tolerance and abs(first[1] - second[1]) <= tolerance
+
+    def pop(self) -> Event:
+        """
+            Removes and returns the first event, with the following events that are
+            at the same point (up to the tolerance) merged into it.
+        """
+        self.discard()
+        y, x = heapq.heappop(self.heap)
+        key = (x, -y)
+        event = self.forget(key)
+
+        self.discard()
+        while self.heap and self.close(key, (self.heap[0][1], -self.heap[0][0])):
+            y, x = heapq.heappop(self.heap)
+            event.merge(self.forget((x, -y)))
+            self.discard()
+
+        return event
+
+    def forget(self, key: Tuple[float, float]) -> Event:
+        """
+            Removes the event of a key from the dict and from the grid.
+        """
+        if self.tolerance > 0:
+            cell = self.cell(key)
+            self.cells[cell].remove(key)
+            if not self.cells[cell]:
+                del self.cells[cell]
+        return self.events.pop(key)
+
+    def discard(self) -> None:
+        """
+            Pops the entries on top of the heap whose event was moved to another point.
+        """
+        while self.heap and (self.heap[0][1], -self.heap[0][0]) not in self.events:
+            heapq.heappop(self.heap)
+
+    def peek(self) -> Union[Vector, None]:
+        """
+            The point of the first event, or None if the queue is empty.
+        """
+        self.discard()
+        if not self.heap:
+            return None
+        y, x = self.heap[0]
+        return self.events[(x, -y)].point
+
+    def __contains__(self, point: Vector) -> bool:
+        return EventQueue.key(point) in self.events
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __bool__(self) -> bool:
+        return len(self.events) > 0
@@ -0,0 +1,194 @@
+# add path with sys
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# standard imports
+import logging
+import numpy as np
+from typing import Union, List, Tuple
+
+# custom dependencies
+from base.vector  import  Vector
+from base.segment import  Segment, IntersectionKind
+from base import PointSet, SegmentArray, UniformGrid, make_point
+from sweep_line import SweepLine
+
+logger = logging.getLogger(__name__)
+
+METHODS = ("brute", "grid", "sweep")
+
+# below this size the all pairs comparison is always the fastest
+SMALL_INPUT = 256
+# size of the sample used to estimate the number of candidates and intersections
+SAMPLE_SIZE = 512
+
+# rough costs in seconds (measured with numpy on a laptop), only their ratios matter:
+# every pair of the all pairs bounding box test, every (cell, segment) entry of the grid,
+# every pair of segments in the same cell, every candidate pair that goes through the
+# orientation tests, and every event of the sweep (times log n)
+BRUTE_PAIR_COST = 1.5e-8
+GRID_ENTRY_COST = 1.5e-7
+GRID_PAIR_COST = 1e-7
+CANDIDATE_COST = 5e-7
+SWEEP_EVENT_COST = 1.6e-5
+
+def as_segment_array(segments: Union[List[Segment], PointSet, SegmentArray]) -> SegmentArray:
+    if hasattr(segments, "bboxes"):
+        return segments
+    elif isinstance(segments, PointSet):
+        return SegmentArray.from_point_set(segments)
+    return SegmentArray.from_segments(segments)
+
+def estimate_costs(array: SegmentArray, seed: int = 0) -> Tuple[dict, dict]:
+    """
+        Estimates the time of every engine. The number of candidate pairs (whose bounding
+        boxes intersect) and of intersections are estimated from a random sample of the
+        segments, scaled by the number of pairs, and the number of entries of the grid
+        and of pairs in the same cell are computed exactly (it's cheap, the long segments
+        are not in the cells, see UniformGrid.MAX_CELLS_PER_SEGMENT).
+
+        Returns:
+        -----------
+            The estimated cost of every method, and the estimates they come from.
+    """
+    nsegments = len(array)
+    sample_size = min(nsegments, SAMPLE_SIZE)
+    sample = array[np.random.default_rng(seed).choice(nsegments, sample_size, replace=False)]
+
+    bboxes = sample.bboxes
+    mask = ((bboxes[:, None, 0] <= bboxes[None, :, 2]) & (bboxes[None, :, 0] <= bboxes[:, None, 2]) &
+            (bboxes[:, None, 1] <= bboxes[None, :, 3]) & (bboxes[None, :, 1] <= bboxes[:, None, 3]))
+    sample_candidates = (mask.sum() - sample_size) / 2
+    sample_intersections = len(sample.pairwise_intersections()[0])
+
+    #every pair of the sample stands for scale pairs of the whole set
+    scale = (nsegments * (nsegments - 1)) / max(sample_size * (sample_size - 1), 1)
+
+    #the segments of a crowded cell are all paired before the bounding box test,
+    #and every oversize segment with all the segments
+    grid = UniformGrid(array)
+    cells, _ = grid.cell_entries()
+    occupancy = np.unique(cells, return_counts=True)[1].astype(np.float64)
+
+    estimates = {"segments": nsegments,
+                 "candidates": sample_candidates * scale,
+                 "intersections": sample_intersections * scale,
+                 "grid entries": float(len(cells)),
+                 "grid pairs": float((occupancy * (occupancy - 1) / 2).sum()) + float(len(grid.oversize) * nsegments),
+                 "mean length": float(np.hypot(sample.segments[:, 2] - sample.segments[:, 0],
+                                               sample.segments[:, 3] - sample.segments[:, 1]).mean())}
+
+    costs = {"brute": BRUTE_PAIR_COST * nsegments * nsegments / 2 + CANDIDATE_COST * estimates["candidates"],
+             "grid": (GRID_ENTRY_COST * estimates["grid entries"] + GRID_PAIR_COST * estimates["grid pairs"] +
+                      CANDIDATE_COST * estimates["candidates"]),
+             "sweep": SWEEP_EVENT_COST * (nsegments + estimates["intersections"]) * np.log2(max(nsegments, 2))}
+    return costs, estimates
+
+def choose_method(segments: Union[List[Segment], PointSet, SegmentArray]) -> Tuple[str, str]:
+    """
+        Picks the engine for find_intersections.
+
+        Returns:
+        -----------
+            The method ("brute", "grid" or "sweep"), and the reason why it was chosen.
+    """
+    array = as_segment_array(segments)
+
+    if len(array) <= SMALL_INPUT:
+        return "brute", f"only {len(array)} segments (<= {SMALL_INPUT})"
+
+    costs, estimates = estimate_costs(array)
+    method = min(costs, key=costs.get)
+
+    reason = (f"{estimates['segments']} segments, mean length {estimates['mean length']:.3g}, "
+              f"~{estimates['candidates']:.0f} candidate pairs, ~{estimates['intersections']:.0f} intersections, "
+              f"{estimates['grid entries']:.0f} grid entries, {estimates['grid pairs']:.0f} pairs in the same cell; "
+              f"estimated seconds: " +
+              ", ".join(f"{name} {cost:.3g}" for name, cost in costs.items()))
+    return method, reason
+
+def merge_points(points: np.ndarray, tolerance: float = 1e-9) -> np.ndarray:
+    """
+        Removes the repeated points, the points that are the same up to the tolerance
+        (computed from different pairs of segments, so they can differ in the last bits)
+        are merged.
+
+        Returns:
+        -----------
+            (K, 2) array with the points in the Vector order.
+    """
+    points = np.unique(points.reshape((-1, 2)), axis=0)
+    if len(points) < 2:
+        return points
+
+    #the y that differ in the last bits go to the same row, so the repeated points are consecutive
+    scale = tolerance * max(1.0, float(np.abs(points).max()))
+    rows = np.round(points[:, 1] / scale)
+    points = points[np.lexsort((points[:, 0], -rows))]
+
+    repeated = (np.abs(points[1:] - points[:-1]).max(axis=1) <= scale)
+    points = points[np.r_[True, ~repeated]]
+    return points[np.lexsort((points[:, 0], -points[:, 1]))]
+
+def pairs_to_points(array: SegmentArray, pairs: np.ndarray, points: np.ndarray, kinds: np.ndarray,
+                    tolerance: float = 1e-9) -> np.ndarray:
+    """
+        Turns the intersecting pairs into the intersection points, like the sweep reports
+        them: every point once, and the overlapping segments by the two ends of the shared piece.
+
+        Returns:
+        -----------
+            (K, 2) array with the points in the Vector order.
+    """
+    #the pairs only carry the first point of an overlap, the last one is added
+    overlaps = [array.segment(i).intersect(array.segment(j))[1] for i, j in pairs[kinds == IntersectionKind.OVERLAP].tolist()]
+    last = np.array([(float(o.end[0]), float(o.end[1])) for o in overlaps]).reshape((-1, 2))
+
+    return merge_points(np.vstack([points, last]), tolerance=tolerance)
+
+def find_intersections(segments: Union[List[Segment], PointSet, SegmentArray], method: str = "auto",
+                       tolerance: float = 1e-9) -> List[Vector]:
+    """
+        Finds all the intersection points of the segments, like SweepLine.run (the
+        points that are the same up to the tolerance are reported once), using one of the engines:
+
+            brute: all pairs comparison, with numpy (SegmentArray.pairwise_intersections).
+            grid: uniform grid broad phase (UniformGrid), for many short segments.
+            sweep: the line sweep (SweepLine), for segments with few intersections
+                   but many pairs of intersecting bounding boxes (like long, almost parallel ones).
+
+        With method "auto" the engine is chosen from the number of segments and the
+        estimates of a random sample (see choose_method), the choice is logged.
+
+        Args:
+        -----------
+            segments: list of segments, a PointSet where every two consecutive points
+                      are the ends of a segment, or a SegmentArray.
+            method: "auto", "brute", "grid" or "sweep".
+            tolerance: relative tolerance to merge the intersection points.
+
+        Returns:
+        -----------
+            All the intersection points as a list of vectors, in the sweep order.
+    """
+    if (method != "auto") and (method not in METHODS):
+        raise ValueError(f"method should be 'auto' or one of {METHODS}, yet is: {method}")
+
+    array = as_segment_array(segments)
+
+    if method == "auto":
+        method, reason = choose_method(array)
+        logger.info("find_intersections: using %s, %s", method, reason)
+
+    if method == "sweep":
+        segments = segments if isinstance(segments, list) else array.to_segments()
+        #the sweep already reports every point once, in its order
+        return SweepLine(segments, tolerance=tolerance, verbose=False).run()
+    else:
+        if method == "grid":
+            pairs, points, kinds = UniformGrid(array).pairwise_intersections()
+        else:
+            pairs, points, kinds = array.pairwise_intersections()
+        points = pairs_to_points(array, pairs, points, kinds, tolerance=tolerance)
+
+    return [make_point(x, y) for x, y in points.tolist()]
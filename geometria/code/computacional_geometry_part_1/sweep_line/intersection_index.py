@@ -0,0 +1,311 @@
+# add path with sys
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# standard imports
+import numpy as np
+from typing import Union, List, Tuple, Dict, Set, Iterable
+
+# custom dependencies
+from base.vector  import  Vector
+from base.segment import  Segment, IntersectionKind
+from base import PointSet, SegmentArray, UniformGrid, make_point
+from intersection_engines import as_segment_array, merge_points
+
+class IntersectionIndex:
+
+    # the segments whose bounding box covers more cells than this are not put in
+    # the grid, they are compared with every segment (by their bounding boxes)
+    MAX_CELLS_PER_SEGMENT = 64
+
+    # the rows of the removed segments are dropped once they are more than this
+    # fraction of the rows, so a long running index doesn't keep growing
+    MAX_DEAD_FRACTION = 0.5
+
+    def __init__(self, segments: Union[List[Segment], PointSet, SegmentArray, None] = None,
+                 cell_size: float = None, tolerance: float = 1e-9):
+
+        """
+            Keeps a set of segments and their intersections up to date while segments
+            are added and removed in batches, instead of sweeping the whole set again
+            after every batch. The segments are kept in a uniform grid (a dict from the
+            cell to the ids of the segments whose bounding box covers it), so a new
+            segment is only compared with the old and new segments that share a cell
+            with it. Every intersecting pair keeps its points, so removing a segment
+            only drops the pairs it is part of. The segments that are long for the cells
+            (see MAX_CELLS_PER_SEGMENT) are kept apart, and compared with all the others.
+
+            The segments are kept as rows of a buffer that doubles its capacity when it's
+            full, so adding a batch doesn't copy all the rows, and the rows of the removed
+            segments are compacted (see MAX_DEAD_FRACTION). The ids don't change when
+            the rows are moved.
+
+            The intersections are always the same as the ones of a full run over the
+            current segments (find_intersections or SweepLine.run).
+
+            Args:
+            -----------
+                segments: first batch of segments (optional).
+                cell_size: side of the cells, by default the one of a UniformGrid
+                           over the first batch. The grid is fixed after that, so
+                           it works best if the batches have similar segments.
+                tolerance: relative tolerance to merge the intersection points.
+        """
+        self.cell_size = cell_size
+        self.tolerance = tolerance
+
+        #the first size rows of the buffer are in use, sorted by their ids, the
+        #removed ones are only marked as not alive until they are compacted
+        self.rows = np.empty((0, 4))
+        self.alive = np.empty(0, dtype=bool)
+        self.row_ids = np.empty(0, dtype=np.int64)
+        self.size = 0
+        self.count = 0
+        self.next_id = 0
+
+        self.cells : Dict[Tuple[int, int], Set[int]] = {}
+        #the ids of the segments that are not in the grid
+        self.oversize : Set[int] = set()
+        #the points of every intersecting pair (i < j), and the pairs of every segment
+        self.records : Dict[Tuple[int, int], np.ndarray] = {}
+        self.partners : Dict[int, Set[int]] = {}
+
+        if segments is not None:
+            self.add(segments)
+
+    #================================================
+    #               Spatial index
+    #================================================
+
+    def cells_of(self, ids: np.ndarray) -> List[Union[List[Tuple[int, int]], None]]:
+        """
+            The cells covered by the bounding box of every segment, or None for the
+            segments that cover more than MAX_CELLS_PER_SEGMENT cells.
+        """
+        rows = self.rows[self.rows_of(ids)]
+        bboxes = np.column_stack([np.minimum(rows[:, 0], rows[:, 2]), np.minimum(rows[:, 1], rows[:, 3]),
+                                  np.maximum(rows[:, 0], rows[:, 2]), np.maximum(rows[:, 1], rows[:, 3])])
+
+        #the number of cells is computed with floats, so a huge one doesn't overflow
+        ranges = np.floor(bboxes / self.cell_size)
+        counts = (ranges[:, 2] - ranges[:, 0] + 1) * (ranges[:, 3] - ranges[:, 1] + 1)
+
+        cells = []
+        for (ix0, iy0, ix1, iy1), count in zip(ranges.tolist(), counts.tolist()):
+            if count > IntersectionIndex.MAX_CELLS_PER_SEGMENT:
+                cells.append(None)
+                continue
+            cells.append([(ix, iy) for ix in range(int(ix0), int(ix1) + 1) for iy in range(int(iy0), int(iy1) + 1)])
+        return cells
+
+    #================================================
+    #               Rows
+    #================================================
+
+    def rows_of(self, ids: np.ndarray) -> np.ndarray:
+        """
+            The rows of the ids (they are sorted, so it's a binary search).
+        """
+        return np.searchsorted(self.row_ids[:self.size], ids)
+
+    def append(self, segments: np.ndarray) -> np.ndarray:
+        """
+            Puts the segments in the rows after the used ones, the buffer doubles its
+            capacity if they don't fit.
+
+            Returns:
+            -----------
+                The ids of the segments.
+        """
+        n = len(segments)
+        if self.size + n > len(self.rows):
+            capacity = max(2 * len(self.rows), self.size + n, 16)
+            self.rows = np.concatenate([self.rows[:self.size], np.empty((capacity - self.size, 4))])
+            self.alive = np.concatenate([self.alive[:self.size], np.zeros(capacity - self.size, dtype=bool)])
+            self.row_ids = np.concatenate([self.row_ids[:self.size], np.empty(capacity - self.size, dtype=np.int64)])
+
+        ids = np.arange(self.next_id, self.next_id + n, dtype=np.int64)
+        rows = slice(self.size, self.size + n)
+        self.rows[rows] = segments
+        self.alive[rows] = True
+        self.row_ids[rows] = ids
+
+        self.size += n
+        self.count += n
+        self.next_id += n
+        return ids
+
+    def compact(self) -> None:
+        """
+            Moves the rows of the segments in the index to the start of the buffer,
+            and shrinks it if it's mostly empty.
+        """
+        keep = self.alive[:self.size]
+        n = int(keep.sum())
+        capacity = len(self.rows) if len(self.rows) <= 4 * max(n, 16) else 2 * max(n, 16)
+
+        rows, row_ids = self.rows[:self.size][keep], self.row_ids[:self.size][keep]
+        self.rows = np.concatenate([rows, np.empty((capacity - n, 4))])
+        self.row_ids = np.concatenate([row_ids, np.empty(capacity - n, dtype=np.int64)])
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.alive[:n] = True
+
+        self.size = n
+
+    #================================================
+    #               Updates
+    #================================================
+
+    def add(self, segments: Union[List[Segment], PointSet, SegmentArray]) -> np.ndarray:
+        """
+            Adds a batch of segments, and finds their intersections with the segments
+            already in the index and with each other.
+
+            Returns:
+            -----------
+                The ids of the new segments (used to remove them).
+        """
+        array = as_segment_array(segments)
+        if len(array) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        if self.cell_size is None:
+            self.cell_size = UniformGrid(array).cell_size
+
+        ids = self.append(array.segments)
+
+        #every new segment is paired with the ones already in its cells, which are
+        #the old ones and the new ones inserted before it, so every pair is found once
+        ii, jj = [], []
+        for index, row, cells in zip(ids.tolist(), self.rows_of(ids).tolist(), self.cells_of(ids)):
+            if cells is None:
+                #a long segment is paired with all the segments before it
+                neighbours = set(self.row_ids[:row][self.alive[:row]].tolist())
+                self.oversize.add(index)
+            else:
+                neighbours = set(self.oversize)
+                for cell in cells:
+                    members = self.cells.setdefault(cell, set())
+                    neighbours |= members
+                    members.add(index)
+
+            ii.extend(neighbours)
+            jj.extend([index] * len(neighbours))
+
+        self.classify(np.array(ii, dtype=np.int64), np.array(jj, dtype=np.int64))
+        return ids
+
+    def classify(self, ii: np.ndarray, jj: np.ndarray) -> None:
+        """
+            Finds which of the candidate pairs (ii[k] < jj[k]) intersect, and keeps their points.
+        """
+        if len(ii) == 0:
+            return
+
+        #only the segments of the candidates are compared
+        used, inverse = np.unique(np.concatenate([ii, jj]), return_inverse=True)
+        array = SegmentArray(self.rows[self.rows_of(used)], copy=False)
+        local_i, local_j = inverse[:len(ii)], inverse[len(ii):]
+
+        bbox_i, bbox_j = array.bboxes[local_i], array.bboxes[local_j]
+        overlap = ((bbox_i[:, 0] <= bbox_j[:, 2]) & (bbox_j[:, 0] <= bbox_i[:, 2]) &
+                   (bbox_i[:, 1] <= bbox_j[:, 3]) & (bbox_j[:, 1] <= bbox_i[:, 3]))
+        ii, jj, local_i, local_j = ii[overlap], jj[overlap], local_i[overlap], local_j[overlap]
+
+        kinds, points = array._classify_pairs(local_i, local_j)
+
+        for k in np.flatnonzero(kinds != IntersectionKind.NONE).tolist():
+            i, j = int(ii[k]), int(jj[k])
+            found = [points[k]]
+
+            #the overlapping segments are reported by the two ends of the shared piece
+            if kinds[k] == IntersectionKind.OVERLAP:
+                shared = array.segment(local_i[k]).intersect(array.segment(local_j[k]))[1]
+                found.append([float(shared.end[0]), float(shared.end[1])])
+
+            self.records[(i, j)] = np.array(found, dtype=np.float64)
+            self.partners.setdefault(i, set()).add(j)
+            self.partners.setdefault(j, set()).add(i)
+
+    def remove(self, ids: Iterable[int]) -> None:
+        """
+            Removes the segments with the given ids, and their intersections.
+        """
+        ids = np.unique(np.array(list(ids), dtype=np.int64))
+        for index in ids.tolist():
+            if index not in self:
+                raise ValueError(f"There is no segment with id {index} in the index")
+
+        for index, cells in zip(ids.tolist(), self.cells_of(ids)):
+            if cells is None:
+                self.oversize.discard(index)
+                cells = []
+
+            for cell in cells:
+                members = self.cells[cell]
+                members.discard(index)
+                if not members:
+                    del self.cells[cell]
+
+            for partner in self.partners.pop(index, set()):
+                self.partners[partner].discard(index)
+                self.records.pop((min(index, partner), max(index, partner)))
+
+        self.alive[self.rows_of(ids)] = False
+        self.count -= len(ids)
+
+        if self.size - self.count > IntersectionIndex.MAX_DEAD_FRACTION * self.size:
+            self.compact()
+
+    #================================================
+    #               Results
+    #================================================
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.row_ids[:self.size][self.alive[:self.size]]
+
+    @property
+    def segments(self) -> SegmentArray:
+        """
+            The current segments, in the order of their ids.
+        """
+        return SegmentArray(self.rows[:self.size][self.alive[:self.size]])
+
+    def pairs(self) -> List[Tuple[int, int]]:
+        """
+            The ids (i, j) of the intersecting segments, i < j, sorted.
+        """
+        return sorted(self.records)
+
+    def intersection_array(self) -> np.ndarray:
+        """
+            Returns:
+            -----------
+                (K, 2) array with the intersections of the current segments, in the Vector order.
+        """
+        if not self.records:
+            return np.empty((0, 2))
+        return merge_points(np.vstack(list(self.records.values())), tolerance=self.tolerance)
+
+    def intersections(self) -> List[Vector]:
+        """
+            Returns:
+            -----------
+                All the intersection points of the current segments as a list of vectors, in the sweep order.
+        """
+        return [make_point(x, y) for x, y in self.intersection_array().tolist()]
+
+    #================================================
+    #               Operator overloading
+    #================================================
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, index: int) -> bool:
+        row = int(self.rows_of(np.array([index]))[0])
+        return (row < self.size) and (int(self.row_ids[row]) == index) and bool(self.alive[row])
+
+    def __repr__(self) -> str:
+        return f"IntersectionIndex({len(self)} segments, {len(self.records)} intersecting pairs, {len(self.cells)} cells)"
@@ -1,18 +1,15 @@
-import os
-import pandas as pd 
+import os, sys
 from sweep_line import *
+from base import tracing
 
 def from_csv_2_segments(file: str = "segmentos.csv") -> List[Segment]:
-    #dataframe with columns x0, y0, x1, y1
+    #csv with columns x0, y0, x1, y1, every row is read as two consecutive points
     dir_ = os.path.dirname(os.path.abspath(__file__))
-    df = pd.read_csv(os.path.join(dir_, file))
-    segments = []
+    points = PointSet.from_csv(os.path.join(dir_, file), columns=("x0", "y0", "x1", "y1"))
+    return points.to_segments(sort_ends=True)
 
-    for index, row in df.iterrows():
-        start = Vector(np.array([[row["x0"]], [row["y0"]]]))
-        end = Vector(np.array([[row["x1"]], [row["y1"]]]))
-        segments.append(Segment(start, end, sort_ends=True))
-    return segments
+#every event of the sweep is written to the console
+tracing.enable(stream=sys.stdout)
 
 custom_test_segments = from_csv_2_segments()
 intersects = SweepLine(custom_test_segments).run(plotting=0)
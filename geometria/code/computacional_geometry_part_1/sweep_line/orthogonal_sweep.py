@@ -0,0 +1,283 @@
+# add path with sys
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# standard imports
+import numpy as np
+from typing import Union, List, Tuple, Iterator
+
+# custom dependencies
+from base.vector  import  Vector
+from base.segment import  Segment
+from base import PointSet, SegmentArray, make_point, tracing
+from sweep_line import SweepLine
+
+class FenwickTree:
+
+    def __init__(self, size: int):
+        """
+            Fenwick (binary indexed) tree over the positions 0, ..., size - 1,
+            it adds to a position and sums a prefix in O(log n).
+
+            Args:
+            -----------
+                size: number of positions.
+        """
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int) -> None:
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & (-index)
+
+    def prefix(self, index: int) -> int:
+        """
+            Sum of the positions 0, ..., index (0 if index is negative).
+        """
+        total = 0
+        index += 1
+        while index > 0:
+            total += self.tree[index]
+            index -= index & (-index)
+        return total
+
+    def range_sum(self, lo: int, hi: int) -> int:
+        """
+            Sum of the positions lo, ..., hi (both included).
+        """
+        if hi < lo:
+            return 0
+        return self.prefix(hi) - self.prefix(lo - 1)
+
+    def find(self, k: int) -> int:
+        """
+            The first position whose prefix sum is at least k (k >= 1), found by
+            going down the implicit tree in O(log n).
+        """
+        position = 0
+        step = 1 << self.size.bit_length()
+
+        while step > 0:
+            if (position + step <= self.size) and (self.tree[position + step] < k):
+                position += step
+                k -= self.tree[position]
+            step >>= 1
+        return position
+
+
+class OrthogonalSweepLine:
+
+    # order of the events at the same height, the verticals that start there are
+    # added before the horizontals are checked, and the ones that end there are
+    # removed after, so the segments that touch count as crossing
+    VERTICAL_START = 0
+    HORIZONTAL = 1
+    VERTICAL_END = 2
+
+    def __init__(self, segments: Union[List[Segment], PointSet, SegmentArray], fallback: bool = True,
+                 verbose: bool = False):
+
+        """
+            Line sweep for sets of horizontal and vertical segments. The sweepline goes
+            from top to bottom, keeping the vertical segments it crosses in a Fenwick tree
+            over their (compressed) x coordinates, so every horizontal segment counts the
+            verticals it crosses with two prefix sums. Counting is O(n log n), whatever
+            the number k of crossings is, and reporting them is O((n + k) log n).
+
+            Only the crossings of an horizontal with a vertical segment are found (the
+            overlaps of parallel segments are not), and they are counted by pairs of segments.
+            The segments without length are taken as horizontal.
+
+            Args:
+            -----------
+                segments: list of segments, a PointSet where every two consecutive points
+                          are the ends of a segment, or a SegmentArray.
+                fallback: what to do if there are segments that are not orthogonal, if True
+                          the general SweepLine is used, otherwise a ValueError is raised.
+                verbose: if True, the general SweepLine traces its events (see base.tracing).
+        """
+
+        if hasattr(segments, "bboxes"):
+            self.array = segments
+        elif isinstance(segments, PointSet):
+            self.array = SegmentArray.from_point_set(segments)
+        else:
+            self.array = SegmentArray.from_segments(segments)
+
+        self.segments = segments
+        self.fallback = fallback
+        self.verbose = verbose
+
+        xmin, ymin, xmax, ymax = self.array.bboxes.T
+        self.horizontal = ymin == ymax
+        self.vertical = (xmin == xmax) & ~self.horizontal
+        self.orthogonal = bool(np.all(self.horizontal | self.vertical))
+
+    def trace(self, event: str, **fields) -> None:
+        if self.verbose and tracing.enabled:
+            tracing.emit("OrthogonalSweepLine", event, **fields)
+
+    def general_sweep(self) -> SweepLine:
+        """
+            The general SweepLine for the same segments, used when they are not orthogonal.
+        """
+        if not self.fallback:
+            raise ValueError("The segments should be horizontal or vertical, use SweepLine instead.")
+
+        self.trace("fallback", reason="the segments are not orthogonal, using SweepLine")
+        segments = self.segments
+        if hasattr(segments, "bboxes"):
+            segments = segments.to_segments()
+        return SweepLine(segments, verbose=self.verbose)
+
+    def segment_list(self) -> List[Segment]:
+        """
+            The segments as a list, the same objects if they were given as Segments.
+        """
+        if isinstance(self.segments, list):
+            return self.segments
+        return self.array.to_segments()
+
+    def sorted_events(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            The events of the sweep, from top to bottom, and at the same height
+            in the order VERTICAL_START, HORIZONTAL, VERTICAL_END.
+
+            Returns:
+            -----------
+                The kind of every event, and the index of its segment.
+        """
+        xmin, ymin, xmax, ymax = self.array.bboxes.T
+        vertical = np.flatnonzero(self.vertical)
+        horizontal = np.flatnonzero(self.horizontal)
+
+        heights = np.concatenate([ymax[vertical], ymin[horizontal], ymin[vertical]])
+        kinds = np.concatenate([np.full(len(vertical), self.VERTICAL_START),
+                                np.full(len(horizontal), self.HORIZONTAL),
+                                np.full(len(vertical), self.VERTICAL_END)])
+        indices = np.concatenate([vertical, horizontal, vertical])
+
+        #the last key is the primary one
+        order = np.lexsort((kinds, -heights))
+        return kinds[order], indices[order]
+
+    def compress(self) -> Tuple[np.ndarray, List[int], List[int], List[int]]:
+        """
+            Compresses the x coordinates of the vertical segments to the positions
+            of the Fenwick tree.
+
+            Returns:
+            -----------
+                The distinct x of the verticals, the position of every segment (only
+                meaningful for the verticals), and the range of positions [lo, hi]
+                that every segment covers (only meaningful for the horizontals).
+        """
+        xmin, ymin, xmax, ymax = self.array.bboxes.T
+        xs = np.unique(xmin[self.vertical])
+
+        positions = np.searchsorted(xs, xmin)
+        lo = np.searchsorted(xs, xmin, side="left")
+        hi = np.searchsorted(xs, xmax, side="right") - 1
+        #python ints are faster than numpy scalars in the Fenwick tree loops
+        return xs, positions.tolist(), lo.tolist(), hi.tolist()
+
+    def count(self) -> int:
+        """
+            Counts the pairs of crossing segments, without finding them.
+        """
+        if not self.orthogonal:
+            #every point where m segments meet is a crossing of m (m - 1) / 2 pairs
+            return sum(len(s) * (len(s) - 1) // 2 for _, s in self.general_sweep().iter_intersections())
+
+        xs, positions, lo, hi = self.compress()
+        kinds, indices = self.sorted_events()
+        fenwick = FenwickTree(len(xs))
+
+        total = 0
+        for kind, index in zip(kinds.tolist(), indices.tolist()):
+            if kind == self.VERTICAL_START:
+                fenwick.add(positions[index], 1)
+            elif kind == self.VERTICAL_END:
+                fenwick.add(positions[index], -1)
+            else:
+                total += fenwick.range_sum(lo[index], hi[index])
+
+        return total
+
+    def iter_intersections(self,
+                           first_k: int = None,
+                           any_intersection: bool = False) -> Iterator[Tuple[Vector, List[Segment]]]:
+
+        """
+            Generator of the crossings, with the same records and early termination
+            as SweepLine.iter_intersections. The crossings are yielded from top to
+            bottom, and from left to right along every horizontal segment.
+
+            Args:
+            -----------
+                first_k: if given, the sweep stops after the first k crossings.
+                any_intersection: if True, the sweep stops after the first crossing.
+
+            Returns:
+            -----------
+                An iterator of tuples (intersection, [horizontal, vertical]).
+        """
+        if not self.orthogonal:
+            yield from self.general_sweep().iter_intersections(first_k=first_k, any_intersection=any_intersection)
+            return
+
+        if any_intersection:
+            first_k = 1
+
+        if (first_k is not None) and (first_k <= 0):
+            return
+
+        xs, positions, lo, hi = self.compress()
+        kinds, indices = self.sorted_events()
+        fenwick = FenwickTree(len(xs))
+
+        #verticals that are crossing the sweepline at every position (dicts keep their order)
+        active = [dict() for _ in range(len(xs))]
+
+        segments = self.segment_list()
+
+        found = 0
+        for kind, index in zip(kinds.tolist(), indices.tolist()):
+            if kind == self.VERTICAL_START:
+                fenwick.add(positions[index], 1)
+                active[positions[index]][index] = None
+                continue
+
+            if kind == self.VERTICAL_END:
+                fenwick.add(positions[index], -1)
+                del active[positions[index]][index]
+                continue
+
+            #walk over the occupied positions of the range, from left to right
+            rank = fenwick.prefix(lo[index] - 1) + 1
+            last = fenwick.prefix(hi[index])
+            y = float(self.array.bboxes[index, 1])
+
+            while rank <= last:
+                position = fenwick.find(rank)
+                rank += len(active[position])
+
+                for vertical in active[position]:
+                    yield make_point(float(xs[position]), y), [segments[index], segments[vertical]]
+                    found += 1
+
+                    # the consumer already has all the crossings it asked for
+                    if (first_k is not None) and (found >= first_k):
+                        return
+
+    def run(self) -> List[Vector]:
+        """
+            Finds all the crossings.
+
+            Returns:
+            -----------
+                The crossing points as a list of vectors, one per pair of crossing segments.
+        """
+        return [point for point, segments in self.iter_intersections()]
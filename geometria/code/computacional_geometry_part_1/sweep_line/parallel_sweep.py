@@ -0,0 +1,251 @@
+# add path with sys
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# standard imports
+import numpy as np
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, List, Tuple
+
+# custom dependencies
+from base.vector  import  Vector
+from base.segment import  Segment
+from base import PointSet, SegmentArray, make_point
+from sweep_line import SweepLine
+from intersection_engines import merge_points
+
+def clip_to_slab(segments: np.ndarray, lo: float, hi: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+        Clips the segments (rows x0, y0, x1, y1) to the vertical slab lo <= x <= hi,
+        the segments that don't reach the slab are dropped. The ends that are inside
+        the slab are kept as they are, and the vertical segments are never cut.
+
+        Returns:
+        -----------
+            The clipped segments, and the index of the segment each one comes from.
+    """
+    #every row goes from left to right
+    swap = segments[:, 2] < segments[:, 0]
+    segments = np.where(swap[:, None], segments[:, [2, 3, 0, 1]], segments)
+
+    indices = np.flatnonzero((segments[:, 2] >= lo) & (segments[:, 0] <= hi))
+    segments = segments[indices]
+
+    x0, y0, x1, y1 = segments.T
+    vertical = x0 == x1
+    slope = np.divide(y1 - y0, x1 - x0, out=np.zeros_like(y0), where=~vertical)
+
+    cut_left = (x0 < lo) & ~vertical
+    cut_right = (x1 > hi) & ~vertical
+
+    clipped = segments.copy()
+    clipped[cut_left, 0] = lo
+    clipped[cut_left, 1] = y0[cut_left] + (lo - x0[cut_left]) * slope[cut_left]
+    clipped[cut_right, 2] = hi
+    clipped[cut_right, 3] = y0[cut_right] + (hi - x0[cut_right]) * slope[cut_right]
+    return clipped, indices
+
+def meet_at(point: np.ndarray, segments: np.ndarray, tolerance: float) -> bool:
+    """
+        Checks with the original segments if the point of a record found on a slab
+        boundary is an event of the whole sweep: the segments meet there with an
+        endpoint, or two of them cross there. Otherwise (collinear segments that
+        were cut at the boundary) it's only an end made by the clipping.
+    """
+    if len(segments) < 2:
+        return False
+
+    scale = tolerance * max(1.0, float(np.abs(point).max()))
+    if (np.abs(segments[:, 0:2] - point).max(axis=1) <= scale).any():
+        return True
+    if (np.abs(segments[:, 2:4] - point).max(axis=1) <= scale).any():
+        return True
+
+    directions = segments[:, 2:4] - segments[:, 0:2]
+    directions = directions / np.linalg.norm(directions, axis=1)[:, None]
+    cross = directions[:, None, 0] * directions[None, :, 1] - directions[:, None, 1] * directions[None, :, 0]
+    return bool((np.abs(cross) > tolerance).any())
+
+def sweep_slab(name: str, shape: Tuple[int, int], nsegments: int, start: int, stop: int,
+               lo: float, hi: float, tolerance: float) -> np.ndarray:
+    """
+        Runs the SweepLine over the rows [start, stop) of the shared memory array,
+        which are the segments clipped to one slab. It is run by the workers, so
+        only the name of the shared memory and some numbers are sent to them.
+
+        The shared array has the nsegments original segments first, and then the
+        clipped ones, every row is (x0, y0, x1, y1, index of the original segment).
+
+        Returns:
+        -----------
+            (K, 2) array with the intersections whose x is in [lo, hi] (up to the tolerance).
+    """
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        shared = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+        rows = shared[start:stop].copy()
+
+        #every piece is tagged with its segment, so two equal pieces of different segments are kept
+        segments = [Segment(make_point(x0, y0), make_point(x1, y1), layer=int(index))
+                    for x0, y0, x1, y1, index in rows.tolist()]
+        sweep = SweepLine(segments, tolerance=tolerance, verbose=False)
+
+        points = []
+        for point, records in sweep.iter_intersections():
+            x, y = float(point[0]), float(point[1])
+            if (x < lo - tolerance * max(1.0, abs(lo))) or (x > hi + tolerance * max(1.0, abs(hi))):
+                continue
+
+            #the ends of the clipped pieces are on the boundaries
+            on_boundary = (x == lo) or (x == hi)
+            if on_boundary:
+                indices = sorted({segment.layer for segment in records})
+                if not meet_at(np.array([x, y]), shared[indices, 0:4].copy(), tolerance):
+                    continue
+
+            points.append((x, y))
+
+        del shared
+    finally:
+        memory.close()
+
+    return np.array(points, dtype=np.float64).reshape((-1, 2))
+
+
+class ParallelSweepLine:
+
+    def __init__(self, segments: Union[List[Segment], PointSet, SegmentArray], workers: int = None,
+                 slabs: int = None, tolerance: float = 1e-9):
+
+        """
+            Runs the SweepLine in parallel, over vertical slabs. The slab boundaries are
+            the x quantiles of the endpoints (so every slab gets about the same number of
+            them), every segment is clipped to the slabs it crosses, and the clipped
+            segments of all the slabs are written once to a shared memory block, which
+            the workers of a process pool read. Every slab reports the intersections
+            inside it (up to the tolerance), the repeated ones (like the ones on the
+            boundary of two slabs) are merged, and the ends made by the clipping are
+            not reported.
+
+            Args:
+            -----------
+                segments: list of segments, a PointSet where every two consecutive points
+                          are the ends of a segment, or a SegmentArray.
+                workers: number of processes, by default the number of cpus. With one
+                         worker the slabs are swept in this process.
+                slabs: number of slabs, by default the number of workers.
+                tolerance: relative tolerance of the sweeps, also used to merge
+                           the intersections on the boundaries of the slabs.
+        """
+        if hasattr(segments, "bboxes"):
+            self.array = segments
+        elif isinstance(segments, PointSet):
+            self.array = SegmentArray.from_point_set(segments)
+        else:
+            self.array = SegmentArray.from_segments(segments)
+
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.slabs = slabs if slabs is not None else self.workers
+        self.tolerance = tolerance
+
+        self.boundaries : np.ndarray = None
+        self.slab_sizes : List[int] = None
+
+    def slab_boundaries(self) -> np.ndarray:
+        """
+            The x of the boundaries of the slabs, including the leftmost and rightmost
+            x of the segments, taken from the quantiles of the x of the endpoints.
+        """
+        xs = np.concatenate([self.array.segments[:, 0], self.array.segments[:, 2]])
+        if len(xs) == 0:
+            return xs
+        quantiles = np.quantile(xs, np.linspace(0, 1, self.slabs + 1))
+        return np.unique(quantiles)
+
+    def build_slabs(self) -> Tuple[np.ndarray, List[Tuple[int, int, float, float]]]:
+        """
+            Clips the segments to every slab.
+
+            Returns:
+            -----------
+                The original segments followed by the clipped segments of every slab,
+                with the index of their original segment as a fifth column, and for
+                every slab with segments its rows [start, stop) and its x range [lo, hi].
+        """
+        self.boundaries = self.slab_boundaries()
+        pieces, ranges = [], []
+
+        #the original segments go first, so the workers can check the boundaries with them
+        nsegments = len(self.array.segments)
+        pieces.append(np.column_stack([self.array.segments, np.arange(nsegments)]))
+
+        start = nsegments
+        for lo, hi in zip(self.boundaries[:-1].tolist(), self.boundaries[1:].tolist()):
+            clipped, indices = clip_to_slab(self.array.segments, lo, hi)
+            #a slab between two far apart segments has nothing to sweep
+            if len(clipped) == 0:
+                continue
+
+            pieces.append(np.column_stack([clipped, indices]))
+            ranges.append((start, start + len(clipped), lo, hi))
+            start += len(clipped)
+
+        self.slab_sizes = [stop - start for start, stop, _, _ in ranges]
+        return np.vstack(pieces), ranges
+
+    def merge(self, results: List[np.ndarray]) -> np.ndarray:
+        """
+            Joins the intersections of every slab. The ones close to a boundary may
+            come from the two slabs (computed from different clipped segments, so they
+            can differ in the last bits), and the ones inside a slab may also be repeated
+            up to the tolerance, so all of them are merged up to the tolerance.
+
+            Returns:
+            -----------
+                (K, 2) array with the intersections in the Vector order.
+        """
+        points = np.vstack(results) if results else np.empty((0, 2))
+        return merge_points(points, tolerance=self.tolerance)
+
+    def run_array(self) -> np.ndarray:
+        """
+            Runs the sweeps of the slabs, and merges their intersections.
+
+            Returns:
+            -----------
+                (K, 2) array with the intersections in the Vector order.
+        """
+        pieces, ranges = self.build_slabs()
+
+        memory = shared_memory.SharedMemory(create=True, size=max(pieces.nbytes, 1))
+        try:
+            shared = np.ndarray(pieces.shape, dtype=np.float64, buffer=memory.buf)
+            shared[:] = pieces
+
+            arguments = [(memory.name, pieces.shape, len(self.array), start, stop, lo, hi, self.tolerance)
+                         for start, stop, lo, hi in ranges]
+
+            if self.workers == 1:
+                results = [sweep_slab(*args) for args in arguments]
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                    futures = [executor.submit(sweep_slab, *args) for args in arguments]
+                    results = [future.result() for future in futures]
+
+            del shared
+        finally:
+            memory.close()
+            memory.unlink()
+
+        return self.merge(results)
+
+    def run(self) -> List[Vector]:
+        """
+            Runs the parallel sweep.
+
+            Returns:
+            -----------
+                All the intersection points as a list of vectors, in the sweep order.
+        """
+        return [make_point(x, y) for x, y in self.run_array().tolist()]
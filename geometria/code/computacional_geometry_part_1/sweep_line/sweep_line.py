@@ -3,40 +3,73 @@ import os, sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # standard imports
-import bisect
+import time
 import numpy as np
+from contextlib import nullcontext
 from matplotlib import pyplot as plt
-from typing import Union, List, Tuple
+from typing import Union, List, Tuple, Iterator
 
 # custom dependencies
 from base.vector  import  Vector
-from base.segment import  Segment
+from base.segment import  Segment, IntersectionKind
 from base.plotter import  VectorPlotter, SegmentPlotter
-from binary_tree import Tree, Node1D
+from base import PointSet, RunStats, make_point, tracing
+from sweep_status import SweepStatus, SweepNode
+from event_queue import EventQueue, Event
 
 class SweepLine:
 
-    def __init__(self, segments: List[Segment], epsilon: float = 1e-3):
+    def __init__(self, segments: Union[List[Segment], PointSet], epsilon: float = 1e-3, tolerance: float = 1e-9,
+                 verbose: bool = True, colored: bool = False):
 
         """
             Implement the line sweep algorithm.
 
             Args:
-                segments: list of segments to be processed.
+                segments: list of segments to be processed, or a PointSet where
+                          every two consecutive points are the ends of a segment.
+                epsilon: tilt of the sweepline drawn by plot_current_state.
+                tolerance: relative tolerance of the status to consider that two
+                           segments cross the sweepline at the same x.
+                verbose: if True, every event is traced (see base.tracing), the records
+                         are only built if the tracing is enabled.
+                colored: if True, only the intersections between segments of different
+                         layers (see Segment.layer) are found, the neighbors of the same
+                         layer are skipped without computing their intersection. The
+                         segments of a layer should only meet at their endpoints (like
+                         the edges of a subdivision), otherwise the status gets out of order.
         """
 
+        if isinstance(segments, PointSet):
+            segments = segments.to_segments(sort_ends=True)
+
         self.segments = segments
         self.epsilon = epsilon
-        self.status_tree : Tree[Node1D]   = None 
-        self.event_points : List[Vector]  = None 
-        self.sorted_status : List[Node1D] = None 
+        self.tolerance = tolerance
+        self.verbose = verbose
+        self.colored = colored
+        self.status : SweepStatus = None 
+        self.event_queue : EventQueue = None 
         self.intersections : List[Vector] = None 
+        self.levels : np.ndarray = None
+
+        #pairs of neighbors whose intersection was computed (for the trace and the stats)
+        self.candidates_tested : int = 0
+        self.stats : RunStats = None
 
         self.leftmost_endpoint : Vector  = None 
         self.rightmost_endpoint : Vector = None 
 
         self.sweep_line : Segment = None 
 
+    def trace(self, event: str, **fields) -> None:
+        """
+            Emits a trace record of the sweep, if it's verbose and the tracing is enabled.
+            The fields are only formatted when a sink writes them (like the whole status).
+        """
+        if self.verbose and tracing.enabled:
+            tracing.emit("SweepLine", event, **fields)
+
     def update_sweepline(self, y, type_: str) -> None:
 
         """
@@ -61,345 +94,330 @@ class SweepLine:
         # build the sweepline, from leftmost to rightmost points in the x axis
         # at height y, and tilt a little bit on the right end of the sweepline
         # in order to avoid problematic behavior with horizontal segments.
-        self.sweep_line = Segment(Vector(np.array([[xleft], [y]])), Vector(np.array([[xright], [y + self.epsilon]])))
+        self.sweep_line = Segment(make_point(xleft, y), make_point(xright, y + self.epsilon))
+
+    def build_event_queue(self) -> EventQueue:
 
-    def update_status_tree(self) -> None:
         """
-            And update the nodes positions in the status tree, by the x coordinate of the intersection
-            of the segment with the sweepline.
+            Builds the events queue with the endpoints of the segments.
+            Every segment is added as an upper segment of its first endpoint in the
+            sweep order (the vector own comparison), and as a lower segment of the
+            other one, the segments with the same endpoint share its event.
+
+            Returns:
+            -----------
+                The event queue, the intersections are added to it while sweeping.
         """
+        queue = EventQueue(tolerance=self.tolerance)
 
-        in_order_tree = self.status_tree.inorder()
-        updated_nodes = []
+        #the heights of the endpoints, where the intersections close to them are put (see snap)
+        self.levels = np.unique([float(point[1]) for segment in self.segments for point in (segment.start, segment.end)])
 
-        # update the status tree
-        # for each node in the status tree, we update the intersection with the sweepline
-        for node in in_order_tree:
-            node.value = self.sweep_line.find_intersection(node.extra)[0]
-            
-            #reset the left and right childs
-            node.left = None
-            node.right = None
-            updated_nodes.append(node)
-        
-        # rebuild the status tree
-        if len(updated_nodes) > 0:
-            self.status_tree = Tree(updated_nodes)
-            self.sorted_status = self.status_tree.inorder() 
+        for segment in self.segments:
+            upper, lower = segment.start, segment.end
+            if lower < upper:
+                upper, lower = lower, upper
 
+            queue.push(upper, upper=[segment])
+            queue.push(lower, lower=[segment])
 
-    def sort_endpoints(self) -> List[Tuple[Vector, Segment, str]]:
+        return queue
 
+    @staticmethod
+    def intersection_points(kind: IntersectionKind, geometry: Union[Vector, Segment, None]) -> List[Vector]:
         """
-            Sort the endpoints of the segments.
-            Used mainly to build the events list.
-
-            Returns:
-                list of tuples (endpoint, segment) sorted by endpoint, which is a vector.
-                this sorting is done by using the vector own comparison methods.
+            Turns the result of Segment.intersect into event points, 
+            overlapping segments are reported by the endpoints of the shared piece.
         """
-        endpoints = []
-        for segment in self.segments:
-            endpoints.append((segment.start, segment, "vertex"))
-            endpoints.append((segment.end, segment, "vertex"))
-
-        # sort by using the vector own comparison methods
-        endpoints.sort(key=lambda w: w[0])
-        return endpoints
-
-    def find_intersections_with_sweepline(self, sweepline: Segment) -> List[Tuple[float, Node1D]]:
+        if kind == IntersectionKind.NONE:
+            return []
+        elif kind == IntersectionKind.OVERLAP:
+            return [geometry.start, geometry.end]
+        return [geometry]
 
+    @staticmethod
+    def ordered_pair(first: Segment, second: Segment) -> Tuple[Segment, Segment]:
         """
-            Find the intersections of the segments in the status tree with the sweepline.
+            Sorts a pair of segments by their coordinates, so the intersection
+            of a pair is always computed in the same way (and gives the same bits),
+            whichever of them is on the left of the status.
         """
+        def coordinates(segment: Segment) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+            return (EventQueue.key(segment.start), EventQueue.key(segment.end))
 
-        intersections = []
-        for node in self.status_tree.inorder():
-            intersect_in_x = sweepline.find_intersection(node.extra)[0]
-            intersections.append( (intersect_in_x, node) )
+        if coordinates(second) < coordinates(first):
+            return second, first
+        return first, second
 
-        return intersections
+    @staticmethod
+    def same_layer(first: Segment, second: Segment) -> bool:
+        return getattr(first, "layer", None) == getattr(second, "layer", None)
 
-    def find_intersections_on_left_or_right(self, idx) -> List[Tuple[Vector, Tuple[Segment, Segment]]]:
+    def snap(self, i: Vector, point: Vector, segments: Tuple[Segment, Segment]) -> Vector:
         """
-            Given a node index, checks its left and right neighborh
-            to see if any intersection with one of them.
+            An intersection may be computed a few bits above or below the height of the
+            current event point or of an endpoint (for example, on an horizontal segment,
+            or where two segments cross on an horizontal one that isn't in the status yet),
+            so it's put at that height, where it's handled after the events on its left
+            instead of before them. It's only moved if it stays ahead of the lower ends
+            of its segments.
 
             Args:
             -----------
-                idx: index of the node in the sorted status list.
-            
+                i: the intersection point.
+                point: current event point.
+                segments: the segments that cross at i.
+
             Returns:
             -----------
-                The intersection point of the segment with its neiborhs, and the 
-                tuple of intersecting segments.
-
-                intersections: list of tuples (intersection, (segment, segment))
+                The point, at the height it's handled.
         """
-        segment = self.sorted_status[idx].extra
-        left = idx-1
-        right = idx+1
-        
-        #list of tuples (intersection, segment)
-        intersections = []
-
-        # if a left segment exists
-        if left >= 0:
-            left_segment = self.sorted_status[left].extra
-            print("\t\thas left")
-
-            #if any intersection go and search for it 
-            if left_segment.segments_intersect(segment):
-                i = left_segment.get_intersection_of_segments_general(segment)
-                print("\t\thas intersection ", i)
-                ans = (i, (left_segment, segment))
-                intersections.append(ans)
-
-        #if a right segment exists
-        if right < len(self.sorted_status):
-            right_segment = self.sorted_status[right].extra
-            print("\t\thas right")
-
-            #if any intersection go and search for it 
-            if right_segment.segments_intersect(segment):
-                i = right_segment.get_intersection_of_segments_general(segment)
-                print("\t\thas intersection ", i)
-                ans = (i, (right_segment, segment))
-                intersections.append(ans)
-
-        return intersections
-
-    def add_to_status_tree(self, segment: Segment) -> Node1D:
-
-        """
-            Add a segment to the status tree.
-            Wraps a segment with a Node1D element and adds it to the tree.
-        """
-        if self.status_tree is None:
-            # we insert the segment in the status tree, by using the intersection with the sweepline
-            # as the value for the node. In this case as there are no other segments in the status 
-            # tree we just insert by the xcoordinate of the start point of the segment.
-            n = Node1D(segment.start[0])
-            n.extra = segment
-            self.status_tree = Tree([n,])
-            self.sorted_status = [n,]
-        else:
-            # if there is an status tree, we need to find the intersection of the segment with the
-            # sweepline, and insert the segment in the status tree by the xcoordinate of the
-            # intersection.
-            intersectx = segment.find_intersection(self.sweep_line)[0]
-            n = Node1D(intersectx)
-            n.extra = segment
-            self.status_tree.insert(n)
-            self.sorted_status = self.status_tree.inorder()
-        return n
-
-
-    def remove_from_status_tree(self, idx: int) -> None:
-        
+        x, y = float(i[0]), float(i[1])
+        tolerance = self.tolerance * max(1.0, abs(y), abs(float(point[1])))
+
+        k = int(np.searchsorted(self.levels, y))
+        heights = [float(point[1])] + self.levels[max(k - 1, 0):k + 1].tolist()
+        for height in heights:
+            if (height == y) or (abs(height - y) > tolerance):
+                continue
+
+            snapped = make_point(x, height)
+            if not any(snapped > max(segment.start, segment.end) for segment in segments):
+                return snapped
+            break
+        return i
+
+    def find_new_event(self, left: SweepNode, right: SweepNode, point: Vector) -> None:
         """
-            Remove a node from the status tree. 
-            And keep the status tree good structure even if 
-            this removed node had childs.
+            Checks the intersection of two nodes that have just become neighbors,
+            the intersections that are after the current event point (below the
+            sweepline, or on it and to the right) are added to the events queue.
+
+            Args:
+            -----------
+                left, right: neighbor nodes of the status (any of them can be None).
+                point: current event point.
         """
-        
-        #pop the current node (which is and endpoint node) from the status
-        self.sorted_status.pop(idx)
+        if (left is None) or (right is None):
+            return
+
+        # in colored mode the segments of the same layer don't cross
+        if self.colored and self.same_layer(left.extra, right.extra):
+            return
 
-        #rebuild the status tree without this endpoint node
-        self.status_tree = self.status_tree.build_from_sorted_list(self.sorted_status)
+        first, second = self.ordered_pair(left.extra, right.extra)
+        kind, geometry = first.intersect(second)
+        self.candidates_tested += 1
 
-        
+        for i in self.intersection_points(kind, geometry):
+            i = self.snap(i, point, (left.extra, right.extra))
 
-    def handle_start_endpoint(self, segment: Segment) -> List[Tuple[Vector, Tuple[Segment, Segment]]]:
+            #the intersections above the sweepline were already handled
+            if (i > point) and not self.event_queue.close(EventQueue.key(i), EventQueue.key(point)):
+                self.trace("new_event", point=i, segments=(left.extra, right.extra))
+                self.event_queue.push(i, crossing=[left.extra, right.extra])
 
+    def handle_event_point(self, event: Event) -> Union[List[Segment], None]:
         """
-            Handle the start endpoint of a segment.
-            when we encounter a start endpoint, we insert the segment into the status.
+            Handle an event point, with all the segments that start, end or
+            cross there at once:
+
+                1. the segments that contain the point (they are next to each other
+                   in the status) are added to the ones found to cross there.
+                2. if there is more than one segment, the point is an intersection.
+                3. the segments that end or cross there are removed (by their nodes),
+                   and the ones that start or cross there are inserted, so the
+                   crossing segments end up in the order they have below the point.
+                4. the segments that have just become neighbors are checked.
 
             Args:
             -----------
-                segment: segment whose start endpoint is being handled.
-            
+                event: the event, with the point and the upper, lower and crossing segments.
+
             Returns:
             -----------
-                A list of tuples (intersection, (segment, segment)), which is
-                the intersection point, and the tuple of intersecting segments.
+                The segments that meet at the point if it's an intersection, otherwise None.
         """
+        point = event.point
+
+        # the nodes are removed by handle, so the sweepline can be moved first
+        self.status.set_sweep_point(point)
+        through = {node.extra for node in self.status.through(point)}
+
+        upper = event.upper
+        lower = event.lower
+        crossing = (event.crossing | through) - upper - lower
+
+        # the point is an intersection if it's shared by more than one segment
+        # (the events at the same point were merged, so it's found only once)
+        segments = upper | lower | crossing
+        intersecting = list(segments) if len(segments) > 1 else None
+
+        # in colored mode only the points where more than one layer meets are reported
+        if self.colored and (intersecting is not None):
+            if len({getattr(segment, "layer", None) for segment in segments}) < 2:
+                intersecting = None
+
+        tested = self.candidates_tested
+        for segment in lower:
+            self.status.remove(segment)
+        present = [segment for segment in crossing if self.status.remove(segment) is not None]
+
+        # a segment that starts and ends at the point has no length, it's never inserted
+        inserted = [self.status.insert(segment) for segment in (upper - lower)]
+        inserted += [self.status.insert(segment) for segment in present]
+
+        if not inserted:
+            # the segments on the left and on the right of the point become neighbors
+            left = self.status.left_of(point[0])
+            right = self.status.right_of(point[0])
+            self.find_new_event(left, right, point)
+        else:
+            # the inserted segments are next to each other, only the ends of that block
+            # have new neighbors
+            block = set(inserted)
+            leftmost = rightmost = inserted[0]
+            while self.status.predecessor(leftmost) in block:
+                leftmost = self.status.predecessor(leftmost)
+            while self.status.successor(rightmost) in block:
+                rightmost = self.status.successor(rightmost)
+
+            self.find_new_event(self.status.predecessor(leftmost), leftmost, point)
+            self.find_new_event(rightmost, self.status.successor(rightmost), point)
+
+        stats = self.stats
+        if stats is not None:
+            stats.count("events")
+            for name, group in (("start", upper), ("end", lower), ("crossing", crossing)):
+                if group:
+                    stats.count(f"events.{name}")
+            if intersecting is not None:
+                stats.count("intersections")
+            stats.observe("status_size", len(self.status))
+            stats.count("reinserted", len(present))
+
+        if self.verbose and tracing.enabled:
+            self.trace("event", point=point, upper=len(upper), lower=len(lower), crossing=len(crossing),
+                       intersection=intersecting is not None, status_size=len(self.status),
+                       candidates_tested=self.candidates_tested - tested, status=self.status)
+        return intersecting
+
+    def iter_intersections(self,
+                           first_k: int = None,
+                           any_intersection: bool = False,
+                           plotting: bool = False) -> Iterator[Tuple[Vector, List[Segment]]]:
 
-        #adds a segment to the tree, and get's the node associated to it 
-        current_node = self.add_to_status_tree(segment)
-        print("\tcurrent node: ", current_node)
-        
-        #gets the status in order by the intersect with the sweepline
-        print("\tsorted status: ", self.sorted_status)
-
-        #gets the index of the current node
-        idx = self.sorted_status.index(current_node)
-
-        #with the current node go and check for intersections with 
-        #it's neiborhs
-        return self.find_intersections_on_left_or_right(idx)
-        
-    def handle_intersection_endpoint(self, segment: Segment) -> List[Tuple[Vector, Tuple[Segment, Segment]]]:
         """
-            Handle the intersection endpoint of a segment.
-            when we encounter an intersection endpoint, we update the status tree, with 
-            this sweepline which is a little bit below the intersection.
-            And try to find intersections with the neiborhs of the segment.
+            Generator version of the line sweep, every intersection is yielded as
+            soon as its event point is handled, so they don't have to be kept in memory.
+            The sweep only goes on while the consumer asks for more intersections.
 
             Args:
             -----------
-                segment: segment whose intersection endpoint is being handled.
-            
+                first_k: if given, the sweep stops after the first k intersections.
+                any_intersection: if True, the sweep stops after the first intersection
+                                  (the same as first_k = 1).
+                plotting: if True, the state of the sweep is plotted after every event.
+
             Returns:
             -----------
-                A list of tuples (intersection, (segment, segment)), which is
-                the intersection point, and the tuple of intersecting segments.
+                An iterator of tuples (intersection, segments), in the sweep order, where
+                segments are all the segments that meet at the intersection point.
         """
 
-        #updates the sorted status
-        self.sorted_status = self.status_tree.inorder()
-
-        # gets the index node associated to the segment we need (there are 
-        # cases where the segment is no longer in the status tree, for example, 
-        # when there is an intersection in a horizontal segment, and the sweepline)
-        try:
-            idx = [n.extra for n in self.sorted_status].index(segment)
-        except ValueError:
-            print(f"segment {segment} not in status tree")
-            return []
+        if any_intersection:
+            first_k = 1
 
-        print("\tcurrent node: ", self.sorted_status[idx])
-        print("\tsorted status: ", self.sorted_status)
+        if (first_k is not None) and (first_k <= 0):
+            return
 
-        # checks if the node has left or right neiborhs and if any intersection 
-        # with them 
-        intersect_tuple = self.find_intersections_on_left_or_right(idx)
+        count = 0
+        found = 0
 
-        # finally, notice that we don't need to remove the segment from the status
-        # because it's an intersection endpoint, and it's not in the status tree 
+        # empty status, every segment gets its node when its upper endpoint is handled
+        self.status = SweepStatus(tolerance=self.tolerance)
+        self.candidates_tested = 0
 
-        return intersect_tuple
+        # the handlers are only timed if the stats ask for it
+        timed = (self.stats is not None) and self.stats.timed
 
-    def handle_end_endpoint(self, segment: Segment) -> List[Tuple[Vector, Tuple[Segment, Segment]]]:
+        # the endpoints go into a priority queue, the intersections are pushed while sweeping
+        start = time.perf_counter() if timed else 0.0
+        self.event_queue = self.build_event_queue()
+        if timed:
+            self.stats.add_time("build_event_queue", time.perf_counter() - start)
 
-        """
-            Handle the end endpoint of a segment.
-            when we encounter an end endpoint, we remove the segment from status, after a last check.
+        # used for delimitation of the sweepline width in the x axis
+        endpoints = [s.start for s in self.segments] + [s.end for s in self.segments]
+        if not endpoints:
+            return
+        self.leftmost_endpoint  = Vector.get_leftmost_point(endpoints)
+        self.rightmost_endpoint = Vector.get_rightmost_point(endpoints)
+
+        # we iterate over the events, in O(log n) each
+        while self.event_queue:
+            start = time.perf_counter() if timed else 0.0
+            event = self.event_queue.pop()
+            if timed:
+                self.stats.add_time("event_queue.pop", time.perf_counter() - start)
 
-            Returns:
-            -----------
-                A list of tuples (intersection, (segment, segment)), which is
-                the intersection point, and the tuple of intersecting segments.
-        """
+            if plotting:
+                type_ = "intersection" if event.crossing else "vertex"
+                self.update_sweepline(y = event.point[1], type_= type_)
 
-        #updates the sorted status
-        self.sorted_status = self.status_tree.inorder()
+            # we handle the event point
+            start = time.perf_counter() if timed else 0.0
+            segments = self.handle_event_point(event)
+            if timed:
+                self.stats.add_time("handle_event_point", time.perf_counter() - start)
+            count += 1
 
-        # gets the index node associated to the segment we need remove   
-        idx = [n.extra for n in self.sorted_status].index(segment)
-        print("\tcurrent node: ", self.sorted_status[idx])
-        print("\tsorted status: ", self.sorted_status)
+            if segments is not None:
+                yield event.point, segments
+                found += 1
 
-        # checks if the node has left or right neiborhs and if any intersection 
-        # with them 
-        intersect_tuple = self.find_intersections_on_left_or_right(idx)
+            if plotting:
+                self.plot_current_state()
 
-        # finally we remove the segment from the status
-        self.remove_from_status_tree(idx)
+            # the consumer already has all the intersections it asked for
+            if (first_k is not None) and (found >= first_k):
+                return
 
-        return intersect_tuple
+    def run(self, plotting: bool = False, return_stats: bool = False,
+            timing: Union[str, None] = None) -> Union[List[Vector], Tuple[List[Vector], RunStats]]:
 
-    def handle_every_event_point(self,
-                                 endpoint: Vector,
-                                 segment: Union[Segment, List[Segment]],
-                                 type_: str) -> None: 
         """
-            Handle every event point. Whether it's a start, end or intersection endpoint.
+            Run the line sweep algorithm.
 
             Args:
             -----------
-                endpoint: endpoint of the segment.
-                segment: segment whose endpoint is being handled. if type_ is intersection,
-                         segment is a list of segments which intersect in the intersection point.
-                         if type_ is vertex, then we expect segment is a single segment.
-                type_: type of endpoint, whether it's a start, end or intersection endpoint.
-        """
-
-        if type_ == "intersection":
-            print(f"INTERSECTION ENDPOINT {endpoint} FROM SEGMENT {segment}")
-            intersect = []
-            # segment is a list of segments which intersect in the intersection point
-            for seg in segment:
-                # so we check intersections with each segment in the list
-                for i in self.handle_intersection_endpoint(seg):
-                    intersect.append(i)
-
-        # if the endpoint is the start of a segment, we handle it
-        elif (endpoint == segment.start) and (type_ == "vertex"):
-            print(f"START ENDPOINT {endpoint} FROM SEGMENT {segment}")
-            intersect = self.handle_start_endpoint(segment)
-
-        # if the endpoint is the end of a segment, we handle it
-        elif (endpoint == segment.end) and (type_ == "vertex"):
-            print(f"END ENDPOINT {endpoint} FROM SEGMENT {segment}")
-            intersect = self.handle_end_endpoint(segment)
-
-        #here we handle what to to do with the intersections, 
-        #if any, found in the current event point then we add them to the events list
-        #and to the intersections list
-        for i in intersect:
-
-            #checks if the intersection is already in the list
-            if i[0] not in self.intersections:
-                intersecting_segments = i[1]
-
-                # we insert the intersection point in the events list, 
-                # which is already sorted by our lexigraphic vector ordering
-                bisect.insort(self.event_points, (i[0], intersecting_segments, "intersection"), key=lambda w: w[0])
-                self.intersections.append(i[0])
-
-    def run(self, plotting: bool = False) -> List[Vector]:
-
-        """
-            Run the line sweep algorithm.
+                plotting: if True, the state of the sweep is plotted after every event.
+                return_stats: if True, the counters of the run (events by type, size of
+                              the status, intersection tests, rotations of the status tree
+                              and timings) are collected and returned in a RunStats.
+                timing: timing mode of the stats, None, "perf_counter" or "cprofile".
 
             Returns:
             -----------
-                All the intersection points as a list of vectors.
+                All the intersection points as a list of vectors, in the sweep order
+                (and the RunStats if return_stats is True).
         """
 
-        count = 0
-        # intersection points list
+        # they are kept in self.intersections while sweeping, so the plots show them
         self.intersections = []
+        self.stats = RunStats("SweepLine", timing=timing) if return_stats else None
 
-        # we sort the endpoints
-        self.event_points = self.sort_endpoints()
-        
-        # used for delimitation of the sweepline width in the x axis
-        self.leftmost_endpoint  = Vector.get_leftmost_point([v for v, s, t in self.event_points])
-        self.rightmost_endpoint = Vector.get_rightmost_point([v for v, s, t in self.event_points])
-
-        # we iterate over the endpoints
-        while len(self.event_points) > 0:
-            print("count: ", count)
+        with (self.stats.measure() if self.stats is not None else nullcontext()):
+            for point, segments in self.iter_intersections(plotting=plotting):
+                self.intersections.append(point)
 
-            endpoint, segment, type_ = self.event_points.pop(0)
-            self.update_sweepline(y = endpoint[1], type_= type_)
+        if self.stats is None:
+            return self.intersections
 
-            # we update the status tree
-            if self.status_tree is not None:
-                self.update_status_tree()
-
-            # we handle the event point
-            self.handle_every_event_point(endpoint, segment, type_)
-
-            if plotting:
-                self.plot_current_state()
-            count += 1    
-        
-        return self.intersections
+        self.stats.count("segments", len(self.segments))
+        self.stats.count("intersection_tests", self.candidates_tested)
+        self.stats.count("status.rotations", self.status.tree.rotations)
+        return self.intersections, self.stats
 
     def plot_current_state(self):
 
@@ -0,0 +1,205 @@
+# add path with sys
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# standard imports
+from typing import Union, List, Dict
+
+# custom dependencies
+from base.vector  import  Vector
+from base.segment import  Segment
+from binary_tree import AVLTree, Node, Node1D
+
+class SweepNode(Node):
+
+    def __init__(self, segment: Segment, status: 'SweepStatus'):
+        """
+            Node of the sweep status. Its value (the x coordinate where the segment
+            crosses the sweepline) is not stored, it's computed when it's needed
+            from the current position of the status sweepline. So the nodes never
+            have to be updated when the sweepline moves.
+
+            Args:
+            -----------
+                segment: segment (or anything with start and end, like a SemiEdge).
+                status: the status the node belongs to, which knows the sweepline position.
+        """
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.height = 1
+        self.extra = segment
+        self.status = status
+
+        #upper and lower endpoints (the sweepline goes from top to bottom)
+        upper, lower = segment.start, segment.end
+        if lower < upper:
+            upper, lower = lower, upper
+
+        self.ux, self.uy = float(upper[0]), float(upper[1])
+        self.lx, self.ly = float(lower[0]), float(lower[1])
+        self.xmin, self.xmax = min(self.ux, self.lx), max(self.ux, self.lx)
+
+        #the inverse slope dx/dy, horizontal segments don't have one
+        self.horizontal = self.uy == self.ly
+        self.dxdy = 0.0 if self.horizontal else (self.lx - self.ux) / (self.ly - self.uy)
+
+    @property
+    def value(self) -> float:
+        return self.x_at(self.status.y, self.status.x)
+
+    def x_at(self, y: float, x: float) -> float:
+        """
+            x coordinate of the segment at height y. An horizontal segment is clamped
+            to the x of the sweep point, so it's found right where the sweep is.
+        """
+        if self.horizontal:
+            return min(max(x, self.xmin), self.xmax)
+        return self.ux + (y - self.uy) * self.dxdy
+
+    def order_below(self) -> float:
+        """
+            Tie breaker for segments that cross the sweepline at the same x: the
+            one that goes more to the left just below the sweepline comes first,
+            the horizontal segments go last.
+        """
+        if self.horizontal:
+            return float("inf")
+        return -self.dxdy
+
+    def compare(self, other: Union['SweepNode', Node1D]) -> int:
+        """
+            -1, 0 or 1 if self is to the left, at the same place, or to the right of other
+            (other can be a plain node, whose value is an x coordinate).
+        """
+        xself = self.value
+        xother = other.value
+        tolerance = self.status.tolerance * max(1.0, abs(xself), abs(xother))
+
+        if xself < xother - tolerance:
+            return -1
+        if xself > xother + tolerance:
+            return 1
+
+        #duck typing, plain nodes have no slope
+        if not hasattr(other, "order_below"):
+            return 0
+
+        below_self, below_other = self.order_below(), other.order_below()
+        return (below_self > below_other) - (below_self < below_other)
+
+    #=====================================
+    #       order comparison methods
+    #=====================================
+    # plain nodes compare against sweep nodes by value (like the probes of AVLTree.lower)
+
+    def __gt__(self, other):
+        return self.compare(other) > 0
+
+    def __lt__(self, other):
+        return self.compare(other) < 0
+
+    def __eq__(self, other):
+        return self.compare(other) == 0
+
+    def __ge__(self, other):
+        return self.compare(other) >= 0
+
+    def __le__(self, other):
+        return self.compare(other) <= 0
+
+    __hash__ = object.__hash__
+
+
+class SweepStatus:
+
+    def __init__(self, tolerance: float = 1e-9):
+        """
+            Status of a sweepline that goes from top to bottom. The segments are kept in
+            a balanced tree sorted by the x where they cross the sweepline, but this x
+            is evaluated lazily against the current sweep point, so moving the sweepline
+            costs nothing. Between events the segments keep their relative order, and at
+            an intersection only the segments that cross there are removed and inserted
+            again.
+
+            Args:
+            -----------
+                tolerance: relative tolerance used to decide that two segments cross
+                           the sweepline at the same x.
+        """
+        self.tree = AVLTree()
+        self.nodes : Dict[Segment, SweepNode] = {}
+        self.tolerance = tolerance
+
+        #current sweep point
+        self.x : float = None
+        self.y : float = None
+
+    def set_sweep_point(self, point: Vector) -> None:
+        """
+            Moves the sweepline to the given event point.
+        """
+        self.x = float(point[0])
+        self.y = float(point[1])
+
+    def insert(self, segment: Segment) -> SweepNode:
+        """
+            Inserts a segment in its place at the current sweepline.
+        """
+        node = SweepNode(segment, self)
+        self.tree.insert(node)
+        self.nodes[segment] = node
+        return node
+
+    def remove(self, segment: Segment) -> Union[SweepNode, None]:
+        """
+            Removes a segment (by its node, so there are no comparisons),
+            returns its node, or None if the segment was not in the status.
+        """
+        node = self.nodes.pop(segment, None)
+
+        if node is not None:
+            self.tree.delete(node)
+        return node
+
+    def node(self, segment: Segment) -> Union[SweepNode, None]:
+        return self.nodes.get(segment)
+
+    def left_of(self, x: float) -> Union[SweepNode, None]:
+        """
+            The node just to the left of the point (x, sweep y), strictly to the left.
+        """
+        return self.tree.lower(Node1D(x))
+
+    def right_of(self, x: float) -> Union[SweepNode, None]:
+        """
+            The node just to the right of the point (x, sweep y), strictly to the right.
+        """
+        return self.tree.higher(Node1D(x))
+
+    def through(self, point: Vector) -> List[SweepNode]:
+        """
+            The nodes of the segments that contain the point, which must be on the
+            sweepline (they cross it at the x of the point, up to the tolerance,
+            so they are next to each other in the tree), from left to right.
+        """
+        x = float(point[0])
+        return list(self.tree.iter_range(Node1D(x), Node1D(x)))
+
+    def predecessor(self, node: SweepNode) -> Union[SweepNode, None]:
+        return self.tree.predecessor(node)
+
+    def successor(self, node: SweepNode) -> Union[SweepNode, None]:
+        return self.tree.successor(node)
+
+    def inorder(self) -> List[SweepNode]:
+        return self.tree.inorder()
+
+    def __contains__(self, segment: Segment) -> bool:
+        return segment in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    def __repr__(self) -> str:
+        return repr(self.inorder())
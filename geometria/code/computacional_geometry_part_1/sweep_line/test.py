@@ -0,0 +1,418 @@
+import unittest
+import numpy as np
+from unittest import mock
+from base import Segment, make_point
+from event_queue import EventQueue
+from sweep_line import SweepLine
+from orthogonal_sweep import OrthogonalSweepLine, FenwickTree
+from parallel_sweep import ParallelSweepLine
+from intersection_engines import find_intersections
+from intersection_index import IntersectionIndex
+
+def segment(x1: float, y1: float, x2: float, y2: float) -> Segment:
+    return Segment(make_point(x1, y1), make_point(x2, y2))
+
+def as_tuples(points) -> list:
+    return sorted((float(point[0]), float(point[1])) for point in points)
+
+def rounded(points) -> list:
+    """
+        The points rounded to compare them between engines, they can differ in the last bits.
+    """
+    return sorted((round(float(point[0]), 9), round(float(point[1]), 9)) for point in points)
+
+def random_segments(rng: np.random.Generator, n: int, size: int = 10) -> list:
+    """
+        Random segments with integer ends, without repeated segments (the sweep
+        takes two equal segments as one).
+    """
+    coordinates = rng.integers(0, size, (n, 4))
+    #every segment from its smallest end, so the reversed ones are repeated too
+    swap = (coordinates[:, 0] > coordinates[:, 2]) | ((coordinates[:, 0] == coordinates[:, 2]) &
+                                                      (coordinates[:, 1] > coordinates[:, 3]))
+    coordinates = np.where(swap[:, None], coordinates[:, [2, 3, 0, 1]], coordinates)
+    coordinates = np.unique(coordinates, axis=0)
+    coordinates = coordinates[(coordinates[:, 0] != coordinates[:, 2]) | (coordinates[:, 1] != coordinates[:, 3])]
+    return [segment(*row) for row in coordinates.tolist()]
+
+def orthogonal_segments(rng: np.random.Generator, n: int, size: int = 12) -> list:
+    """
+        Random horizontal and vertical segments with integer ends, so many of them
+        touch, overlap or cross at their ends.
+    """
+    segments = []
+    for _ in range(n):
+        a, b = sorted(rng.integers(0, size, 2).tolist())
+        c = int(rng.integers(0, size))
+        segments.append(segment(a, c, b, c) if rng.random() < 0.5 else segment(c, a, c, b))
+    return segments
+
+class TestEventQueue(unittest.TestCase):
+
+    def test_close_points_are_merged_when_pushed(self):
+        queue = EventQueue(tolerance=1e-9)
+
+        queue.push(make_point(3.0, 2.0), crossing=["a"])
+        #another event between them in the heap order
+        queue.push(make_point(2.0, 1.9999999999999998), crossing=["b"])
+        queue.push(make_point(3.0, 1.9999999999999996), crossing=["c"])
+
+        self.assertEqual(len(queue), 2)
+        first, second = queue.pop(), queue.pop()
+        self.assertEqual(first.crossing, {"a", "c"})
+        self.assertEqual(second.crossing, {"b"})
+
+    def test_segments_end_after_their_events(self):
+        horizontal, first, second = segment(4, 6, 7, 6), segment(0, 1, 8, 7), segment(2, 4, 9, 7)
+        queue = EventQueue(tolerance=1e-9)
+        queue.push(make_point(4, 6), upper=[horizontal])
+        queue.push(make_point(7, 6), lower=[horizontal])
+
+        #the horizontal segment ends between them, so the event goes to the first one
+        queue.push(make_point(6.666666666666665, 5.999999999999999), crossing=[first, second])
+        queue.push(make_point(6.666666666666666, 6.0), crossing=[horizontal, first])
+
+        events = [queue.pop() for _ in range(len(queue))]
+        self.assertEqual(as_tuples([events[1].point]), [(6.666666666666666, 6.0)])
+        self.assertEqual(events[1].crossing, {horizontal, first, second})
+        self.assertEqual([event.lower for event in events], [set(), set(), {horizontal}])
+
+    def test_endpoints_are_not_merged_when_pushed(self):
+        horizontal, other = segment(4, 4, 5.714285714285715, 4), segment(4, 1, 5.714285714285715, 4.000000000000002)
+        queue = EventQueue(tolerance=1e-9)
+        for s in (horizontal, other):
+            upper, lower = (s.start, s.end) if s.start < s.end else (s.end, s.start)
+            queue.push(upper, upper=[s])
+            queue.push(lower, lower=[s])
+
+        #the end of the horizontal segment is close to the start of the other one,
+        #but its own start is between them
+        events = [queue.pop() for _ in range(4)]
+        self.assertEqual([(float(e.point[0]), float(e.point[1])) for e in events[:3]],
+                         [(5.714285714285715, 4.000000000000002), (4.0, 4.0), (5.714285714285715, 4.0)])
+        self.assertEqual(events[0].upper, {other})
+        self.assertFalse(queue)
+
+    def test_intersection_reported_once(self):
+        #the point (3, 2) is computed from two pairs, with different last bits
+        segments = [segment(2, 1.3333333333333333, 4.333333333333332, 2.888888888888888),
+                    segment(2, 2.3333333333333335, 4.333333333333332, 1.555555555555556),
+                    segment(3, 4, 4, 2),
+                    segment(2, 0, 4, 4)]
+
+        points = as_tuples(SweepLine(segments).run())
+        self.assertEqual(len(points), 3)
+        self.assertEqual(len({(round(x, 9), round(y, 9)) for x, y in points}), 3)
+
+    def test_crossing_before_an_horizontal_segment(self):
+        #the slanted segments cross a few bits above the horizontal one, before it's in the status
+        first, second, horizontal = segment(0, 1, 8, 7), segment(2, 4, 9, 7), segment(4, 6, 9, 6)
+        records = list(SweepLine([first, second, horizontal], verbose=False).iter_intersections())
+
+        self.assertEqual(len(records), 1)
+        point, segments = records[0]
+        self.assertEqual(rounded([point]), [(6.666666667, 6.0)])
+        self.assertEqual(set(segments), {first, second, horizontal})
+
+class TestIterIntersections(unittest.TestCase):
+
+    @staticmethod
+    def through(segments: list, point) -> set:
+        """
+            The segments that pass through the point, up to a tolerance.
+        """
+        x, y = float(point[0]), float(point[1])
+        found = set()
+        for s in segments:
+            (x1, y1), (x2, y2) = as_tuples([s.start, s.end])
+            cross = (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)
+            if (abs(cross) <= 1e-7 * max(abs(x2 - x1), abs(y2 - y1), 1.0)
+                    and min(x1, x2) - 1e-7 <= x <= max(x1, x2) + 1e-7
+                    and min(y1, y2) - 1e-7 <= y <= max(y1, y2) + 1e-7):
+                found.add(s)
+        return found
+
+    def test_every_point_once_with_all_its_segments(self):
+        rng = np.random.default_rng(12)
+        for scale in (1, 7):
+            for n in (2, 8, 20):
+                for _ in range(10):
+                    segments = [segment(*(c / scale for c in (*s.start, *s.end))) for s in random_segments(rng, n)]
+                    records = list(SweepLine(segments, verbose=False).iter_intersections())
+
+                    points = rounded(point for point, _ in records)
+                    self.assertEqual(len(points), len(set(points)))
+                    for point, crossing in records:
+                        self.assertEqual(set(crossing), self.through(segments, point))
+
+    def test_first_k(self):
+        segments = random_segments(np.random.default_rng(13), 20)
+        records = list(SweepLine(segments, verbose=False).iter_intersections())
+        self.assertGreater(len(records), 3)
+
+        first = list(SweepLine(segments, verbose=False).iter_intersections(first_k=3))
+        self.assertEqual([point for point, _ in first], [point for point, _ in records[:3]])
+        self.assertEqual(len(list(SweepLine(segments, verbose=False).iter_intersections(any_intersection=True))), 1)
+        self.assertEqual(list(SweepLine(segments, verbose=False).iter_intersections(first_k=0)), [])
+
+def subdivision(rng: np.random.Generator, n: int, layer: int, size: float = 10.0) -> list:
+    """
+        The edges of a grid of n x n cells with moved vertices, which only meet at
+        their ends (like the edges of a subdivision), all of them in the layer.
+    """
+    spacing = size / n
+    vertices = np.stack(np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing="ij"), axis=-1) * spacing
+    vertices = vertices + rng.uniform(-0.3, 0.3, vertices.shape) * spacing
+
+    edges = []
+    for i in range(n + 1):
+        for j in range(n + 1):
+            for di, dj in ((1, 0), (0, 1)):
+                if (i + di <= n) and (j + dj <= n):
+                    a, b = vertices[i, j].tolist(), vertices[i + di, j + dj].tolist()
+                    edges.append(Segment(make_point(*a), make_point(*b), sort_ends=True, layer=layer))
+    return edges
+
+class TestColoredSweepLine(unittest.TestCase):
+
+    @staticmethod
+    def brute_force(segments: list) -> list:
+        """
+            The intersections of every pair of segments of different layers.
+        """
+        points = []
+        for k, first in enumerate(segments):
+            for second in segments[k + 1:]:
+                if first.layer != second.layer:
+                    kind, geometry = first.intersect(second)
+                    points += SweepLine.intersection_points(kind, geometry)
+        return sorted(set(rounded(points)))
+
+    def test_only_the_intersections_of_different_layers(self):
+        rng = np.random.default_rng(14)
+        for n in (1, 3, 6):
+            #the second one is moved, so no vertex is on the other one
+            segments = subdivision(rng, n, 0) + subdivision(rng, n + 1, 1, size=11.0)
+
+            sweep = SweepLine(segments, verbose=False, colored=True)
+            with mock.patch.object(Segment, "intersect", autospec=True, side_effect=Segment.intersect) as intersect:
+                points, stats = sweep.run(return_stats=True)
+
+            self.assertEqual(rounded(points), self.brute_force(segments))
+            #the neighbors of the same layer never reach the kernel
+            self.assertEqual(intersect.call_count, sweep.candidates_tested)
+            self.assertEqual(stats.counters["intersection_tests"], sweep.candidates_tested)
+            self.assertTrue(all(first.layer != second.layer for (first, second), _ in intersect.call_args_list))
+
+            #without colors the vertices of the subdivisions are intersections too
+            plain = SweepLine(segments, verbose=False)
+            self.assertGreater(len(plain.run()), len(points))
+            self.assertGreater(plain.candidates_tested, sweep.candidates_tested)
+
+class TestOrthogonalSweepLine(unittest.TestCase):
+
+    @staticmethod
+    def brute_force(segments: list) -> list:
+        """
+            The crossing of every horizontal with every vertical segment (the ones
+            without length are horizontal).
+        """
+        points = []
+        for h in segments:
+            if h.start[1] != h.end[1]:
+                continue
+            for v in segments:
+                if v.start[1] == v.end[1]:
+                    continue
+                x, y = v.start[0], h.start[1]
+                if (min(h.start[0], h.end[0]) <= x <= max(h.start[0], h.end[0])
+                        and min(v.start[1], v.end[1]) <= y <= max(v.start[1], v.end[1])):
+                    points.append((float(x), float(y)))
+        return sorted(points)
+
+    def test_fenwick_tree(self):
+        rng = np.random.default_rng(13)
+        values = [0] * 37
+        fenwick = FenwickTree(len(values))
+
+        for _ in range(300):
+            index, delta = int(rng.integers(len(values))), int(rng.integers(0, 3))
+            values[index] += delta
+            fenwick.add(index, delta)
+
+        for lo in range(len(values)):
+            self.assertEqual(fenwick.prefix(lo), sum(values[:lo + 1]))
+            for hi in range(lo - 1, len(values)):
+                self.assertEqual(fenwick.range_sum(lo, hi), sum(values[lo:hi + 1]))
+
+        for k in range(1, sum(values) + 1):
+            self.assertEqual(fenwick.find(k), int(np.searchsorted(np.cumsum(values), k)))
+
+    def test_count_and_report_against_brute_force(self):
+        rng = np.random.default_rng(14)
+        for n in (0, 1, 2, 5, 20, 60):
+            for _ in range(5):
+                segments = orthogonal_segments(rng, n)
+                expected = self.brute_force(segments)
+
+                sweep = OrthogonalSweepLine(segments, fallback=False)
+                self.assertTrue(sweep.orthogonal)
+                self.assertEqual(sweep.count(), len(expected))
+                self.assertEqual(as_tuples(sweep.run()), expected)
+
+                for point, pair in sweep.iter_intersections():
+                    self.assertEqual(pair[0].start[1], pair[0].end[1])
+                    self.assertEqual(pair[1].start[0], pair[1].end[0])
+
+    def test_parallel_overlaps_are_not_crossings(self):
+        segments = [segment(0, 1, 4, 1), segment(2, 1, 6, 1),
+                    segment(3, 0, 3, 5), segment(3, 2, 3, 8),
+                    segment(5, 1, 5, 1)]
+
+        sweep = OrthogonalSweepLine(segments, fallback=False)
+        #(3, 1) for both horizontals, the overlaps of the verticals and of the
+        #horizontals are not counted
+        self.assertEqual(sweep.count(), 2)
+        self.assertEqual(as_tuples(sweep.run()), [(3.0, 1.0), (3.0, 1.0)])
+
+    def test_not_orthogonal(self):
+        segments = [segment(0, 0, 4, 4), segment(0, 4, 4, 0), segment(2, -1, 2, 5)]
+
+        self.assertEqual(OrthogonalSweepLine(segments).count(), 3)
+        with self.assertRaises(ValueError):
+            OrthogonalSweepLine(segments, fallback=False).count()
+
+class TestParallelSweepLine(unittest.TestCase):
+
+    def test_empty_slabs(self):
+        #the slabs between x = 5 and x = 6 have no segments
+        segments = [segment(5, 5, 5, 1), segment(6, 6, 6, 4)]
+        self.assertEqual(ParallelSweepLine(segments, workers=1, slabs=5).run(), [])
+        self.assertEqual(ParallelSweepLine([], workers=1, slabs=5).run(), [])
+        self.assertEqual(SweepLine([]).run(), [])
+
+        segments += [segment(4, 2, 7, 5)]
+        points = ParallelSweepLine(segments, workers=1, slabs=5).run()
+        self.assertEqual(as_tuples(points), [(5.0, 3.0), (6.0, 4.0)])
+
+    def test_against_sweep_and_brute_force(self):
+        rng = np.random.default_rng(15)
+        for n in (2, 5, 12, 30):
+            for slabs in (1, 2, 3, 7):
+                segments = random_segments(rng, n)
+                expected = rounded(find_intersections(segments, method="brute"))
+
+                points = ParallelSweepLine(segments, workers=1, slabs=slabs).run()
+                #every point once, also the ones found by two slabs
+                self.assertEqual(rounded(points), expected)
+                self.assertEqual(rounded(SweepLine(segments, verbose=False).run()), expected)
+
+    def test_workers(self):
+        segments = random_segments(np.random.default_rng(16), 20)
+        expected = rounded(ParallelSweepLine(segments, workers=1, slabs=3).run())
+        self.assertEqual(rounded(ParallelSweepLine(segments, workers=2, slabs=3).run()), expected)
+
+class TestFindIntersections(unittest.TestCase):
+
+    def test_engines_agree(self):
+        rng = np.random.default_rng(16)
+        for n in (0, 1, 2, 6, 15, 40):
+            for _ in range(4):
+                segments = random_segments(rng, n)
+                results = {method: find_intersections(segments, method=method) for method in ("brute", "grid", "sweep")}
+
+                for method, points in results.items():
+                    #every point once, in the sweep order
+                    self.assertEqual(len(rounded(points)), len(set(rounded(points))), method)
+                    self.assertEqual(points, sorted(points, key=lambda point: (-float(point[1]), float(point[0]))))
+                    self.assertEqual(rounded(points), rounded(results["brute"]), method)
+
+    def test_sweep_repeated_point(self):
+        #the slanted segments cross a few bits above the horizontal one, before it's in the status
+        segments = [segment(0, 1, 8, 7), segment(2, 4, 9, 7), segment(4, 6, 9, 6)]
+        points = SweepLine(segments, verbose=False).run()
+        self.assertEqual(len(points), 1)
+
+        self.assertEqual(find_intersections(segments, method="sweep"), points)
+        self.assertEqual(rounded(points), rounded(find_intersections(segments, method="brute")))
+
+class TestIntersectionIndex(unittest.TestCase):
+
+    def check(self, index: IntersectionIndex):
+        expected = find_intersections(index.segments, method="brute")
+        self.assertEqual(rounded(index.intersections()), rounded(expected))
+
+    def test_add_and_remove_against_brute_force(self):
+        rng = np.random.default_rng(17)
+        index, ids = IntersectionIndex(), []
+
+        for step in range(25):
+            if ids and rng.random() < 0.4:
+                chosen = rng.choice(len(ids), size=int(rng.integers(1, min(len(ids), 5) + 1)), replace=False)
+                index.remove([ids[k] for k in chosen.tolist()])
+                ids = [ids[k] for k in range(len(ids)) if k not in set(chosen.tolist())]
+            else:
+                #some batches of long segments, for the cells of the first one
+                size = 40 if step % 5 == 4 else 10
+                ids.extend(index.add(random_segments(rng, int(rng.integers(1, 8)), size=size)).tolist())
+
+            self.assertEqual(sorted(index.ids.tolist()), sorted(ids))
+            self.check(index)
+
+        index.remove(list(ids))
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.intersections(), [])
+        self.assertEqual((index.cells, index.oversize, index.records), ({}, set(), {}))
+
+    def test_long_segment(self):
+        #two short segments that cross at (5.0005, 5.0005)
+        index = IntersectionIndex([segment(5, 5.0005, 5.001, 5.0005), segment(5.0005, 5, 5.0005, 5.001)])
+
+        #it would cover millions of cells of the first batch
+        long = index.add([segment(0, 0, 10, 10)])
+        self.assertEqual(index.oversize, set(long.tolist()))
+        self.assertLessEqual(len(index.cells), 2 * IntersectionIndex.MAX_CELLS_PER_SEGMENT)
+        self.check(index)
+
+        #the segments added later are compared with it too
+        index.add([segment(0, 10, 10, 0), segment(1, 0, 1, 1.5)])
+        self.check(index)
+        self.assertEqual(len(index.intersections()), 3)
+
+        index.remove(long)
+        self.assertNotIn(int(long[0]), index.oversize)
+        self.check(index)
+
+    def test_rows_of_removed_segments_are_compacted(self):
+        rng = np.random.default_rng(18)
+        index = IntersectionIndex(random_segments(rng, 20), cell_size=2.0)
+        kept = index.ids[:5].tolist()
+
+        #a long running index, where every batch replaces the previous one
+        previous = index.ids[5:]
+        for _ in range(200):
+            added = index.add(random_segments(rng, 20))
+            index.remove(previous.tolist())
+            previous = added
+
+        self.assertLessEqual(len(index.rows), 4 * 64)
+        self.assertLessEqual(index.size, 2 * len(index))
+        #the ids didn't change when their rows were moved
+        self.assertTrue(all(k in index for k in kept))
+        self.assertEqual(index.ids.tolist(), kept + previous.tolist())
+        self.assertEqual(index.segments.segments.tolist(), index.rows[index.rows_of(index.ids)].tolist())
+        self.check(index)
+
+        index.remove(kept)
+        self.assertNotIn(kept[0], index)
+        self.check(index)
+        with self.assertRaises(ValueError):
+            index.remove(kept[:1])
+
+    def test_remove_unknown(self):
+        index = IntersectionIndex([segment(0, 0, 1, 1)])
+        with self.assertRaises(ValueError):
+            index.remove([3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import numpy as np
 from vector import Vector
 from segment import Segment
 from typing import List
@@ -36,25 +37,16 @@ class Poligon:
         #based on this leftmost lowest point, sort the points by the slope in ascending order
         self.vertex_set = self.convex_hull.sort_by_slope(self.starting_point, self.vertex_set)
 
-        #get the first two points
-        v1 = self.vertex_set[0]
-        v2 = self.vertex_set[1]
+        #every vertex as a row of an (N, 2) array
+        vertices = np.array([[v[0], v[1]] for v in self.vertex_set], dtype=np.float64)
 
-        print(f"type of v1: {type(v1)}")
-        directions = []
+        #direction of every vertex with respect to the segment formed by the two
+        #previous vertices, all of them computed in a single call
+        directions = Segment.batch_direction(vertices[:-2], vertices[1:-1], vertices[2:]).tolist()
 
-        for v in self.vertex_set[2:]:
-            segment = Segment(v1, v2)
-            directions.append(segment.direction(v))
-            print(directions)
-
-            v1 = v2
-            v2 = v
-
-            #if there is at least one turn which goes the opposite to the rest 
-            #then the poligon is not convex
-            if (len(directions) > 1) and self.check_directions(directions):
-                return False
+        #if there is at least one turn which goes the opposite to the rest 
+        #then the poligon is not convex
+        if self.check_directions(directions):
+            return False
 
         return True   
-         
@@ -70,6 +70,16 @@ class Segment():
             return 1
         return 0
 
+    @staticmethod
+    def batch_direction(starts: np.ndarray, ends: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """
+            Direction of points[i] with respect to the segment from starts[i] to ends[i],
+            computed for every i in a single vectorized pass (arrays of shape (N, 2)).
+            Returns an int8 array with the same values as direction.
+        """
+        det = (points[:, 0] - starts[:, 0])*(ends[:, 1] - starts[:, 1]) - (points[:, 1] - starts[:, 1])*(ends[:, 0] - starts[:, 0])
+        return np.sign(det).astype(np.int8)
+
     def segments_intersect(self, other_segment: 'Segment') -> bool:
 
         """